@@ -5,23 +5,376 @@
 TSVファイルから呼び出しツリーを生成します
 """
 
+import contextlib
 import csv
+import functools
+import importlib.util
 import io
 import json
+import os
 import re
 import sys
-from collections import defaultdict
-from typing import Dict, List, Optional, Set
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+# xlsxwriterはExcel出力時のみ必要なため、各メソッド内で遅延インポートする
+# （ツリー表示など他のサブコマンドの起動時間に影響させない）
+if TYPE_CHECKING:
+    import argparse
 
-import openpyxl
-from openpyxl.formatting.rule import FormulaRule
-from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
-from openpyxl.utils import column_index_from_string, get_column_letter
+    import xlsxwriter
 
 # Git Bash上でパイプを使うと、stdoutがCP932として扱われるのを防ぐ
 if isinstance(sys.stdout, io.TextIOWrapper):
     sys.stdout.reconfigure(encoding="utf-8")
 
+# エンドポイントのパス抽出パターン（優先順。エントリーポイントごとに使うため事前にコンパイルする）
+_PATH_PATTERNS: Tuple[re.Pattern[str], ...] = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"\w*Mapping\(\s*path\s*=\s*[\"']([^\"']+)[\"']",  # path = "/x"
+        r"\w*Mapping\(\s*value\s*=\s*[\"']([^\"']+)[\"']",  # value = "/x"
+        r"\w*Mapping\(\s*[\"']([^\"']+)[\"']",  # GetMapping("/x"), RequestMapping("/x") 等
+        r"Path\(\s*[\"']([^\"']+)[\"']",  # JAX-RS @Path
+    )
+)
+# WebLogic + JAX-WS（SOAP）のエンドポイント情報（@WLHttpTransport / @WebMethod の属性値）
+_CONTEXT_PATH_RE: re.Pattern[str] = re.compile(r"contextPath\s*=\s*[\"']([^\"']+)[\"']")
+_SERVICE_URI_RE: re.Pattern[str] = re.compile(r"serviceUri\s*=\s*[\"']([^\"']+)[\"']")
+_OPERATION_NAME_RE: re.Pattern[str] = re.compile(
+    r"operationName\s*=\s*[\"']([^\"']+)[\"']"
+)
+# ファイル名として安全でない文字（Windows）とアンダースコアの連続
+# （1つのアンダースコアに置き換えると、変換と連続するアンダースコアの集約を1回で行える）
+_UNSAFE_FILENAME_RUN_RE: re.Pattern[str] = re.compile(r'[<>:"/\\|?*_]+')
+# SQL整形用: ブロックコメント（/* ... */）と、途中で改行された FOR UPDATE
+_SQL_BLOCK_COMMENT_RE: re.Pattern[str] = re.compile(r"/\*[\s\S]*?\*/")
+_SPLIT_FOR_UPDATE_RE: re.Pattern[str] = re.compile(
+    r"\bFOR\s*\n\s*UPDATE\b", re.IGNORECASE
+)
+# SQL整形で、後続のカラム・テーブル指定を1行に1つずつ並べるキーワード
+# 注意: キーワードは長いものから先にチェックされるよう順序づける
+_SQL_CLAUSE_KEYWORDS: Tuple[str, ...] = (
+    "SELECT",
+    "FROM",
+    "WHERE",
+    "GROUP BY",
+    "ORDER BY",
+    "HAVING",
+    "SET",
+    "VALUES",
+    "LEFT OUTER JOIN",
+    "RIGHT OUTER JOIN",
+    "LEFT JOIN",
+    "RIGHT JOIN",
+    "INNER JOIN",
+    "OUTER JOIN",
+    "JOIN",
+    "FOR UPDATE",
+)
+# 行頭の "KEYWORD " / "(KEYWORD "（グループ1: 開き括弧、グループ2: キーワード）
+_SQL_CLAUSE_RE: re.Pattern[str] = re.compile(
+    r"(\()?(" + "|".join(re.escape(kw) for kw in _SQL_CLAUSE_KEYWORDS) + r") "
+)
+# 単語（英数字・アンダースコアの連続。テーブル名の検出用）
+_WORD_RE: re.Pattern[str] = re.compile(r"\w+")
+# 括弧、またはカンマとその直後のスペース（_split_by_comma_outside_parens用）
+_PAREN_OR_COMMA_RE: re.Pattern[str] = re.compile(r"[()]|, *")
+
+# CSV出力の書き込みバッファサイズ（1行ずつの小さな書き込みをまとめてファイルに書き出す）
+_CSV_WRITE_BUFFER_SIZE: int = 1 << 20
+# CSV出力でwriterowsにまとめて渡す行数
+_CSV_WRITE_BATCH_ROWS: int = 4096
+# 処理中のエントリーポイント表示を端末へ書き出す間隔（エントリーポイント数）
+_PROGRESS_FLUSH_INTERVAL: int = 100
+# --jobs指定時に、並列プロセス1つあたり同時に投入しておくツリーデータ収集タスクの数
+_PARALLEL_TASKS_PER_JOB: int = 4
+# export-csvのfeather/parquet出力で、1つのレコードバッチにまとめる行数
+_ARROW_WRITE_BATCH_ROWS: int = 65536
+
+# アノテーションからのエントリータイプ判定ルール（判定順。先に該当したルールを採用）
+# (対象, キーワード, エントリータイプ)。対象は "method"（メソッドアノテーション）/
+# "class"（クラスアノテーション）で、キーワードはアノテーション文字列の部分一致で判定する
+_ENTRY_TYPE_RULES: Tuple[Tuple[str, Tuple[str, ...], str], ...] = (
+    # テストメソッド
+    (
+        "method",
+        ("Test", "TestTemplate", "ParameterizedTest", "RepeatedTest", "TestFactory"),
+        "Test Method",
+    ),
+    # Spring Controller
+    (
+        "method",
+        (
+            "RequestMapping",
+            "GetMapping",
+            "PostMapping",
+            "PutMapping",
+            "DeleteMapping",
+            "PatchMapping",
+        ),
+        "HTTP Endpoint (Spring)",
+    ),
+    # クラスレベルのController
+    ("class", ("Controller", "RestController"), "HTTP Endpoint (Spring)"),
+    # JAX-RS REST API
+    (
+        "method",
+        ("Path", "GET", "POST", "PUT", "DELETE", "PATCH"),
+        "HTTP Endpoint (JAX-RS)",
+    ),
+    # SOAP Webサービス
+    ("method", ("WebMethod",), "SOAP Endpoint (JAX-WS)"),
+    ("class", ("WebService", "WebServiceProvider"), "SOAP Endpoint (JAX-WS)"),
+    # Scheduled Job
+    ("method", ("Scheduled", "Schedules", "Async"), "Scheduled Job"),
+    # Event Listener
+    (
+        "method",
+        (
+            "EventListener",
+            "TransactionalEventListener",
+            "JmsListener",
+            "RabbitListener",
+            "KafkaListener",
+            "StreamListener",
+            "MessageMapping",
+            "SubscribeMapping",
+        ),
+        "Event Listener",
+    ),
+    # Lifecycle
+    (
+        "method",
+        (
+            "PostConstruct",
+            "PreDestroy",
+            "BeforeAll",
+            "AfterAll",
+            "BeforeEach",
+            "AfterEach",
+            "Before",
+            "After",
+            "BeforeClass",
+            "AfterClass",
+        ),
+        "Lifecycle Method",
+    ),
+    # Bean Factory Method
+    ("method", ("Bean",), "Bean Factory"),
+    # Servlet
+    ("method", ("WebServlet",), "Servlet"),
+    ("class", ("WebServlet",), "Servlet"),
+)
+
+
+# 解析時に判定されたエントリータイプ（entryType） -> 表示用のエントリータイプ
+_ENTRY_TYPE_NAMES: Dict[str, str] = {
+    "Main": "Main Method",
+    "Test": "Test Method",
+    "HTTP": "HTTP Endpoint",
+    "SOAP": "SOAP Endpoint",
+    "Scheduled": "Scheduled Job",
+    "Event": "Event Listener",
+    "Lifecycle": "Lifecycle Method",
+    "Servlet": "Servlet",
+    "SpringBoot": "Spring Boot Runner",
+    "Thread": "Runnable/Callable",
+    "Bean": "Bean Factory",
+}
+
+# エントリータイプの優先順位（小さいほど優先度が高い。未知の種別はUnknownと同じ扱い）
+_ENTRY_PRIORITY: Dict[str, int] = {
+    "Main Method": 1,
+    "HTTP Endpoint (Spring)": 2,
+    "HTTP Endpoint (JAX-RS)": 3,
+    "SOAP Endpoint (JAX-WS)": 4,
+    "Servlet": 5,
+    "Spring Boot Runner": 6,
+    "Scheduled Job": 7,
+    "Event Listener": 8,
+    "Runnable/Callable": 9,
+    "Lifecycle Method": 10,
+    "Test Method": 11,
+    "Bean Factory": 12,
+    "Public Method": 13,
+    "Unknown": 14,
+}
+_UNKNOWN_ENTRY_PRIORITY: int = _ENTRY_PRIORITY["Unknown"]
+
+
+def _build_entry_type_scanner(target: str) -> Tuple[re.Pattern[str], Dict[str, int]]:
+    """対象（method / class）のキーワードをすべて含む選択パターンと、
+    キーワード -> ルール番号 の辞書を作る
+
+    選択肢はルール番号順に並べる（同じ位置から複数のキーワードに一致する場合、
+    判定順が先のルールのキーワードが選ばれるようにするため）。
+    """
+    rule_index: Dict[str, int] = {}
+    for i, (rule_target, keywords, _) in enumerate(_ENTRY_TYPE_RULES):
+        if rule_target == target:
+            for keyword in keywords:
+                rule_index.setdefault(keyword, i)
+    pattern = re.compile(
+        "|".join(re.escape(k) for k in sorted(rule_index, key=rule_index.__getitem__))
+    )
+    return pattern, rule_index
+
+
+_METHOD_ENTRY_TYPE_SCANNER = _build_entry_type_scanner("method")
+_CLASS_ENTRY_TYPE_SCANNER = _build_entry_type_scanner("class")
+
+
+def _first_entry_type_rule(
+    scanner: Tuple[re.Pattern[str], Dict[str, int]], text: str, limit: int
+) -> int:
+    """text中のキーワードに該当するルールのうち、判定順が最も先のルール番号を返す
+
+    キーワードを1つずつ部分一致で調べる代わりに、選択パターンで文字列を走査する。
+    あるキーワードの一致範囲内から始まる別のキーワードも拾えるよう、次の検索は
+    一致の開始位置の次の文字から行う。limit以降のルールしか該当しない場合はlimitを返す。
+    """
+    pattern, rule_index = scanner
+    search = pattern.search
+    best = limit
+    m = search(text)
+    while m:
+        i = rule_index[m.group()]
+        if i < best:
+            best = i
+            if i == 0:
+                break
+        m = search(text, m.start() + 1)
+    return best
+
+
+@contextlib.contextmanager
+def _stdout_without_line_buffering() -> Iterator[None]:
+    """
+    withブロックの間だけ標準出力の行バッファリングを無効にする
+
+    端末への出力を1行ごとにフラッシュせず、バッファが一杯になったときや明示的に
+    フラッシュしたときにまとめて書き出す。ブロックを抜けると元の設定に戻す。
+    """
+    stdout = sys.stdout
+    if not isinstance(stdout, io.TextIOWrapper) or not stdout.line_buffering:
+        yield
+        return
+
+    stdout.reconfigure(line_buffering=False)
+    try:
+        yield
+    finally:
+        stdout.reconfigure(line_buffering=True)
+
+
+def _read_json_file(file_path: str):
+    """JSONファイルを読み込む
+
+    orjsonがインストールされていればそれを使い（バイト列のまま高速に解析できる）、
+    なければ標準のjsonモジュールで読み込む。
+    """
+    try:
+        import orjson
+    except ImportError:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    with open(file_path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _write_arrow_file(
+    output_file: str,
+    output_format: str,
+    headers: List[str],
+    int_columns: Set[str],
+    rows: Iterable[list],
+) -> bool:
+    """行データをfeather（Arrow IPC）またはparquet形式のファイルに書き込む
+
+    行は_ARROW_WRITE_BATCH_ROWS行ごとにレコードバッチにまとめて順に書き込む
+    （全行をメモリ上の表にまとめない）。int_columnsに含まれる列は整数、
+    それ以外の列は文字列として書き込む。
+
+    Returns:
+        書き込めた場合はTrue（pyarrowがインストールされていない場合、
+        ファイルを開けない場合はFalse）
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        print(
+            f"エラー: pyarrowがインストールされていません。{output_format}形式で出力できません。",
+            file=sys.stderr,
+        )
+        print("  インストール: pip install pyarrow", file=sys.stderr)
+        return False
+
+    schema = pa.schema(
+        [(h, pa.int64() if h in int_columns else pa.string()) for h in headers]
+    )
+    try:
+        if output_format == "parquet":
+            import pyarrow.parquet as pq
+
+            writer = pq.ParquetWriter(output_file, schema)
+        else:
+            writer = pa.ipc.new_file(output_file, schema)
+    except OSError as e:
+        print(f"エラー: ファイルを開けません: {e}", file=sys.stderr)
+        return False
+
+    def write_batch(batch: List[list]) -> None:
+        columns = [
+            pa.array(values, type=field.type)
+            for values, field in zip(zip(*batch), schema)
+        ]
+        writer.write_batch(pa.RecordBatch.from_arrays(columns, schema=schema))
+
+    with writer:
+        batch: List[list] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= _ARROW_WRITE_BATCH_ROWS:
+                write_batch(batch)
+                batch.clear()
+        if batch:
+            write_batch(batch)
+    return True
+
+
+def _list_sql_files(sql_dir: str) -> List[os.DirEntry]:
+    """ディレクトリ直下の *.sql ファイルをファイル名順に列挙する
+
+    Path.globのようにエントリごとにPathオブジェクトを作らず、os.scandirの結果を
+    そのまま使う（ファイル名の比較はOSの大文字小文字の扱いに合わせる）。
+    ディレクトリを読めない場合は空のリストを返す。
+    """
+    try:
+        with os.scandir(sql_dir) as it:
+            entries = [e for e in it if os.path.normcase(e.name).endswith(".sql")]
+    except OSError:
+        return []
+    entries.sort(key=lambda e: os.path.normcase(e.name))
+    return entries
+
 
 class ExclusionRuleManager:
     """除外ルールを管理するクラス
@@ -32,6 +385,18 @@ class ExclusionRuleManager:
       例: org.springframework.* → org.springframework.で始まるすべてのクラス/メソッドを除外
     """
 
+    # 判定処理でインスタンス属性を頻繁に参照するため、属性を固定して__dict__を持たせない
+    __slots__ = (
+        "include_exclusions",
+        "include_exclusion_prefixes",
+        "exclude_children",
+        "exclude_children_prefixes",
+        "_any_include",
+        "_any_exclude",
+        "_include_results",
+        "_exclude_results",
+    )
+
     def __init__(self, exclusion_file: Optional[str] = None):
         """
         コンストラクタ
@@ -47,13 +412,19 @@ class ExclusionRuleManager:
         self.exclude_children: Set[str] = set()  # 完全一致ルール
         self.exclude_children_prefixes: Set[str] = set()  # 前方一致ルール
 
+        # ルールが1件でもあるか（ルールなしの場合は判定を即座に返す）
+        self._any_include: bool = False
+        self._any_exclude: bool = False
+
+        # 判定結果をメモ化（ツリーの各所に同じメソッドが現れるため。ルール読み込み時にクリア）
+        self._include_results: Dict[str, bool] = {}
+        self._exclude_results: Dict[str, bool] = {}
+
         # デフォルトファイル名
         if exclusion_file is None:
             exclusion_file = "exclusion_rules.txt"
 
         # ファイルが存在する場合のみ読み込む
-        import os
-
         if os.path.exists(exclusion_file):
             self.load_rules(exclusion_file)
 
@@ -134,6 +505,15 @@ class ExclusionRuleManager:
         except Exception as e:
             print(f"除外ルールファイルの読み込みに失敗しました: {e}", file=sys.stderr)
 
+        self._any_include = bool(
+            self.include_exclusions or self.include_exclusion_prefixes
+        )
+        self._any_exclude = bool(
+            self.exclude_children or self.exclude_children_prefixes
+        )
+        self._include_results.clear()
+        self._exclude_results.clear()
+
     def _matches_prefix(self, target: str, prefixes: Set[str]) -> bool:
         """
         対象が前方一致ルールのいずれかにマッチするかチェック
@@ -151,6 +531,30 @@ class ExclusionRuleManager:
                 return True
         return False
 
+    def _matches_rules(
+        self, method_or_class: str, exact_rules: Set[str], prefixes: Set[str]
+    ) -> bool:
+        """
+        メソッド/クラスが完全一致ルール・前方一致ルールのいずれかにマッチするかチェック
+
+        Args:
+            method_or_class: メソッドシグネチャまたはクラス名
+            exact_rules: 完全一致ルールのセット
+            prefixes: 前方一致用プレフィックスのセット
+
+        Returns:
+            True: いずれかのルールにマッチする
+            False: どのルールにもマッチしない
+        """
+        # 完全一致チェック: シグネチャ全体・クラス名・メソッド部分のいずれかが対象か
+        # （メソッド部分は完全一致のみ。isdisjointで3つをまとめて判定する）
+        if not exact_rules.isdisjoint(self._split_signature(method_or_class)):
+            return True
+
+        # 前方一致チェック: クラス名はシグネチャの先頭部分なので、
+        # シグネチャ全体のチェックでクラス名の前方一致も判定できる
+        return self._matches_prefix(method_or_class, prefixes)
+
     def should_include(self, method_or_class: str) -> bool:
         """
         メソッド/クラスがIモード（対象自体を除外）の対象かチェック
@@ -162,32 +566,17 @@ class ExclusionRuleManager:
             True: 表示すべき（除外対象ではない）
             False: 除外すべき（除外対象）
         """
-        # 完全一致チェック: メソッドシグネチャ全体が除外対象か
-        if method_or_class in self.include_exclusions:
-            return False
-
-        # 前方一致チェック: メソッドシグネチャ全体がプレフィックスにマッチするか
-        if self._matches_prefix(method_or_class, self.include_exclusion_prefixes):
-            return False
+        if not self._any_include:
+            return True
 
-        # クラス名を抽出して除外対象かチェック
-        class_name = self._extract_class_name(method_or_class)
-        if class_name:
-            # 完全一致チェック
-            if class_name in self.include_exclusions:
-                return False
-            # 前方一致チェック
-            if self._matches_prefix(class_name, self.include_exclusion_prefixes):
-                return False
-
-        # クラス名を除くメソッド部分のみを抽出して除外対象かチェック
-        method_part = self._extract_method_part(method_or_class)
-        if method_part:
-            # 完全一致チェック（メソッド部分は完全一致のみ）
-            if method_part in self.include_exclusions:
-                return False
-
-        return True
+        result = self._include_results.get(method_or_class)
+        if result is None:
+            result = self._include_results[method_or_class] = not self._matches_rules(
+                method_or_class,
+                self.include_exclusions,
+                self.include_exclusion_prefixes,
+            )
+        return result
 
     def should_exclude_children(self, method_or_class: str) -> bool:
         """
@@ -200,67 +589,114 @@ class ExclusionRuleManager:
             True: 配下を除外すべき
             False: 配下も展開すべき
         """
-        # 完全一致チェック: メソッドシグネチャ全体が除外対象か
-        if method_or_class in self.exclude_children:
-            return True
-
-        # 前方一致チェック: メソッドシグネチャ全体がプレフィックスにマッチするか
-        if self._matches_prefix(method_or_class, self.exclude_children_prefixes):
-            return True
-
-        # クラス名を抽出して除外対象かチェック
-        class_name = self._extract_class_name(method_or_class)
-        if class_name:
-            # 完全一致チェック
-            if class_name in self.exclude_children:
-                return True
-            # 前方一致チェック
-            if self._matches_prefix(class_name, self.exclude_children_prefixes):
-                return True
-
-        # クラス名を除くメソッド部分のみを抽出して除外対象かチェック
-        method_part = self._extract_method_part(method_or_class)
-        if method_part:
-            # 完全一致チェック（メソッド部分は完全一致のみ）
-            if method_part in self.exclude_children:
-                return True
+        if not self._any_exclude:
+            return False
 
-        return False
+        result = self._exclude_results.get(method_or_class)
+        if result is None:
+            result = self._exclude_results[method_or_class] = self._matches_rules(
+                method_or_class, self.exclude_children, self.exclude_children_prefixes
+            )
+        return result
 
-    def _extract_class_name(self, method_signature: str) -> Optional[str]:
+    def _split_signature(self, method_signature: str) -> Tuple[str, ...]:
         """
-        メソッドシグネチャからクラス名を抽出
+        メソッドシグネチャを判定対象の文字列に分解（"#"での分割は1回のみ）
 
         Args:
             method_signature: メソッドシグネチャ (例: "com.example.Class#method()")
 
         Returns:
-            クラス名 (例: "com.example.Class")、抽出できない場合はNone
+            (シグネチャ全体, クラス名, メソッド部分) のタプル
+            (例: ("com.example.Class#method()", "com.example.Class", "method()"))
+            "#"を含まない場合や空の要素は含めない
         """
-        if "#" in method_signature:
-            return method_signature.split("#")[0]
-        return None
+        class_name, sep, method_part = method_signature.partition("#")
+        if not sep:
+            return (method_signature,)
+        return tuple(p for p in (method_signature, class_name, method_part) if p)
 
-    def _extract_method_part(self, method_signature: str) -> Optional[str]:
-        """
-        メソッドシグネチャからクラスを除去したメソッド部分のみを抽出
 
-        Args:
-            method_signature: メソッドシグネチャ (例: "com.example.Class#method()")
+class _IndentCache(dict):
+    """深さ -> インデント文字列 のキャッシュ
 
-        Returns:
-            クラスを除去したメソッド部分 (例: "method()")、抽出できない場合はNone
-        """
-        if "#" in method_signature:
-            method_part = method_signature.split("#")[1]
-            # # 引数部分を除去
-            # if "(" in method_part:
-            #     return method_part.split("(")[0]
-            return method_part
-        return None
+    ツリー出力で行ごとに "    " * depth を生成し直さないよう、
+    初めて参照された深さの文字列だけを作成して保持する。
+    suffixを指定した場合はインデントの後ろに連結した文字列を保持する（"|-- " 等）。
+    """
+
+    def __init__(self, unit: str, suffix: str = ""):
+        super().__init__()
+        self.unit = unit
+        self.suffix = suffix
+
+    def __missing__(self, depth: int) -> str:
+        indent = self[depth] = self.unit * depth + self.suffix
+        return indent
+
+
+# テーブル検出用の1テーブル分の情報（_build_table_matchersの結果の要素）
+_TableMatcher = Tuple[
+    Tuple[str, str, str], str, Optional[re.Pattern[str]], Optional[re.Pattern[str]]
+]
+
+
+class CallEdge(NamedTuple):
+    """呼び出し関係（呼び出し元 -> 呼び出し先）の1エッジ"""
+
+    method: str  # 呼び出し先メソッド
+    is_parent_method: str  # 呼び出し先は親クラスのメソッドか（"Yes" / "No"）
+    implementations: str  # 実装クラス候補（カンマ区切り）
 
 
 class CallTreeVisualizer:
+    # ツリー走査中にインスタンス属性を頻繁に参照するため、属性を固定して__dict__を持たせない
+    # （属性を追加する場合はここにも追加すること）
+    __slots__ = (
+        "input_file",
+        "exclusion_file",
+        "forward_calls",
+        "reverse_calls",
+        "method_info",
+        "class_info",
+        "class_data",
+        "interface_data",
+        "_class_annotations_cache",
+        "_class_annotation_raws_cache",
+        "_class_javadoc_cache",
+        "_fwd_methods",
+        "_fwd_is_parent",
+        "_fwd_impls",
+        "_fwd_impl_entries",
+        "_fwd_impl_classes",
+        "_all_callees",
+        "_mi_class",
+        "_mi_parent",
+        "_mi_javadoc",
+        "_mi_sql",
+        "_mi_sql_statements",
+        "_mi_created_instances",
+        "_impl_method_index",
+        "_methods_by_class",
+        "_impl_method_cache",
+        "_parent_methods_cache",
+        "_created_instances_cache",
+        "_short_signature_cache",
+        "_signature_parts_cache",
+        "_method_names_lower",
+        "_entry_points_cache",
+        "_entry_type_cache",
+        "_annotation_entry_type_cache",
+        "_class_endpoint_cache",
+        "exclusion_manager",
+        "output_tsv_encoding",
+        "debug_mode",
+        "_tab_indents",
+        "_space_indents",
+        "_space_node_heads",
+        "_tab_detail_indents",
+    )
+
     def __init__(
         self,
         input_file: str,
@@ -278,7 +714,9 @@ class CallTreeVisualizer:
             debug_mode: デバッグモード（Trueの場合、インスタンス収集情報を出力）
         """
         self.input_file: str = input_file
-        self.forward_calls: Dict[str, List[Dict[str, str]]] = defaultdict(list)
+        # 並列処理のワーカープロセスで同じ条件のVisualizerを構築するために保持
+        self.exclusion_file: Optional[str] = exclusion_file
+        self.forward_calls: Dict[str, List[CallEdge]] = defaultdict(list)
         self.reverse_calls: Dict[str, List[str]] = defaultdict(list)
         self.method_info: Dict[str, Dict[str, Optional[str]]] = {}
         self.class_info: Dict[str, List[str]] = {}
@@ -289,11 +727,65 @@ class CallTreeVisualizer:
         self.interface_data: Dict[str, Dict] = (
             {}
         )  # interfaceName -> {annotations, javadoc, superInterfaces}
+        # 型階層を辿った結果のキャッシュ（アノテーションは初回参照時にクラスごとに計算、
+        # Javadocは読み込み後に構築。いずれも以降は不変）
+        self._class_annotations_cache: Dict[str, Tuple[str, ...]] = {}
+        self._class_annotation_raws_cache: Dict[str, Tuple[str, ...]] = {}
+        self._class_javadoc_cache: Dict[str, str] = {}
+        # 呼び出し関係の列指向表現（呼び出し元 -> 呼び出し先ごとの各フィールドのタプル）
+        self._fwd_methods: Dict[str, Tuple[str, ...]] = {}
+        self._fwd_is_parent: Dict[str, Tuple[bool, ...]] = {}
+        self._fwd_impls: Dict[str, Tuple[str, ...]] = {}
+        # implementationsを読み込み時に分割した結果（要素 / クラス名部分）
+        self._fwd_impl_entries: Dict[str, Tuple[Tuple[str, ...], ...]] = {}
+        self._fwd_impl_classes: Dict[str, Tuple[Tuple[str, ...], ...]] = {}
+        # いずれかのメソッドから呼ばれているメソッドの集合（エントリーポイント判定用）
+        self._all_callees: FrozenSet[str] = frozenset()
+        # ツリー表示で参照するmethod_infoの項目の列指向表現（メソッド -> 値）
+        self._mi_class: Dict[str, str] = {}
+        self._mi_parent: Dict[str, str] = {}
+        self._mi_javadoc: Dict[str, str] = {}
+        self._mi_sql: Dict[str, str] = {}
+        # SQL文（" ||| " 区切り）を個々の文に分割した結果（SQL抽出用）
+        self._mi_sql_statements: Dict[str, Tuple[str, ...]] = {}
+        self._mi_created_instances: Dict[str, List[str]] = {}
+        # (クラス名, メソッド部分) -> メソッドシグネチャ（実装メソッド検索用）
+        self._impl_method_index: Dict[Tuple[str, str], str] = {}
+        # クラス名 -> [(メソッドシグネチャ, メソッド部分), ...]（親メソッド検索用）
+        self._methods_by_class: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        # 実装メソッド・親メソッドの検索結果（読み込み後はmethod_info等が不変のため再利用できる）
+        self._impl_method_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        self._parent_methods_cache: Dict[str, Tuple[str, ...]] = {}
+        # メソッドごとの生成インスタンス（_collect_created_instancesの結果）
+        self._created_instances_cache: Dict[str, FrozenSet[str]] = {}
+        # メソッドシグネチャ -> パッケージ名を省いた表示用シグネチャ
+        self._short_signature_cache: Dict[str, str] = {}
+        # メソッドシグネチャ -> 分解結果（_extract_method_signature_partsの結果）
+        self._signature_parts_cache: Dict[str, Dict[str, str]] = {}
+        # (メソッドシグネチャ, 小文字化したシグネチャ)（メソッド検索用。初回の検索時に作成）
+        self._method_names_lower: Optional[Tuple[Tuple[str, str], ...]] = None
+        # (min_calls, strict) -> エントリーポイント候補（_build_entry_pointsの結果）
+        self._entry_points_cache: Dict[
+            Tuple[int, bool], List[Tuple[str, int, str, str, str, str, str, str]]
+        ] = {}
+        # メソッド -> エントリータイプ（_determine_entry_typeの結果）と、
+        # メソッド -> アノテーション等から判定したエントリータイプ（親メソッドの判定用）
+        self._entry_type_cache: Dict[str, str] = {}
+        self._annotation_entry_type_cache: Dict[str, str] = {}
+        # クラス名 -> (基本パス, contextPath, serviceUri)（_get_class_endpoint_partsの結果）
+        self._class_endpoint_cache: Dict[str, Tuple[str, str, str]] = {}
         self.exclusion_manager: ExclusionRuleManager = ExclusionRuleManager(
             exclusion_file
         )
         self.output_tsv_encoding: str = output_tsv_encoding
         self.debug_mode: bool = debug_mode
+        # インデント文字列のキャッシュ（ハードタブ / スペース4つ）
+        self._tab_indents: _IndentCache = _IndentCache("\t")
+        self._space_indents: _IndentCache = _IndentCache("    ")
+        # ノード行の先頭（スペースインデント + "|-- "）と、
+        # ハードタブ時の詳細行（〓クラス等）のインデント（タブ + スペース4つ）
+        self._space_node_heads: _IndentCache = _IndentCache("    ", "|-- ")
+        self._tab_detail_indents: _IndentCache = _IndentCache("\t", "    ")
         self.load_data()
 
     def load_data(self):
@@ -302,20 +794,123 @@ class CallTreeVisualizer:
             self._load_json_data()
         else:
             self._load_tsv_data()
+        self._build_class_caches()
+        self._build_call_arrays()
+        self._build_method_index()
+        self._build_method_columns()
+
+    def _build_method_columns(self):
+        """ツリー表示で参照するmethod_infoの項目を列ごとの辞書に展開する
+
+        ノード表示では1メソッドあたりclass / parent / javadoc / sqlのうち数項目しか
+        参照しないため、メソッドごとの辞書ではなく項目ごとの辞書から直接引く。
+        親メソッド検索・生成インスタンス収集（parent / createdInstances）も同様。
+        値が空の項目は格納しない（参照側は空文字列として扱う）。
+        """
+        for method_sig, info in self.method_info.items():
+            if info.get("class"):
+                self._mi_class[method_sig] = info["class"]
+            if info.get("parent"):
+                self._mi_parent[method_sig] = info["parent"]
+            if info.get("javadoc"):
+                self._mi_javadoc[method_sig] = info["javadoc"]
+            sql = info.get("sql")
+            if sql:
+                self._mi_sql[method_sig] = sql
+                if sql.strip():
+                    # SQL文を分割 (複数ある場合は " ||| " で連結されている)
+                    self._mi_sql_statements[method_sig] = tuple(
+                        s.strip() for s in sql.split(" ||| ") if s.strip()
+                    )
+            if info.get("createdInstances"):
+                self._mi_created_instances[method_sig] = info["createdInstances"]
+
+    def _build_method_index(self):
+        """クラス単位でメソッドシグネチャを引く索引を作成する
+
+        実装メソッド・親メソッドの検索のたびにmethod_info全体を走査しないよう、
+        読み込み後に一度だけ作る。
+        - _impl_method_index: (クラス名, メソッド名+引数) -> メソッドシグネチャ
+          同じキーが複数ある場合はmethod_infoで先に現れたものを採用する（従来の走査順と同じ）。
+        - _methods_by_class: クラス名 -> (メソッドシグネチャ, メソッド名+引数) のリスト
+          method_infoの順序を保つ。
+        """
+        index = self._impl_method_index
+        by_class = self._methods_by_class
+        for method_sig, info in self.method_info.items():
+            _, sep, method_part = method_sig.partition("#")
+            if sep:
+                class_name = info.get("class")
+                index.setdefault((class_name, method_part), method_sig)
+                by_class[class_name].append((method_sig, method_part))
+
+    def _build_call_arrays(self):
+        """forward_callsを呼び出し元ごとの並列タプル（列指向）に展開する
+
+        ツリー走査では呼び出し先ごとに method / is_parent_method / implementations を
+        順に参照するため、エッジごとの辞書を引かずに済むようフィールド別に保持する。
+        あわせて呼び出し先メソッド全体の集合も作っておく（エントリーポイント判定で共有）。
+        """
+        for caller, callees in self.forward_calls.items():
+            self._fwd_methods[caller] = tuple(c.method for c in callees)
+            self._fwd_is_parent[caller] = tuple(
+                c.is_parent_method == "Yes" for c in callees
+            )
+            self._fwd_impls[caller] = tuple(c.implementations for c in callees)
+            # implementationsは「<クラス名> [<追加情報>]」のカンマ区切りなので、
+            # 訪問のたびに分割しないよう要素とクラス名部分を先に分けておく
+            entries = tuple(
+                self._split_implementations(c.implementations) for c in callees
+            )
+            self._fwd_impl_entries[caller] = entries
+            self._fwd_impl_classes[caller] = tuple(
+                tuple(sys.intern(impl.split(" ")[0]) for impl in impls)
+                for impls in entries
+            )
+        self._all_callees = frozenset(
+            callee for callees in self._fwd_methods.values() for callee in callees
+        )
+
+    def _split_implementations(self, implementations: str) -> Tuple[str, ...]:
+        """実装クラス候補のカンマ区切り文字列を、前後の空白を除いた要素のタプルに分割"""
+        if not implementations:
+            return ()
+        return tuple(
+            impl.strip() for impl in implementations.split(",") if impl.strip()
+        )
+
+    def _build_class_caches(self):
+        """クラス・インターフェースごとのJavadocを事前計算する
+
+        型階層を辿るアノテーションは、使うサブコマンドが限られるため事前計算せず、
+        初回参照時にクラスごとに計算してキャッシュする（_get_all_class_annotations等）。
+        """
+        # クラスのJavadocを優先する
+        self._class_javadoc_cache = {
+            name: data.get("javadoc", "") for name, data in self.interface_data.items()
+        }
+        self._class_javadoc_cache.update(
+            (name, data.get("javadoc", "")) for name, data in self.class_data.items()
+        )
 
     def _load_json_data(self):
         """JSON形式（統合形式）からデータを読み込む"""
-        with open(self.input_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json_file(self.input_file)
+
+        # メソッドシグネチャ・クラス名は各所で辞書キーやセット要素として繰り返し使うため、
+        # sys.internで同一文字列を1つのオブジェクトに共有する
+        intern = sys.intern
 
         methods = data.get("methods", [])
         for method in methods:
             method_sig = method.get("method", "")
             if not method_sig:
                 continue
+            method_sig = intern(method_sig)
 
-            class_name = method.get("class", "")
+            class_name = intern(method.get("class", ""))
             parent_classes_str = method.get("parentClasses", "")
+            http_calls = method.get("httpCalls", [])
 
             # メソッド情報を保存
             self.method_info[method_sig] = {
@@ -334,7 +929,13 @@ class CallTreeVisualizer:
                 "createdInstances": method.get(
                     "createdInstances", []
                 ),  # 生成されたインスタンス
-                "httpCalls": method.get("httpCalls", []),  # HTTPクライアント呼び出し
+                "httpCalls": http_calls,  # HTTPクライアント呼び出し
+                # HTTPリクエストの表示文字列（Excel出力用。ノードごとに組み立てない）
+                "http_details": ", ".join(
+                    f"{call.get('httpMethod', 'UNKNOWN')} - "
+                    f"{call.get('uri', '${UNRESOLVED}')}"
+                    for call in http_calls
+                ),
                 "parameterAnnotations": method.get(
                     "parameterAnnotations", ""
                 ),  # 引数アノテーション
@@ -343,7 +944,9 @@ class CallTreeVisualizer:
             # クラス階層情報を保存（parentClassesから取得した全親クラス・インターフェース）
             if class_name and parent_classes_str:
                 parents = [
-                    p.strip() for p in parent_classes_str.split(",") if p.strip()
+                    intern(p.strip())
+                    for p in parent_classes_str.split(",")
+                    if p.strip()
                 ]
                 # 既存の情報がない場合、または新しい情報がある場合は更新
                 if class_name not in self.class_info or not self.class_info[class_name]:
@@ -367,36 +970,28 @@ class CallTreeVisualizer:
                         )
                         impls = call_item.get("implementations", "")
                         self.forward_calls[method_sig].append(
-                            {
-                                "method": callee,
-                                "is_parent_method": is_parent,
-                                "implementations": impls,
-                            }
+                            CallEdge(intern(callee), is_parent, impls)
                         )
                 else:
                     # 後方互換性：文字列配列
                     self.forward_calls[method_sig].append(
-                        {
-                            "method": call_item,
-                            "is_parent_method": "No",
-                            "implementations": "",
-                        }
+                        CallEdge(intern(call_item), "No", "")
                     )
 
             # 逆引き呼び出し関係を保存
             for caller in method.get("calledBy", []):
-                self.reverse_calls[method_sig].append(caller)
+                self.reverse_calls[method_sig].append(intern(caller))
 
         # classesセクションを読み込み
         classes = data.get("classes", [])
         for cls in classes:
             class_name = cls.get("className", "")
             if class_name:
-                self.class_data[class_name] = {
+                self.class_data[intern(class_name)] = {
                     "annotations": cls.get("annotations", []),
                     "annotationRaws": cls.get("annotationRaws", []),
                     "javadoc": cls.get("javadoc", ""),
-                    "superClass": cls.get("superClass", ""),
+                    "superClass": intern(cls.get("superClass", "")),
                     "directInterfaces": cls.get("directInterfaces", []),
                     "allInterfaces": cls.get("allInterfaces", []),
                     "fieldInitializers": cls.get(
@@ -409,124 +1004,158 @@ class CallTreeVisualizer:
         for iface in interfaces:
             iface_name = iface.get("interfaceName", "")
             if iface_name:
-                self.interface_data[iface_name] = {
+                self.interface_data[intern(iface_name)] = {
                     "annotations": iface.get("annotations", []),
                     "annotationRaws": iface.get("annotationRaws", []),
                     "javadoc": iface.get("javadoc", ""),
                     "superInterfaces": iface.get("superInterfaces", []),
                 }
 
-    def _get_all_class_annotations(self, class_name: str) -> List[str]:
-        """クラスとその親クラス・インターフェースのすべてのアノテーションを再帰的に取得"""
-        if not class_name:
-            return []
+    def _get_all_class_annotations(self, class_name: str) -> Tuple[str, ...]:
+        """クラスとその親クラス・インターフェースのすべてのアノテーションを取得
 
-        all_annotations: List[str] = []
-        visited: Set[str] = set()
-        self._collect_annotations_recursive(class_name, all_annotations, visited)
-        return all_annotations
+        結果はクラスごとにキャッシュする（共有されるため不変のタプルで返す）
+        """
+        cached = self._class_annotations_cache.get(class_name)
+        if cached is not None:
+            return cached
 
-    def _collect_annotations_recursive(
-        self, type_name: str, all_annotations: List[str], visited: Set[str]
-    ) -> None:
-        """アノテーションを再帰的に収集"""
-        if not type_name or type_name in visited:
-            return
-        visited.add(type_name)
-
-        # クラスとして検索
-        if type_name in self.class_data:
-            cls = self.class_data[type_name]
-            for ann in cls.get("annotations", []):
-                if ann not in all_annotations:
-                    all_annotations.append(ann)
-            # 親クラスを辿る
-            super_class = cls.get("superClass", "")
-            if super_class:
-                self._collect_annotations_recursive(
-                    super_class, all_annotations, visited
-                )
-            # インターフェースを辿る
-            for iface in cls.get("directInterfaces", []):
-                self._collect_annotations_recursive(iface, all_annotations, visited)
-
-        # インターフェースとして検索
-        if type_name in self.interface_data:
-            iface = self.interface_data[type_name]
-            for ann in iface.get("annotations", []):
-                if ann not in all_annotations:
-                    all_annotations.append(ann)
-            # 親インターフェースを辿る
-            for super_iface in iface.get("superInterfaces", []):
-                self._collect_annotations_recursive(
-                    super_iface, all_annotations, visited
-                )
+        result = self._class_annotations_cache[class_name] = (
+            self._collect_hierarchy_annotations(class_name, "annotations")
+        )
+        return result
 
     def _get_class_javadoc(self, class_name: str) -> str:
         """クラスのJavadocを取得（なければ空文字）"""
-        if class_name in self.class_data:
-            return self.class_data[class_name].get("javadoc", "")
-        if class_name in self.interface_data:
-            return self.interface_data[class_name].get("javadoc", "")
-        return ""
+        return self._class_javadoc_cache.get(class_name, "")
+
+    def _get_all_class_annotation_raws(self, class_name: str) -> Tuple[str, ...]:
+        """クラスとその親クラス・インターフェースのフル形式アノテーションを取得
+
+        エンドポイントパス抽出用にannotationRaws（@RequestMapping(path = "/bill")形式）を返す。
+        結果はクラスごとにキャッシュする（共有されるため不変のタプルで返す）
+        """
+        cached = self._class_annotation_raws_cache.get(class_name)
+        if cached is not None:
+            return cached
+
+        result = self._class_annotation_raws_cache[class_name] = (
+            self._collect_hierarchy_annotations(class_name, "annotationRaws")
+        )
+        return result
 
-    def _get_all_class_annotation_raws(self, class_name: str) -> List[str]:
-        """クラスとその親クラス・インターフェースのフル形式アノテーションを再帰的に取得
+    def _collect_hierarchy_annotations(
+        self, class_name: str, key: str
+    ) -> Tuple[str, ...]:
+        """型階層（親クラス・インターフェース）を辿ってアノテーションを収集
 
-        エンドポイントパス抽出用にannotationRaws（@RequestMapping(path = "/bill")形式）を返す
+        再帰の代わりにdequeを作業リストとして使う。子を逆順に積んで末尾から取り出すことで、
+        自身 → 親クラス → インターフェース → 親インターフェースの深さ優先順を保つ。
+
+        Args:
+            class_name: 起点のクラス名
+            key: 収集するキー（"annotations" または "annotationRaws"）
         """
         if not class_name:
-            return []
+            return ()
+
+        # 挿入順を保持する辞書を順序付き集合として使う（重複判定をO(1)にする）
+        all_annotations: Dict[str, None] = {}
 
-        all_annotations: List[str] = []
         visited: Set[str] = set()
-        self._collect_annotation_raws_recursive(class_name, all_annotations, visited)
-        return all_annotations
+        worklist = deque([class_name])
+        while worklist:
+            type_name = worklist.pop()
+            if not type_name or type_name in visited:
+                continue
+            visited.add(type_name)
 
-    def _collect_annotation_raws_recursive(
-        self, type_name: str, all_annotations: List[str], visited: Set[str]
-    ) -> None:
-        """フル形式アノテーションを再帰的に収集"""
-        if not type_name or type_name in visited:
-            return
-        visited.add(type_name)
-
-        # クラスとして検索
-        if type_name in self.class_data:
-            cls = self.class_data[type_name]
-            for ann in cls.get("annotationRaws", []):
-                if ann not in all_annotations:
-                    all_annotations.append(ann)
-            # 親クラスを辿る
-            super_class = cls.get("superClass", "")
-            if super_class:
-                self._collect_annotation_raws_recursive(
-                    super_class, all_annotations, visited
-                )
-            # インターフェースを辿る
-            for iface in cls.get("directInterfaces", []):
-                self._collect_annotation_raws_recursive(iface, all_annotations, visited)
-
-        # インターフェースとして検索
-        if type_name in self.interface_data:
-            iface = self.interface_data[type_name]
-            for ann in iface.get("annotationRaws", []):
-                if ann not in all_annotations:
-                    all_annotations.append(ann)
-            # 親インターフェースを辿る
-            for super_iface in iface.get("superInterfaces", []):
-                self._collect_annotation_raws_recursive(
-                    super_iface, all_annotations, visited
-                )
+            parents: List[str] = []
+            # クラスとして検索
+            if type_name in self.class_data:
+                cls = self.class_data[type_name]
+                all_annotations.update(dict.fromkeys(cls.get(key, [])))
+                # 親クラス → インターフェースの順に辿る
+                parents.append(cls.get("superClass", ""))
+                parents.extend(cls.get("directInterfaces", []))
+
+            # インターフェースとして検索
+            if type_name in self.interface_data:
+                iface = self.interface_data[type_name]
+                all_annotations.update(dict.fromkeys(iface.get(key, [])))
+                # 親インターフェースを辿る
+                parents.extend(iface.get("superInterfaces", []))
+
+            worklist.extend(reversed(parents))
+
+        return tuple(all_annotations)
 
     def _load_tsv_data(self):
         """TSV形式からデータを読み込む（後方互換性）"""
         with open(self.input_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter="\t")
+            # DictReaderは行ごとに辞書を作るため、ヘッダから列番号を引いて行(list)を直接参照する
+            reader = csv.reader(f, delimiter="\t")
+            header = next(reader, [])
+            width = len(header)
+            col = {name: idx for idx, name in enumerate(header)}
+
+            # 空ファイル（ヘッダなし）の場合は何も読み込まない
+            if not header:
+                return
+            # 必須列が欠けている場合はエラーを表示して読み込まない
+            missing = [
+                name
+                for name in (
+                    "呼び出し元メソッド",
+                    "呼び出し先メソッド",
+                    "方向",
+                    "呼び出し元クラス",
+                    "呼び出し元の親クラス",
+                    "呼び出し先クラス",
+                    "呼び出し先は親クラスのメソッド",
+                    "呼び出し先の実装クラス候補",
+                )
+                if name not in col
+            ]
+            if missing:
+                print(
+                    f"エラー: TSVのヘッダに必須列がありません: {', '.join(missing)}",
+                    file=sys.stderr,
+                )
+                return
+
+            # 必須列
+            i_caller = col["呼び出し元メソッド"]
+            i_callee = col["呼び出し先メソッド"]
+            i_direction = col["方向"]
+            i_caller_class = col["呼び出し元クラス"]
+            i_caller_parent = col["呼び出し元の親クラス"]
+            i_callee_class = col["呼び出し先クラス"]
+            i_is_parent = col["呼び出し先は親クラスのメソッド"]
+            i_impls = col["呼び出し先の実装クラス候補"]
+            # 任意列: ヘッダにない場合は行末に足す空文字列（番兵）の位置を参照する
+            i_visibility = col.get("可視性", width)
+            i_static = col.get("Static", width)
+            i_entry_point = col.get("エントリーポイント候補", width)
+            i_entry_type = col.get("エントリータイプ", width)
+            i_annotations = col.get("アノテーション", width)
+            i_class_annotations = col.get("クラスアノテーション", width)
+            i_sql = col.get("SQL文", width)
+            i_javadoc = col.get("メソッドJavadoc", width)
+            i_callee_parent = col.get("呼び出し先の親クラス", width)
+
+            # メソッドシグネチャ・クラス名はsys.internで共有する（_load_json_dataと同様）
+            intern = sys.intern
             for row in reader:
-                caller = row["呼び出し元メソッド"]
-                callee = row["呼び出し先メソッド"]
-                direction = row["方向"]
+                if not row:
+                    continue
+                # 列が足りない行と番兵の分を空文字列で埋める
+                if len(row) <= width:
+                    row.extend([""] * (width + 1 - len(row)))
+
+                caller = intern(row[i_caller])
+                callee = intern(row[i_callee])
+                direction = row[i_direction]
 
                 # メソッド情報を保存
                 if caller and (
@@ -536,59 +1165,52 @@ class CallTreeVisualizer:
                     if caller not in self.method_info:
                         self.method_info[caller] = {}
                     self.method_info[caller] |= {
-                        "class": row["呼び出し元クラス"],
-                        "parent": row["呼び出し元の親クラス"],
-                        "visibility": row.get("可視性", ""),
-                        "is_static": row.get("Static", "") == "Yes",
-                        "is_entry_point": row.get("エントリーポイント候補", "")
-                        == "Yes",
-                        "entry_type": row.get("エントリータイプ", ""),
-                        "annotations": row.get("アノテーション", ""),
-                        "class_annotations": row.get("クラスアノテーション", ""),
+                        "class": intern(row[i_caller_class]),
+                        "parent": row[i_caller_parent],
+                        "visibility": row[i_visibility],
+                        "is_static": row[i_static] == "Yes",
+                        "is_entry_point": row[i_entry_point] == "Yes",
+                        "entry_type": row[i_entry_type],
+                        "annotations": row[i_annotations],
+                        "class_annotations": row[i_class_annotations],
                     }
 
                     # クラス階層情報を保存
-                    if row["呼び出し元クラス"]:
+                    if row[i_caller_class]:
                         parents = [
-                            p.strip()
-                            for p in row["呼び出し元の親クラス"].split(",")
+                            intern(p.strip())
+                            for p in row[i_caller_parent].split(",")
                             if p.strip()
                         ]
-                        self.class_info[row["呼び出し元クラス"]] = parents
+                        self.class_info[intern(row[i_caller_class])] = parents
 
                 if callee:
                     if callee not in self.method_info:
                         self.method_info[callee] = {
-                            "class": row["呼び出し先クラス"],
+                            "class": intern(row[i_callee_class]),
                             "parent": "",
-                            "sql": (
-                                row.get("SQL文", "") if direction == "Forward" else ""
-                            ),
+                            "sql": row[i_sql] if direction == "Forward" else "",
                             "visibility": "",
                             "is_static": False,
                             "is_entry_point": False,
                             "annotations": "",
                             "javadoc": (
-                                row.get("メソッドJavadoc", "")
-                                if direction == "Forward"
-                                else ""
+                                row[i_javadoc] if direction == "Forward" else ""
                             ),
                         }
                     else:
                         if not self.method_info[callee].get("sql"):
                             # SQL文は呼び出し先の情報に基づく
-                            self.method_info[callee] |= {"sql": row.get("SQL文", "")}
+                            self.method_info[callee] |= {"sql": row[i_sql]}
                         if not self.method_info[callee].get("javadoc"):
-                            self.method_info[callee] |= {
-                                "javadoc": row.get("メソッドJavadoc", "")
-                            }
+                            self.method_info[callee] |= {"javadoc": row[i_javadoc]}
 
                     # クラス階層情報を保存（呼び出し先）
-                    callee_class = row["呼び出し先クラス"]
-                    callee_parents_str = row.get("呼び出し先の親クラス", "")
+                    callee_class = intern(row[i_callee_class])
+                    callee_parents_str = row[i_callee_parent]
                     if callee_class:
                         parents = [
-                            p.strip()
+                            intern(p.strip())
                             for p in callee_parents_str.split(",")
                             if p.strip()
                         ]
@@ -601,11 +1223,7 @@ class CallTreeVisualizer:
                 # 呼び出し関係を保存
                 if direction == "Forward" and caller and callee:
                     self.forward_calls[caller].append(
-                        {
-                            "method": callee,
-                            "is_parent_method": row["呼び出し先は親クラスのメソッド"],
-                            "implementations": row["呼び出し先の実装クラス候補"],
-                        }
+                        CallEdge(callee, row[i_is_parent], row[i_impls])
                     )
                 elif direction == "Reverse" and caller and callee:
                     self.reverse_calls[caller].append(callee)
@@ -620,6 +1238,7 @@ class CallTreeVisualizer:
         verbose: bool = False,
         use_tab: bool = False,
         short_mode: bool = False,
+        file: Optional[TextIO] = None,
     ):
         """呼び出し元からのツリーを表示
 
@@ -632,16 +1251,23 @@ class CallTreeVisualizer:
             verbose: 詳細表示（Javadocを表示）
             use_tab: Trueの場合、ハードタブでインデントし、プレフィックスを省略
             short_mode: Trueの場合、クラス名からパッケージ名を省いて表示
+            file: ツリーの出力先（Noneの場合は標準出力）
         """
-        print(f"\n{'=' * 80}")
-        print(f"呼び出しツリー (起点: {root_method})")
-        print(f"{'=' * 80}\n")
+        if file is None:
+            file = sys.stdout
+
+        # 出力行はバッファに溜め、最後にまとめて書き出す
+        lines: List[str] = [
+            f"\n{'=' * 80}",
+            f"呼び出しツリー (起点: {root_method})",
+            f"{'=' * 80}\n",
+        ]
 
         visited: set[str] = set()
         # 最大深度到達フラグを初期化
         max_depth_reached: List[bool] = [False]
 
-        self._print_tree_recursive(
+        self._print_tree_lines(
             root_method,
             0,
             max_depth,
@@ -649,6 +1275,7 @@ class CallTreeVisualizer:
             show_class,
             show_sql,
             is_forward=True,
+            lines=lines,
             follow_implementations=follow_implementations,
             verbose=verbose,
             use_tab=use_tab,
@@ -656,6 +1283,8 @@ class CallTreeVisualizer:
             accumulated_instances=None,  # ルートから累積開始
             max_depth_reached=max_depth_reached,
         )
+        file.write("\n".join(lines))
+        file.write("\n")
 
         # 最大深度に到達した場合の警告を出力
         if max_depth_reached[0]:
@@ -690,22 +1319,26 @@ class CallTreeVisualizer:
             use_tab: Trueの場合、ハードタブでインデントし、プレフィックスを省略
             short_mode: Trueの場合、クラス名からパッケージ名を省いて表示
         """
-        print(f"\n{'=' * 80}")
-        print(f"逆引きツリー (対象: {target_method})")
-        print(f"{'=' * 80}\n")
+        # 出力行はバッファに溜め、最後にまとめて書き出す
+        lines: List[str] = [
+            f"\n{'=' * 80}",
+            f"逆引きツリー (対象: {target_method})",
+            f"{'=' * 80}\n",
+        ]
 
-        visited: set[str] = set()
+        visited: FrozenSet[str] = frozenset()
         final_endpoints: set[str] = set()  # 最終到達点のメソッドを収集
         # 最大深度到達フラグを初期化
         max_depth_reached: List[bool] = [False]
 
-        self._print_reverse_tree_recursive(
+        self._print_reverse_tree_lines(
             target_method,
             0,
             max_depth,
             visited,
             show_class,
             follow_overrides,
+            lines,
             final_endpoints,
             verbose,
             use_tab,
@@ -715,23 +1348,24 @@ class CallTreeVisualizer:
 
         # 最終到達点のメソッド一覧を表示
         if final_endpoints:
-            print(f"\n{'=' * 80}")
-            print("最終到達点のメソッド一覧 (最上位の呼び元メソッド)")
-            print(f"{'=' * 80}\n")
+            lines.append(f"\n{'=' * 80}")
+            lines.append("最終到達点のメソッド一覧 (最上位の呼び元メソッド)")
+            lines.append(f"{'=' * 80}\n")
             for endpoint in sorted(final_endpoints):
                 display_endpoint = (
                     self._shorten_method_signature(endpoint) if short_mode else endpoint
                 )
                 if verbose:
-                    info = self.method_info.get(endpoint, {})
-                    javadoc = info.get("javadoc", "")
+                    javadoc = self._mi_javadoc.get(endpoint, "")
                     if javadoc:
-                        print(f"  {display_endpoint}\t〓{javadoc}")
+                        lines.append(f"  {display_endpoint}\t〓{javadoc}")
                     else:
-                        print(f"  {display_endpoint}")
+                        lines.append(f"  {display_endpoint}")
                 else:
-                    print(f"  {display_endpoint}")
-            print()
+                    lines.append(f"  {display_endpoint}")
+            lines.append("")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
 
         # 最大深度に到達した場合の警告を出力
         if max_depth_reached[0]:
@@ -745,7 +1379,7 @@ class CallTreeVisualizer:
                 file=sys.stderr,
             )
 
-    def _print_tree_recursive(
+    def _print_tree_lines(
         self,
         method: str,
         depth: int,
@@ -754,6 +1388,7 @@ class CallTreeVisualizer:
         show_class: bool,
         show_sql: bool,
         is_forward: bool,
+        lines: List[str],  # 出力行バッファ
         follow_implementations: bool = True,
         verbose: bool = False,
         use_tab: bool = False,
@@ -761,285 +1396,331 @@ class CallTreeVisualizer:
         accumulated_instances: Optional[Set[str]] = None,  # 累積されたインスタンス情報
         max_depth_reached: Optional[List[bool]] = None,  # 最大深度到達フラグ
     ):
-        """ツリーを再帰的に表示
+        """ツリーを深さ優先で辿り、各ノードの表示行を出力行バッファに追加する
+
+        再帰呼び出しの代わりに明示的な作業スタックで辿る（深いツリーでも再帰の上限に
+        かからず、ノードごとの関数呼び出しも発生しない）。
+
+        visitedは現在の呼び出し経路上のメソッド集合。トラバース全体で1つのセットを共有し、
+        ノードの展開前に追加・展開後に削除する（バックトラッキング）。
 
         Args:
             accumulated_instances: 呼び出しツリーの上位から累積された生成インスタンス情報
             max_depth_reached: 最大深度到達フラグ（[False]のリストで渡し、到達時に[True]に更新）
+            lines: 出力行を追加するバッファ（呼び出し元でまとめて書き出す）
         """
-        if depth > max_depth:
-            # 最大深度に到達した場合、フラグをセット
-            if max_depth_reached is not None:
-                max_depth_reached[0] = True
-            return
+        # 生成インスタンスはトラバース全体で1つのセットに累積する
+        if accumulated_instances is None:
+            accumulated_instances = set()
+        should_include = self.exclusion_manager.should_include
+        should_exclude_children = self.exclusion_manager.should_exclude_children
+        indents = self._tab_indents if use_tab else self._space_indents
+        debug_mode = self.debug_mode
+        collect_instances = follow_implementations or debug_mode
+        filter_impls = self._filter_implementations_by_accumulated_instances
+        # 走査中に繰り返し参照する属性・メソッドはローカル変数に束縛しておく
+        print_node = self._print_node
+        collect_created_instances = self._collect_created_instances
+        find_implementation_method = self._find_implementation_method
+        fwd_methods = self._fwd_methods
+        fwd_is_parent = self._fwd_is_parent
+        fwd_impls = self._fwd_impls
+        fwd_impl_entries = self._fwd_impl_entries
+        fwd_impl_classes = self._fwd_impl_classes
+        reverse_calls = self.reverse_calls
+
+        # 作業スタックの各要素は (種別, ...) のタプル。子ノードに関する作業は逆順に積み、
+        # 末尾から取り出すことで、再帰で辿った場合と同じ順序で出力する
+        #   ("node", メソッド, 深さ, SQLを表示するか): ノードを表示して子ノードを積む
+        #   ("line", 文字列): 注記行を出力する
+        #   ("impls", 呼び出し先, 深さ, 注記のインデント, 実装クラス情報, 実装クラス, SQLを表示するか):
+        #       呼び出し先の配下を表示し終えた後で、実装クラス候補を展開する
+        #   ("leave", メソッド): 配下を表示し終えたメソッドを呼び出し経路から外す
+        stack: Deque[tuple] = deque([("node", method, depth, show_sql)])
+        while stack:
+            task = stack.pop()
+            kind = task[0]
+
+            if kind == "line":
+                lines.append(task[1])
+                continue
 
-        # Iモード: 除外対象の場合、ノード自体を表示せずスキップ
-        if not self.exclusion_manager.should_include(method):
-            return
+            if kind == "leave":
+                # 呼び出し経路から外す（兄弟ノードの循環参照判定に影響させない）
+                visited.discard(task[1])
+                continue
 
-        # 循環参照チェック
-        if method in visited:
-            self._print_node(
+            if kind == "impls":
+                (
+                    _,
+                    callee,
+                    child_depth,
+                    child_indent,
+                    implementations,
+                    impl_classes,
+                    show_sql,
+                ) = task
+
+                # 実装クラス候補の情報を表示
+                annotations = []
+                for impl_class_info, impl_class in zip(implementations, impl_classes):
+                    # Iモード: 除外対象の場合、ノード自体を表示せずスキップ
+                    if not should_include(impl_class):
+                        continue
+                    if debug_mode:
+                        annotations.append(f"実装: {impl_class_info}")
+
+                for annotation in annotations:
+                    lines.append(f"{child_indent}〓^ [{annotation}]")
+
+                # 実装クラス候補がある場合、それらも追跡
+                if not follow_implementations:
+                    continue
+
+                # Eモード: 除外対象の場合、実装クラスへの展開を停止
+                if should_exclude_children(callee):
+                    lines.append(f"{child_indent}〓[実装クラスへの展開を除外]")
+                    continue
+
+                # 累積されたインスタンス情報に基づいてフィルタリング
+                # （累積は呼び出し先の配下を表示し終えた時点のものを使う）
+                if accumulated_instances:
+                    filtered_impl_classes = filter_impls(
+                        accumulated_instances, impl_classes
+                    )
+                else:
+                    filtered_impl_classes = impl_classes
+
+                impl_tasks: List[tuple] = []
+                for impl_class in filtered_impl_classes:
+                    # 実装クラスの対応するメソッドを探す
+                    impl_method = find_implementation_method(callee, impl_class)
+                    if impl_method:
+                        # Iモード: 除外対象の場合、ノード自体を表示せずスキップ
+                        if not should_include(impl_method):
+                            continue
+
+                        impl_tasks.append(
+                            (
+                                "line",
+                                f"{child_indent}〓> [実装クラスへの展開: {impl_class}]",
+                            )
+                        )
+                        impl_tasks.append(("node", impl_method, child_depth, show_sql))
+                stack.extend(reversed(impl_tasks))
+                continue
+
+            _, method, depth, show_sql = task
+
+            if depth > max_depth:
+                # 最大深度に到達した場合、フラグをセット
+                if max_depth_reached is not None:
+                    max_depth_reached[0] = True
+                continue
+
+            # Iモード: 除外対象の場合、ノード自体を表示せずスキップ
+            if not should_include(method):
+                continue
+
+            # 循環参照チェック
+            if method in visited:
+                print_node(
+                    method,
+                    depth,
+                    show_class,
+                    show_sql,
+                    is_circular=True,
+                    verbose=verbose,
+                    use_tab=use_tab,
+                    short_mode=short_mode,
+                    lines=lines,
+                )
+                continue
+
+            visited.add(method)
+            print_node(
                 method,
                 depth,
                 show_class,
                 show_sql,
-                is_circular=True,
                 verbose=verbose,
                 use_tab=use_tab,
                 short_mode=short_mode,
+                lines=lines,
             )
-            return
-
-        visited.add(method)
-        self._print_node(
-            method,
-            depth,
-            show_class,
-            show_sql,
-            verbose=verbose,
-            use_tab=use_tab,
-            short_mode=short_mode,
-        )
 
-        # 現在のメソッドで生成されるインスタンスを収集し、累積に追加
-        current_instances = self._collect_created_instances(method)
-        if accumulated_instances is None:
-            accumulated_instances = current_instances
-        else:
-            accumulated_instances.update(current_instances)
-
-        # Eモード: 除外対象の場合、配下の展開を停止
-        if self.exclusion_manager.should_exclude_children(method):
-            indent = "\t" * (depth + 1) if use_tab else "    " * (depth + 1)
-            print(f"{indent}〓[配下の呼び出しを除外]")
-            return
-
-        # 子ノードを表示
-        if is_forward:
-            callees = self.forward_calls.get(method, [])
-            for callee_info in callees:
-                callee = callee_info["method"]
-
-                indent = "\t" * (depth + 1) if use_tab else "    " * (depth + 1)
+            # 現在のメソッドで生成されるインスタンスを収集し、累積に追加
+            # （累積は実装クラス候補の絞り込みにしか使わないため、追跡しない場合は
+            # デバッグ出力が必要なときだけ収集する）
+            if collect_instances:
+                current_instances = collect_created_instances(method)
+                if debug_mode and current_instances:
+                    lines.append(
+                        self._format_created_instances_debug(method, current_instances)
+                    )
+                if follow_implementations and current_instances:
+                    accumulated_instances.update(current_instances)
 
-                # Iモード: 除外対象の場合、ノード自体を表示せずスキップ
-                if not self.exclusion_manager.should_include(callee):
-                    continue
+            # 子ノード向けの注記（〓...）のインデント
+            child_indent = indents[depth + 1]
 
-                # 親クラスメソッドの情報を表示
-                if callee_info["is_parent_method"] == "Yes":
-                    print(f"{indent}〓↓ [親クラスメソッド]")
+            # Eモード: 除外対象の場合、配下の展開を停止
+            if should_exclude_children(method):
+                lines.append(f"{child_indent}〓[配下の呼び出しを除外]")
+                visited.discard(method)
+                continue
 
-                # 呼び出し先を再帰的に表示
-                self._print_tree_recursive(
+            # 子ノードを表示する作業（出力順に並べ、逆順にスタックへ積む）
+            child_tasks: List[tuple] = []
+            if is_forward:
+                for (
                     callee,
-                    depth + 1,
-                    max_depth,
-                    visited.copy(),
-                    show_class,
-                    show_sql,
-                    is_forward,
-                    follow_implementations,
-                    verbose,
-                    use_tab,
-                    short_mode,
-                    accumulated_instances,
-                    max_depth_reached,
-                )
+                    is_parent_method,
+                    callee_impls,
+                    implementations,
+                    impl_classes,
+                ) in zip(
+                    fwd_methods.get(method, ()),
+                    fwd_is_parent.get(method, ()),
+                    fwd_impls.get(method, ()),
+                    fwd_impl_entries.get(method, ()),
+                    fwd_impl_classes.get(method, ()),
+                ):
+                    # Iモード: 除外対象の場合、ノード自体を表示せずスキップ
+                    if not should_include(callee):
+                        continue
 
-                # 実装クラス候補の情報を表示
-                if callee_info["implementations"]:
-                    implementations = [
-                        impl.strip()
-                        for impl in callee_info["implementations"].split(",")
-                        if impl.strip()
-                    ]
+                    # 親クラスメソッドの情報を表示
+                    if is_parent_method:
+                        child_tasks.append(
+                            ("line", f"{child_indent}〓↓ [親クラスメソッド]")
+                        )
 
-                    annotations = []
-                    for impl_class_info in implementations:
-                        # Iモード: 除外対象の場合、ノード自体を表示せずスキップ
-                        impl_class = impl_class_info.split(" ")[0]
-                        if not self.exclusion_manager.should_include(impl_class):
-                            continue
-                        if self.debug_mode:
-                            annotations.append(f"実装: {impl_class_info}")
-
-                    for annotation in annotations:
-                        indent = "\t" * (depth + 1) if use_tab else "    " * (depth + 1)
-                        print(f"{indent}〓^ [{annotation}]")
-
-                    # 実装クラス候補がある場合、それらも追跡
-                    if follow_implementations:
-                        # implementationsの各要素は、「<クラス名> + " [<追加情報>]"」の形式かもしれないので、クラス名だけ抽出
-                        impl_classes = [impl.split(" ")[0] for impl in implementations]
-
-                        # Eモード: 除外対象の場合、実装クラスへの展開を停止
-                        if self.exclusion_manager.should_exclude_children(callee):
-                            indent = (
-                                "\t" * (depth + 1) if use_tab else "    " * (depth + 1)
-                            )
-                            print(f"{indent}〓[実装クラスへの展開を除外]")
-                            continue
+                    # 呼び出し先を表示
+                    child_tasks.append(("node", callee, depth + 1, show_sql))
 
-                        # 累積されたインスタンス情報に基づいてフィルタリング
-                        if accumulated_instances:
-                            filtered_impl_classes = (
-                                self._filter_implementations_by_accumulated_instances(
-                                    accumulated_instances, impl_classes
-                                )
+                    # 呼び出し先の配下を表示した後で、実装クラス候補を展開
+                    if callee_impls:
+                        child_tasks.append(
+                            (
+                                "impls",
+                                callee,
+                                depth + 1,
+                                child_indent,
+                                implementations,
+                                impl_classes,
+                                show_sql,
                             )
-                        else:
-                            filtered_impl_classes = impl_classes
+                        )
+            else:
+                for caller in reverse_calls.get(method, []):
+                    child_tasks.append(("node", caller, depth + 1, False))
 
-                        for impl_class in filtered_impl_classes:
-                            # 実装クラスの対応するメソッドを探す
-                            impl_method = self._find_implementation_method(
-                                callee, impl_class
-                            )
-                            if impl_method:
-                                # Iモード: 除外対象の場合、ノード自体を表示せずスキップ
-                                if not self.exclusion_manager.should_include(
-                                    impl_method
-                                ):
-                                    continue
-
-                                indent = (
-                                    "\t" * (depth + 1)
-                                    if use_tab
-                                    else "    " * (depth + 1)
-                                )
-                                print(f"{indent}〓> [実装クラスへの展開: {impl_class}]")
-
-                                self._print_tree_recursive(
-                                    impl_method,
-                                    depth + 1,
-                                    max_depth,
-                                    visited.copy(),
-                                    show_class,
-                                    show_sql,
-                                    is_forward,
-                                    follow_implementations,
-                                    verbose,
-                                    use_tab,
-                                    short_mode,
-                                    accumulated_instances,
-                                    max_depth_reached,
-                                )
-        else:
-            callers = self.reverse_calls.get(method, [])
-            for caller in callers:
-                self._print_tree_recursive(
-                    caller,
-                    depth + 1,
-                    max_depth,
-                    visited.copy(),
-                    show_class,
-                    False,
-                    is_forward,
-                    follow_implementations,
-                    verbose,
-                    use_tab,
-                    short_mode,
-                    accumulated_instances,
-                    max_depth_reached,
-                )
+            # 子ノードをすべて表示した後で、呼び出し経路から外す
+            stack.append(("leave", method))
+            stack.extend(reversed(child_tasks))
 
-    def _print_reverse_tree_recursive(
+    def _print_reverse_tree_lines(
         self,
         method: str,
         depth: int,
         max_depth: int,
-        visited: Set[str],
+        visited: FrozenSet[str],
         show_class: bool,
         follow_overrides: bool,
+        lines: List[str],  # 出力行バッファ
         final_endpoints: Optional[Set[str]] = None,
         verbose: bool = False,
         use_tab: bool = False,
         short_mode: bool = False,
         max_depth_reached: Optional[List[bool]] = None,  # 最大深度到達フラグ
     ):
-        """逆引きツリーを再帰的に表示"""
-        if depth > max_depth:
-            # 最大深度に到達した場合、フラグをセット
-            if max_depth_reached is not None:
-                max_depth_reached[0] = True
-            return
+        """逆引きツリーを深さ優先で辿り、各ノードの表示行を出力行バッファに追加する
 
-        # Iモード: 除外対象の場合、ノード自体を表示せずスキップ
-        if not self.exclusion_manager.should_include(method):
-            return
+        再帰呼び出しの代わりに、(メソッド, 深さ, 呼び出し経路)を積む明示的な作業スタックで
+        辿る（深いツリーでも再帰の上限にかからない）。
 
-        # 循環参照チェック
-        if method in visited:
-            self._print_node(
+        visitedは現在の呼び出し経路上のメソッド集合（不変）。子ノードへ降りるときだけ
+        自身を加えた集合を1つ作り、兄弟ノード間ではその集合を共有する。
+        """
+        # 走査中に繰り返し参照する属性・メソッドはローカル変数に束縛しておく
+        should_include = self.exclusion_manager.should_include
+        print_node = self._print_node
+        find_parent_methods = self._find_parent_methods
+        reverse_calls = self.reverse_calls
+        indents = self._tab_indents if use_tab else self._space_indents
+
+        # 作業スタックの各要素: (メソッド, 深さ, 呼び出し経路)。
+        # 子ノードは逆順に積み、末尾から取り出すことで再帰で辿った場合と同じ順序で出力する
+        stack: Deque[Tuple[str, int, FrozenSet[str]]] = deque(
+            [(method, depth, visited)]
+        )
+        while stack:
+            method, depth, visited = stack.pop()
+
+            if depth > max_depth:
+                # 最大深度に到達した場合、フラグをセット
+                if max_depth_reached is not None:
+                    max_depth_reached[0] = True
+                continue
+
+            # Iモード: 除外対象の場合、ノード自体を表示せずスキップ
+            if not should_include(method):
+                continue
+
+            # 循環参照チェック
+            if method in visited:
+                print_node(
+                    method,
+                    depth,
+                    show_class,
+                    False,
+                    is_circular=True,
+                    verbose=verbose,
+                    use_tab=use_tab,
+                    short_mode=short_mode,
+                    lines=lines,
+                )
+                continue
+
+            # 子ノードに渡す呼び出し経路（兄弟ノード間で共有するのでコピー不要）
+            child_visited = visited | {method}
+            print_node(
                 method,
                 depth,
                 show_class,
                 False,
-                is_circular=True,
                 verbose=verbose,
                 use_tab=use_tab,
                 short_mode=short_mode,
+                lines=lines,
             )
-            return
 
-        visited.add(method)
-        self._print_node(
-            method,
-            depth,
-            show_class,
-            False,
-            verbose=verbose,
-            use_tab=use_tab,
-            short_mode=short_mode,
-        )
+            callers = reverse_calls.get(method, [])
 
-        callers = self.reverse_calls.get(method, [])
-
-        # 呼び出し元がない場合、オーバーライド元/インターフェースメソッドを探す
-        if not callers and follow_overrides:
-            parent_methods = self._find_parent_methods(method)
-            if parent_methods:
-                indent = "\t" * depth if use_tab else "    " * depth
-                print(f"{indent}〓> [オーバーライド元/インターフェースメソッドを展開]")
-                for parent_method in parent_methods:
-                    self._print_reverse_tree_recursive(
-                        parent_method,
-                        depth,
-                        max_depth,
-                        visited.copy(),
-                        show_class,
-                        follow_overrides,
-                        final_endpoints,
-                        verbose,
-                        use_tab,
-                        short_mode,
-                        max_depth_reached,
+            # 呼び出し元がない場合、オーバーライド元/インターフェースメソッドを探す
+            if not callers and follow_overrides:
+                parent_methods = find_parent_methods(method)
+                if parent_methods:
+                    lines.append(
+                        f"{indents[depth]}〓> [オーバーライド元/インターフェースメソッドを展開]"
                     )
-            else:
-                # オーバーライド元もない場合は最終到達点
+                    stack.extend(
+                        (parent_method, depth, child_visited)
+                        for parent_method in reversed(parent_methods)
+                    )
+                else:
+                    # オーバーライド元もない場合は最終到達点
+                    if final_endpoints is not None:
+                        final_endpoints.add(method)
+            elif not callers:
+                # 呼び出し元がない場合は最終到達点
                 if final_endpoints is not None:
                     final_endpoints.add(method)
-        elif not callers:
-            # 呼び出し元がない場合は最終到達点
-            if final_endpoints is not None:
-                final_endpoints.add(method)
-        else:
-            # 通常の呼び出し元を表示
-            for caller in callers:
-                self._print_reverse_tree_recursive(
-                    caller,
-                    depth + 1,
-                    max_depth,
-                    visited.copy(),
-                    show_class,
-                    follow_overrides,
-                    final_endpoints,
-                    verbose,
-                    use_tab,
-                    short_mode,
-                    max_depth_reached,
+            else:
+                # 通常の呼び出し元を表示
+                stack.extend(
+                    (caller, depth + 1, child_visited) for caller in reversed(callers)
                 )
 
     def _print_node(
@@ -1048,21 +1729,21 @@ class CallTreeVisualizer:
         depth: int,
         show_class: bool,
         show_sql: bool,
+        lines: List[str],
         is_circular: bool = False,
         verbose: bool = False,
         use_tab: bool = False,
         short_mode: bool = False,
     ):
-        """ノード情報を表示"""
+        """ノード情報を出力行バッファに追加"""
         # use_tabがTrueの場合、ハードタブでインデントし、プレフィックスを省略
+        # （行頭と詳細行のインデントは深さごとにキャッシュした文字列を使う）
         if use_tab:
-            indent = "\t" * depth
-            prefix = ""
+            head = self._tab_indents[depth]
+            detail_indent = self._tab_detail_indents[depth]
         else:
-            indent = "    " * depth
-            prefix = "|-- " if depth > 0 else ""
-
-        info = self.method_info.get(method, {})
+            head = self._space_node_heads[depth] if depth > 0 else ""
+            detail_indent = self._space_indents[depth + 1]
 
         # 表示するメソッド名を決定（short_modeの場合、パッケージ名を省略）
         display_method = (
@@ -1070,32 +1751,32 @@ class CallTreeVisualizer:
         )
 
         # メソッド名を表示
-        display = f"{indent}{prefix}{display_method}"
+        display = f"{head}{display_method}"
         if is_circular:
             display += " [循環参照]"
 
         # verboseモードの場合、Javadocを追加
         if verbose:
-            javadoc = info.get("javadoc", "")
+            javadoc = self._mi_javadoc.get(method, "")
             if javadoc:
                 display += f"    〓{javadoc}"
 
-        print(display)
+        lines.append(display)
 
         # クラス情報を表示
-        if show_class and info.get("class"):
-            class_name = info.get("class", "")
-            sub_indent = "    "
-            print(f"{indent}{sub_indent}〓クラス: {class_name}")
-            if info.get("parent"):
-                parent_class = info.get("parent", "")
-                print(f"{indent}{sub_indent}〓親クラス: {parent_class}")
+        if show_class:
+            class_name = self._mi_class.get(method, "")
+            if class_name:
+                lines.append(f"{detail_indent}〓クラス: {class_name}")
+                parent_class = self._mi_parent.get(method, "")
+                if parent_class:
+                    lines.append(f"{detail_indent}〓親クラス: {parent_class}")
 
         # SQL情報を表示（全文表示）
-        if show_sql and info.get("sql"):
-            sql_text = info.get("sql", "") or ""
-            sub_indent = "    "
-            print(f"{indent}{sub_indent}〓SQL: {sql_text}")
+        if show_sql:
+            sql_text = self._mi_sql.get(method, "")
+            if sql_text:
+                lines.append(f"{detail_indent}〓SQL: {sql_text}")
 
     def _shorten_method_signature(self, method: str) -> str:
         """メソッドシグネチャからパッケージ名を省いて返す
@@ -1106,17 +1787,20 @@ class CallTreeVisualizer:
         Returns:
             パッケージ名を省いたメソッドシグネチャ (例: "MyClass#myMethod(Arg)")
         """
-        if "#" not in method:
-            # メソッドシグネチャでない場合はそのまま返す
-            return method
+        # 同じシグネチャがツリー・エクスポートの中で何度も現れるため結果をキャッシュする
+        cached = self._short_signature_cache.get(method)
+        if cached is not None:
+            return cached
 
         # クラス名#メソッド名(引数) の形式を解析
-        hash_pos = method.find("#")
-        class_part = method[:hash_pos]
-        method_part = method[hash_pos + 1 :]
+        class_part, sep, method_part = method.partition("#")
+        if not sep:
+            # メソッドシグネチャでない場合はそのまま返す
+            self._short_signature_cache[method] = method
+            return method
 
-        # クラス名からパッケージ名を省略
-        short_class = class_part.split(".")[-1] if "." in class_part else class_part
+        # クラス名からパッケージ名を省略（"."がない場合はrpartitionの結果が元の文字列になる）
+        short_class = class_part.rpartition(".")[2]
 
         # メソッド名の引数部分もパッケージ名を省略
         paren_pos = method_part.find("(")
@@ -1134,7 +1818,7 @@ class CallTreeVisualizer:
                         array_suffix = "[]"
                         arg = arg[:-2]
                     # パッケージ名を省略
-                    short_arg = arg.split(".")[-1] if "." in arg else arg
+                    short_arg = arg.rpartition(".")[2]
                     short_args.append(short_arg + array_suffix)
                 short_method_part = f"{method_name}({', '.join(short_args)})"
             else:
@@ -1142,24 +1826,39 @@ class CallTreeVisualizer:
         else:
             short_method_part = method_part
 
-        return f"{short_class}#{short_method_part}"
+        result = self._short_signature_cache[method] = (
+            f"{short_class}#{short_method_part}"
+        )
+        return result
 
-    def _find_parent_methods(self, method: str) -> List[str]:
+    def _find_parent_methods(self, method: str) -> Tuple[str, ...]:
         """メソッドのオーバーライド元/インターフェースメソッドを探す
 
+        結果はメソッドごとにキャッシュする（逆引きツリーやエントリータイプ判定で
+        同じメソッドについて何度も呼ばれるため）
+
         Args:
             method: 対象メソッドのシグネチャ
 
         Returns:
-            親メソッドのシグネチャのリスト
+            親メソッドのシグネチャのタプル
         """
-        if "#" not in method:
-            return []
+        cached = self._parent_methods_cache.get(method)
+        if cached is not None:
+            return cached
+
+        result = self._parent_methods_cache[method] = tuple(
+            self._search_parent_methods(method)
+        )
+        return result
 
-        info = self.method_info.get(method, {})
-        method_part = method.split("#", 1)[1]  # メソッド名+引数部分
-        parent_classes_str = info.get("parent", "")
+    def _search_parent_methods(self, method: str) -> List[str]:
+        """_find_parent_methodsの検索処理本体（キャッシュなし）"""
+        _, sep, method_part = method.partition("#")  # メソッド名+引数部分
+        if not sep:
+            return []
 
+        parent_classes_str = self._mi_parent.get(method, "")
         if not parent_classes_str:
             return []
 
@@ -1167,14 +1866,12 @@ class CallTreeVisualizer:
         parent_classes = [p.strip() for p in parent_classes_str.split(",") if p.strip()]
 
         parent_methods = []
+        methods_by_class = self._methods_by_class
         for parent_class in parent_classes:
             # 親クラスの同じシグネチャのメソッドを探す
-            for method_sig, method_info in self.method_info.items():
-                if method_info.get("class") == parent_class:
-                    if "#" in method_sig:
-                        sig_method_part = method_sig.split("#", 1)[1]
-                        if sig_method_part == method_part:
-                            parent_methods.append(method_sig)
+            for method_sig, sig_method_part in methods_by_class.get(parent_class, ()):
+                if sig_method_part == method_part:
+                    parent_methods.append(method_sig)
 
         return parent_methods
 
@@ -1183,6 +1880,9 @@ class CallTreeVisualizer:
     ) -> Optional[str]:
         """抽象メソッドに対応する実装クラスのメソッドを探す
 
+        結果は(抽象メソッド, 実装クラス)の組ごとにキャッシュする
+        （同じインターフェースメソッドがツリーの各所に現れるため）
+
         Args:
             abstract_method: 抽象メソッドのシグネチャ
             impl_class: 実装クラス名
@@ -1190,76 +1890,40 @@ class CallTreeVisualizer:
         Returns:
             実装メソッドのシグネチャ（見つからない場合はNone）
         """
+        key = (abstract_method, impl_class)
+        cache = self._impl_method_cache
+        if key in cache:
+            return cache[key]
+
+        result = cache[key] = self._search_implementation_method(
+            abstract_method, impl_class
+        )
+        return result
+
+    def _search_implementation_method(
+        self, abstract_method: str, impl_class: str
+    ) -> Optional[str]:
+        """_find_implementation_methodの検索処理本体（キャッシュなし）"""
         # メソッドシグネチャからメソッド名と引数を抽出
         # 例: "com.example.Interface#method(String, int)" -> "method(String, int)"
-        if "#" not in abstract_method:
+        _, sep, method_part = abstract_method.partition("#")
+        if not sep:
             return None
 
-        method_part = abstract_method.split("#", 1)[1]
+        index = self._impl_method_index
 
         # 実装クラスの同じシグネチャのメソッドを探す
         # 1. 直接の実装を探す
-        for method_sig, info in self.method_info.items():
-            if info.get("class") == impl_class:
-                if "#" in method_sig:
-                    sig_method_part = method_sig.split("#", 1)[1]
-                    if sig_method_part == method_part:
-                        return method_sig
-
-        # 2. 親クラスを辿って実装を探す
-        current_class = impl_class
-        visited_classes = set()
-
-        while current_class:
-            if current_class in visited_classes:
-                break
-            visited_classes.add(current_class)
-
-            parents = self.class_info.get(current_class, [])
-            if not parents:
-                break
-
-            # 親クラス（インターフェース含む）の中から実装を探す
-            # 優先順位: クラス > インターフェース だが、ここでは見つかった順
-            # Javaの単一継承を考えると、親クラスは1つ（+インターフェース複数）
-            # ここでは単純に見つかったものを返す
-            for parent in parents:
-                # インターフェースはスキップ
-                if parent in self.interface_data:
-                    continue
+        method_sig = index.get((impl_class, method_part))
+        if method_sig:
+            return method_sig
 
-                # 親クラスでメソッドを探す
-                for method_sig, info in self.method_info.items():
-                    if info.get("class") == parent:
-                        if "#" in method_sig:
-                            sig_method_part = method_sig.split("#", 1)[1]
-                            if sig_method_part == method_part:
-                                return method_sig
-
-                # 見つからなければ、次のループのために親クラスを更新したいが、
-                # 複数の親（インターフェース）があるため、幅優先探索すべきか？
-                # ここでは単純化して、最初の親（おそらくスーパークラス）を優先して探索する
-                # ただし、parentsリストの順序は保証されていないかもしれない
-                pass
-
-            # 幅優先探索で次の階層へ
-            # parents の中から次の current_class を選ぶ必要があるが、
-            # ここでは簡易的に、parents のすべてを次の探索候補にするBFSにする
-
-            # 上のループで return していないので、ここに来たということは
-            # 直近の親には実装がない。
-            # 次の階層（親の親）を探す
-
-            # BFS queue logic implementation
-            # Since we are inside a while loop designed for single path, let's refactor to BFS queue
-            break  # Break inner loop to switch to BFS structure below
-
-        # BFSで親クラスを探索
-        queue = list(self.class_info.get(impl_class, []))
+        # 2. 親クラスを幅優先で辿って実装を探す（インターフェースはスキップ）
+        queue = deque(self.class_info.get(impl_class, []))
         visited_classes = {impl_class}
 
         while queue:
-            current_parent = queue.pop(0)
+            current_parent = queue.popleft()
             if current_parent in visited_classes:
                 continue
             visited_classes.add(current_parent)
@@ -1269,12 +1933,9 @@ class CallTreeVisualizer:
                 continue
 
             # この親クラスにメソッドがあるか確認
-            for method_sig, info in self.method_info.items():
-                if info.get("class") == current_parent:
-                    if "#" in method_sig:
-                        sig_method_part = method_sig.split("#", 1)[1]
-                        if sig_method_part == method_part:
-                            return method_sig
+            method_sig = index.get((current_parent, method_part))
+            if method_sig:
+                return method_sig
 
             # 次の親を追加
             queue.extend(self.class_info.get(current_parent, []))
@@ -1306,23 +1967,27 @@ class CallTreeVisualizer:
 
         return implementations  # マッチしなければ全候補を返す
 
-    def _collect_created_instances(self, method: str) -> Set[str]:
+    def _collect_created_instances(self, method: str) -> FrozenSet[str]:
         """メソッドおよびそのクラスで生成されるインスタンスを収集
 
+        結果はメソッドごとにキャッシュし、クラス名はsys.internした文字列で保持する
+        （実装クラス候補の絞り込みで、累積セットへの所属判定を1回のハッシュ参照で済ませるため）
+
         Args:
             method: メソッドシグネチャ
 
         Returns:
             生成されるインスタンスのクラス名セット
         """
-        created_instances: Set[str] = set()
+        cached = self._created_instances_cache.get(method)
+        if cached is not None:
+            return cached
 
         # メソッド内で生成されたインスタンス
-        method_info = self.method_info.get(method, {})
-        created_instances.update(method_info.get("createdInstances", []))
+        created_instances: Set[str] = set(self._mi_created_instances.get(method, ()))
 
         # クラスのフィールド初期化で生成されたインスタンス
-        method_class = method_info.get("class", "")
+        method_class = self._mi_class.get(method, "")
         if method_class:
             class_data = self.class_data.get(method_class, {})
             for init in class_data.get("fieldInitializers", []):
@@ -1330,13 +1995,15 @@ class CallTreeVisualizer:
                 if initialized_class:
                     created_instances.add(initialized_class)
 
-        # デバッグモードの場合、収集したインスタンス情報を出力
-        if self.debug_mode and created_instances:
-            print(
-                f"[DEBUG] {method} で収集したインスタンス: {', '.join(sorted(created_instances))}"
-            )
+        result = frozenset(sys.intern(c) for c in created_instances)
+        self._created_instances_cache[method] = result
+        return result
 
-        return created_instances
+    def _format_created_instances_debug(
+        self, method: str, created_instances: FrozenSet[str]
+    ) -> str:
+        """デバッグモード用に、収集したインスタンス情報の出力行を作成"""
+        return f"[DEBUG] {method} で収集したインスタンス: {', '.join(sorted(created_instances))}"
 
     def export_tree_to_file(
         self,
@@ -1369,12 +2036,12 @@ class CallTreeVisualizer:
     ):
         """テキスト形式でエクスポート"""
         with open(output_file, "w", encoding="utf-8") as f:
-            original_stdout = sys.stdout
-            sys.stdout = f
             self.print_forward_tree(
-                root_method, max_depth, follow_implementations=follow_implementations
+                root_method,
+                max_depth,
+                follow_implementations=follow_implementations,
+                file=f,
             )
-            sys.stdout = original_stdout
         print(f"ツリーを {output_file} にエクスポートしました")
 
     def _export_markdown_tree(
@@ -1390,16 +2057,14 @@ class CallTreeVisualizer:
             f.write(f"**起点メソッド:** `{root_method}`\n\n")
             f.write("```\n")
 
-            original_stdout = sys.stdout
-            sys.stdout = f
             self.print_forward_tree(
                 root_method,
                 max_depth,
                 show_class=False,
                 show_sql=False,
                 follow_implementations=follow_implementations,
+                file=f,
             )
-            sys.stdout = original_stdout
 
             f.write("```\n")
         print(f"ツリーを {output_file} にエクスポートしました")
@@ -1412,7 +2077,8 @@ class CallTreeVisualizer:
         follow_implementations: bool,
     ):
         """HTML形式でエクスポート（インタラクティブなツリー）"""
-        html = f"""<!DOCTYPE html>
+        # ツリー部分は断片を生成しながら書き出し、文書全体を1つの文字列にしない
+        header = f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -1435,129 +2101,157 @@ class CallTreeVisualizer:
     <p><strong>起点メソッド:</strong> {root_method}</p>
     <ul class="tree">
 """
-
-        visited = set()
-        html += self._generate_html_tree(
-            root_method, 0, max_depth, visited, follow_implementations
-        )
-
-        html += """
+        footer = """
     </ul>
 </body>
 </html>
 """
 
         with open(output_file, "w", encoding="utf-8") as f:
-            f.write(html)
+            f.write(header)
+            f.writelines(
+                self._iter_html_tree(
+                    root_method, 0, max_depth, frozenset(), follow_implementations
+                )
+            )
+            f.write(footer)
         print(f"ツリーを {output_file} にエクスポートしました")
 
-    def _generate_html_tree(
+    def _iter_html_tree(
         self,
         method: str,
         depth: int,
         max_depth: int,
-        visited: Set[str],
+        visited: FrozenSet[str],
         follow_implementations: bool,
-    ) -> str:
-        """HTML形式のツリーを生成"""
-        if depth > max_depth:
-            return ""
+    ) -> Iterator[str]:
+        """HTML形式のツリーの断片を順に生成する
 
-        # Iモード: 除外対象の場合、ノード自体をスキップ
-        if not self.exclusion_manager.should_include(method):
-            return ""
+        呼び出し元がそのままファイルへ書き出すため、保持する断片は
+        現在の呼び出し経路の分だけで済む（文書全体を結合しない）。
+        再帰呼び出し（入れ子のジェネレータ）の代わりに明示的な作業スタックで辿る
+        （深いツリーでも再帰の上限にかからない）。
+
+        visitedは現在の呼び出し経路上のメソッド集合（不変）。子ノードには
+        自身を加えた集合を1つだけ作って共有する。
+        """
+        # 走査中に繰り返し参照する属性・メソッドはローカル変数に束縛しておく
+        should_include = self.exclusion_manager.should_include
+        should_exclude_children = self.exclusion_manager.should_exclude_children
+        find_implementation_method = self._find_implementation_method
+        mi_class = self._mi_class
+        fwd_methods = self._fwd_methods
+        fwd_impls = self._fwd_impls
+        fwd_impl_classes = self._fwd_impl_classes
+
+        # 作業スタックの各要素は (種別, ...) のタプル。子ノードに関する作業は逆順に積み、
+        # 末尾から取り出すことで、再帰で辿った場合と同じ順序で断片を生成する
+        #   ("node", メソッド, 深さ, 呼び出し経路): ノードを出力して子ノードを積む
+        #   ("line", 断片): 断片をそのまま出力する
+        stack: Deque[tuple] = deque([("node", method, depth, visited)])
+        while stack:
+            task = stack.pop()
+
+            if task[0] == "line":
+                yield task[1]
+                continue
+
+            _, method, depth, visited = task
+
+            if depth > max_depth:
+                continue
+
+            # Iモード: 除外対象の場合、ノード自体をスキップ
+            if not should_include(method):
+                continue
 
-        html = ""
-        info = self.method_info.get(method, {})
+            if method in visited:
+                yield f'<li><span class="method circular">{method} [循環参照]</span></li>'
+                continue
 
-        if method in visited:
-            html += f'<li><span class="method circular">{method} [循環参照]</span></li>'
-            return html
+            # 子ノードに渡す呼び出し経路（兄弟ノード間で共有するのでコピー不要）
+            child_visited = visited | {method}
 
-        visited.add(method)
+            yield f'<li><span class="method">{method}</span>'
 
-        html += f'<li><span class="method">{method}</span>'
+            class_name = mi_class.get(method)
+            if class_name:
+                yield f'<div class="class-info">クラス: {class_name}</div>'
 
-        if info.get("class"):
-            html += f'<div class="class-info">クラス: {info["class"]}</div>'
+            # Eモード: 配下の展開を停止
+            if should_exclude_children(method):
+                yield '<div class="class-info">[配下の呼び出しを除外]</div>'
+                yield "</li>"
+                continue
 
-        # Eモード: 配下の展開を停止
-        if self.exclusion_manager.should_exclude_children(method):
-            html += '<div class="class-info">[配下の呼び出しを除外]</div>'
-            html += "</li>"
-            return html
+            callees = fwd_methods.get(method, ())
+            if not callees:
+                yield "</li>"
+                continue
 
-        callees = self.forward_calls.get(method, [])
-        if callees:
-            html += '<ul class="tree">'
-            for callee_info in callees:
+            yield '<ul class="tree">'
+            child_tasks: List[tuple] = []
+            # 実装クラス候補は読み込み時に分割済みのクラス名部分を使う
+            for callee, callee_impls, impl_classes in zip(
+                callees, fwd_impls[method], fwd_impl_classes[method]
+            ):
 
                 # Iモード: 除外対象の場合、ノード自体を表示せずスキップ
-                if not self.exclusion_manager.should_include(callee_info["method"]):
+                if not should_include(callee):
                     continue
 
-                html += self._generate_html_tree(
-                    callee_info["method"],
-                    depth + 1,
-                    max_depth,
-                    visited.copy(),
-                    follow_implementations,
-                )
+                child_tasks.append(("node", callee, depth + 1, child_visited))
 
                 # 実装クラス候補がある場合
-                if follow_implementations and callee_info["implementations"]:
-                    implementations = [
-                        impl.strip()
-                        for impl in callee_info["implementations"].split(",")
-                        if impl.strip()
-                    ]
-                    # implementationsの各要素は、「<クラス名> + " [<追加情報>]"」の形式かもしれないので、クラス名だけ抽出
-                    implementations = [impl.split(" ")[0] for impl in implementations]
-
-                    for impl_class in implementations:
-                        impl_method = self._find_implementation_method(
-                            callee_info["method"], impl_class
-                        )
+                if follow_implementations and callee_impls:
+                    for impl_class in impl_classes:
+                        impl_method = find_implementation_method(callee, impl_class)
                         if impl_method:
                             # Iモード: 除外対象の場合、ノード自体を表示せずスキップ
-                            if not self.exclusion_manager.should_include(impl_method):
+                            if not should_include(impl_method):
                                 continue
 
-                            html += f'<li><span class="implementation">→ 実装: {impl_class}</span>'
-                            html += self._generate_html_tree(
-                                impl_method,
-                                depth + 2,
-                                max_depth,
-                                visited.copy(),
-                                follow_implementations,
+                            child_tasks.append(
+                                (
+                                    "line",
+                                    f'<li><span class="implementation">→ 実装: {impl_class}</span>',
+                                )
+                            )
+                            child_tasks.append(
+                                ("node", impl_method, depth + 2, child_visited)
                             )
-                            html += "</li>"
+                            child_tasks.append(("line", "</li>"))
 
-            html += "</ul>"
+            child_tasks.append(("line", "</ul>"))
+            child_tasks.append(("line", "</li>"))
+            stack.extend(reversed(child_tasks))
 
-        html += "</li>"
-        return html
+    def _build_entry_points(
+        self, min_calls: int = 1, strict: bool = True
+    ) -> List[Tuple[str, int, str, str, str, str, str, str]]:
+        """エントリーポイント候補を収集し、エントリータイプとメソッド名の順に並べて返す
 
-    def list_entry_points(self, min_calls: int = 1, strict: bool = True):
-        """エントリーポイント候補をリストアップ
+        結果は(min_calls, strict)ごとにキャッシュする（list_entry_points と
+        list_entry_points_tsv で共有する。読み込み後はデータが変化しないため無効化は不要）
 
         Args:
             min_calls: 最小呼び出し数
-            strict: True の場合、アノテーションやmainメソッドなど厳密に判定（デフォルト）
-        """
-        print(f"\n{'=' * 80}")
-        if strict:
-            print("エントリーポイント候補（厳密モード）")
-        else:
-            print(f"エントリーポイント候補 (呼び出し先が{min_calls}個以上)")
-        print(f"{'=' * 80}\n")
-
-        # すべての呼び出し先を収集
-        all_callees = set()
-        for callees in self.forward_calls.values():
-            for callee_info in callees:
-                all_callees.add(callee_info["method"])
+            strict: True の場合、アノテーションやmainメソッドなど厳密に判定
 
+        Returns:
+            (メソッド, 呼び出し数, クラス名, エントリータイプ, アノテーション,
+            可視性, Javadoc, 引数アノテーション) のタプルのリスト
+        """
+        key = (min_calls, strict)
+        cached = self._entry_points_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # ループ内で繰り返し参照する属性・メソッドはローカル変数に束縛しておく
+        all_callees = self._all_callees
+        interface_data = self.interface_data
+        fwd_methods = self._fwd_methods
+        determine_entry_type = self._determine_entry_type
         entry_points = []
 
         for method, info in self.method_info.items():
@@ -1567,15 +2261,15 @@ class CallTreeVisualizer:
 
             # インターフェースの場合は除外
             type = info.get("class", "")
-            if self.interface_data.get(type, ""):
+            if interface_data.get(type, ""):
                 continue
 
-            call_count = len(self.forward_calls.get(method, []))
+            call_count = len(fwd_methods.get(method, ()))
 
             # 厳密モードの場合
             if strict:
                 if info.get("is_entry_point"):
-                    entry_type = self._determine_entry_type(method, info)
+                    entry_type = determine_entry_type(method, info)
                     entry_points.append(
                         (
                             method,
@@ -1591,7 +2285,7 @@ class CallTreeVisualizer:
             else:
                 # 非厳密モードの場合は呼び出し数で判定
                 if call_count >= min_calls:
-                    entry_type = self._determine_entry_type(method, info)
+                    entry_type = determine_entry_type(method, info)
                     entry_points.append(
                         (
                             method,
@@ -1606,13 +2300,36 @@ class CallTreeVisualizer:
                     )
 
         # エントリータイプとメソッド名でソート
-        entry_points.sort(key=lambda x: (self._entry_priority(x[3]), x[0]))
+        entry_points.sort(
+            key=lambda x: (_ENTRY_PRIORITY.get(x[3], _UNKNOWN_ENTRY_PRIORITY), x[0])
+        )
+
+        self._entry_points_cache[key] = entry_points
+        return entry_points
+
+    def list_entry_points(self, min_calls: int = 1, strict: bool = True):
+        """エントリーポイント候補をリストアップ
+
+        Args:
+            min_calls: 最小呼び出し数
+            strict: True の場合、アノテーションやmainメソッドなど厳密に判定（デフォルト）
+        """
+        print(f"\n{'=' * 80}")
+        if strict:
+            print("エントリーポイント候補（厳密モード）")
+        else:
+            print(f"エントリーポイント候補 (呼び出し先が{min_calls}個以上)")
+        print(f"{'=' * 80}\n")
+
+        entry_points = self._build_entry_points(min_calls, strict)
 
         # 結果を表示
         if not entry_points:
             print("エントリーポイント候補が見つかりませんでした", file=sys.stderr)
             return
 
+        # 出力行はバッファに溜め、最後にまとめて書き出す
+        lines: List[str] = []
         for i, (
             method,
             call_count,
@@ -1623,30 +2340,34 @@ class CallTreeVisualizer:
             javadoc,
             parameter_annotations,
         ) in enumerate(entry_points, 1):
-            print(f"{i}. {method}")
-            print(f"   クラス: {class_name}")
-            print(f"   種別: {entry_type}")
-            print(f"   Javadoc: {javadoc}")
-            print(f"   可視性: {visibility}")
+            lines.append(f"{i}. {method}")
+            lines.append(f"   クラス: {class_name}")
+            lines.append(f"   種別: {entry_type}")
+            lines.append(f"   Javadoc: {javadoc}")
+            lines.append(f"   可視性: {visibility}")
             if annotations:
-                print(f"   メソッドアノテーション: {annotations}")
+                lines.append(f"   メソッドアノテーション: {annotations}")
             if parameter_annotations:
-                print(f"   引数アノテーション: {parameter_annotations}")
+                lines.append(f"   引数アノテーション: {parameter_annotations}")
 
             # クラスアノテーションも表示（親クラス・インターフェース含む）
             info = self.method_info.get(method, {})
             all_class_annotations = self._get_all_class_annotation_raws(class_name)
             if all_class_annotations:
-                print(f"   クラスアノテーション: {', '.join(all_class_annotations)}")
+                lines.append(
+                    f"   クラスアノテーション: {', '.join(all_class_annotations)}"
+                )
 
             # HTTP / SOAP の場合、アノテーション等からエンドポイントの path を抽出して表示
             if entry_type and ("HTTP Endpoint" in entry_type or "SOAP" in entry_type):
                 endpoint_path = self._extract_endpoint_path(info, class_name)
                 if endpoint_path:
-                    print(f"   エンドポイント: {endpoint_path}")
+                    lines.append(f"   エンドポイント: {endpoint_path}")
 
-            print(f"   呼び出し数: {call_count}")
-            print()
+            lines.append(f"   呼び出し数: {call_count}")
+            lines.append("")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
 
     def list_entry_points_tsv(self, min_calls: int = 1, strict: bool = True) -> None:
         """エントリーポイント候補をTSV形式で出力
@@ -1658,68 +2379,14 @@ class CallTreeVisualizer:
         #  clipでコピーした結果をExcelに貼り付けられるにはShift_JISで出力する
         sys.stdout.reconfigure(encoding=self.output_tsv_encoding)
 
-        # すべての呼び出し先を収集
-        all_callees = set()
-        for callees in self.forward_calls.values():
-            for callee_info in callees:
-                all_callees.add(callee_info["method"])
-
-        entry_points = []
-
-        for method, info in self.method_info.items():
-            # 他から呼ばれていないメソッドのみ
-            if method in all_callees:
-                continue
-
-            # インターフェースの場合は除外
-            type = info.get("class", "")
-            if self.interface_data.get(type, ""):
-                continue
-
-            call_count = len(self.forward_calls.get(method, []))
-
-            # 厳密モードの場合
-            if strict:
-                if info.get("is_entry_point"):
-                    entry_type = self._determine_entry_type(method, info)
-                    entry_points.append(
-                        (
-                            method,
-                            call_count,
-                            info.get("class", ""),
-                            entry_type,
-                            info.get("annotations", ""),
-                            info.get("visibility", ""),
-                            info.get("javadoc", ""),
-                            info.get("parameterAnnotations", ""),
-                        )
-                    )
-            else:
-                # 非厳密モードの場合は呼び出し数で判定
-                if call_count >= min_calls:
-                    entry_type = self._determine_entry_type(method, info)
-                    entry_points.append(
-                        (
-                            method,
-                            call_count,
-                            info.get("class", ""),
-                            entry_type,
-                            info.get("annotations", ""),
-                            info.get("visibility", ""),
-                            info.get("javadoc", ""),
-                            info.get("parameterAnnotations", ""),
-                        )
-                    )
-
-        # エントリータイプとメソッド名でソート
-        entry_points.sort(key=lambda x: (self._entry_priority(x[3]), x[0]))
+        entry_points = self._build_entry_points(min_calls, strict)
 
-        # TSVヘッダーを出力
-        print(
+        # TSVヘッダーを出力（出力行はバッファに溜め、最後にまとめて書き出す）
+        lines: List[str] = [
             "メソッド\tパッケージ名\tクラス名\tメソッド名\tエンドポイント\t"
             "メソッドjavadoc\tクラスjavadoc\t種別\t"
             "メソッドアノテーション\t引数アノテーション\tクラスアノテーション"
-        )
+        ]
 
         # 結果をTSV形式で出力
         for (
@@ -1733,29 +2400,13 @@ class CallTreeVisualizer:
             parameter_annotations,
         ) in entry_points:
             # パッケージ名とクラス名（パッケージ除く）を分離
-            package_name = ""
-            class_name_only = class_name
-            if "." in class_name:
-                parts = class_name.rsplit(".", 1)
-                package_name = parts[0]
-                class_name_only = parts[1]
+            # （"."がない場合はパッケージ名が空、クラス名がそのままになる）
+            package_name, _, class_name_only = class_name.rpartition(".")
 
             # メソッド名（クラスや引数を含めないメソッド名のみ）を抽出
-            method_name_only = ""
-            if "#" in method:
-                # クラス#メソッド(引数) の形式からメソッド名のみを抽出
-                method_part = method.split("#", 1)[1]
-                # 引数部分を除去
-                if "(" in method_part:
-                    method_name_only = method_part.split("(", 1)[0]
-                else:
-                    method_name_only = method_part
-            else:
-                # #がない場合はそのまま
-                if "(" in method:
-                    method_name_only = method.split("(", 1)[0]
-                else:
-                    method_name_only = method
+            # クラス#メソッド(引数) の形式からメソッド名のみを抽出（#がない場合はそのまま）
+            _, sep, method_part = method.partition("#")
+            method_name_only = (method_part if sep else method).partition("(")[0]
 
             # エンドポイントを抽出
             info = self.method_info.get(method, {})
@@ -1769,9 +2420,11 @@ class CallTreeVisualizer:
             class_javadoc = self._get_class_javadoc(class_name)
 
             # TSV行を出力
-            print(
+            lines.append(
                 f"{method}\t{package_name}\t{class_name_only}\t{method_name_only}\t{endpoint_path}\t{javadoc}\t{class_javadoc}\t{entry_type}\t{annotations}\t{parameter_annotations}\t{class_annotations_str}"
             )
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
 
     def _extract_endpoint_path(self, info: dict, class_name: str = "") -> str:
         """アノテーションやクラスアノテーションからエンドポイントの path を抽出する
@@ -1786,35 +2439,14 @@ class CallTreeVisualizer:
 
         method_annotations = str(info.get("annotations", ""))
 
-        # クラスレベルのアノテーション（親クラス・インターフェース含む、フル形式）を取得
-        all_class_annotation_raws = (
-            self._get_all_class_annotation_raws(class_name) if class_name else []
+        # クラスレベルの基本パス（@RequestMapping等から）と
+        # WebLogicのcontextPath・serviceUri（クラスごとにキャッシュ）
+        base_path, context_path, service_uri = self._get_class_endpoint_parts(
+            class_name
         )
-        class_annotations = " ".join(all_class_annotation_raws)
-
-        # パス抽出パターン
-        path_patterns = [
-            r"\w*Mapping\(\s*path\s*=\s*[\"']([^\"']+)[\"']",  # path = "/x"
-            r"\w*Mapping\(\s*value\s*=\s*[\"']([^\"']+)[\"']",  # value = "/x"
-            r"\w*Mapping\(\s*[\"']([^\"']+)[\"']",  # GetMapping("/x"), RequestMapping("/x") 等
-            r"Path\(\s*[\"']([^\"']+)[\"']",  # JAX-RS @Path
-        ]
-
-        # クラスレベルの基本パスを抽出（@RequestMapping等から）
-        base_path = ""
-        for pattern in path_patterns:
-            m = re.search(pattern, class_annotations)
-            if m:
-                base_path = m.group(1)
-                break
 
         # メソッドレベルのパスを抽出
-        method_path = ""
-        for pattern in path_patterns:
-            m = re.search(pattern, method_annotations)
-            if m:
-                method_path = m.group(1)
-                break
+        method_path = self._search_annotation_path(method_annotations)
 
         # パスの結合
         if base_path and method_path:
@@ -1832,18 +2464,12 @@ class CallTreeVisualizer:
         # WebLogic + JAX-WS（SOAP）の場合を考慮し、WebLogic特有アノテーション @WLHttpTransportのcontextPath、serviceUriの値からパスを抽出
         # さらに、メソッドレベルの@WebMethodのoperationNameの値を結合して、SOAPのエンドポイントを生成する
         # 例：contextPath=/foo, serviceUri=/bar, operationName=fooBar -> /foo/bar : operationName=fooBar
-        context_path = ""
-        service_uri = ""
+        # （属性名を含まない場合は正規表現による検索を省略する）
         operation_name = ""
-        m = re.search(r"contextPath\s*=\s*[\"']([^\"']+)[\"']", class_annotations)
-        if m:
-            context_path = m.group(1)
-        m = re.search(r"serviceUri\s*=\s*[\"']([^\"']+)[\"']", class_annotations)
-        if m:
-            service_uri = m.group(1)
-        m = re.search(r"operationName\s*=\s*[\"']([^\"']+)[\"']", method_annotations)
-        if m:
-            operation_name = m.group(1)
+        if "operationName" in method_annotations:
+            m = _OPERATION_NAME_RE.search(method_annotations)
+            if m:
+                operation_name = m.group(1)
         if context_path or service_uri or operation_name:
             return context_path + service_uri + " : operationName=" + operation_name
 
@@ -1867,48 +2493,111 @@ class CallTreeVisualizer:
 
         return ""
 
+    def _search_annotation_path(self, annotations: str) -> str:
+        """アノテーション文字列からパス抽出パターンを優先順に試し、最初に見つかったパスを返す"""
+        # いずれのパターンも "Mapping(" か "Path(" を含むため、どちらもなければ検索しない
+        if "Mapping(" not in annotations and "Path(" not in annotations:
+            return ""
+
+        for pattern in _PATH_PATTERNS:
+            m = pattern.search(annotations)
+            if m:
+                return m.group(1)
+        return ""
+
+    def _get_class_endpoint_parts(self, class_name: str) -> Tuple[str, str, str]:
+        """クラスレベルのエンドポイント情報を取得
+
+        同じクラスのエントリーポイントが多数あるため、クラスごとに1回だけ
+        アノテーション（親クラス・インターフェース含む、フル形式）を解析してキャッシュする。
+
+        Returns:
+            (基本パス, WebLogicのcontextPath, WebLogicのserviceUri) のタプル（なければ空文字）
+        """
+        cached = self._class_endpoint_cache.get(class_name)
+        if cached is not None:
+            return cached
+
+        all_class_annotation_raws = (
+            self._get_all_class_annotation_raws(class_name) if class_name else ()
+        )
+        class_annotations = " ".join(all_class_annotation_raws)
+
+        base_path = self._search_annotation_path(class_annotations)
+
+        # （属性名を含まない場合は正規表現による検索を省略する）
+        context_path = ""
+        service_uri = ""
+        if "contextPath" in class_annotations:
+            m = _CONTEXT_PATH_RE.search(class_annotations)
+            if m:
+                context_path = m.group(1)
+        if "serviceUri" in class_annotations:
+            m = _SERVICE_URI_RE.search(class_annotations)
+            if m:
+                service_uri = m.group(1)
+
+        result = self._class_endpoint_cache[class_name] = (
+            base_path,
+            context_path,
+            service_uri,
+        )
+        return result
+
     def _determine_entry_type(self, method: str, info: dict) -> str:
-        """エントリーポイントの種別を判定"""
+        """エントリーポイントの種別を判定
+
+        結果はメソッドごとにキャッシュする（infoはmethod_info[method]で、読み込み後は不変）
+        """
+        cached = self._entry_type_cache.get(method)
+        if cached is not None:
+            return cached
+
         candidates = []
 
         # 1. 解析時に判定されたエントリータイプ
         entry_type = info.get("entry_type", "")
         if entry_type:
-            type_map = {
-                "Main": "Main Method",
-                "Test": "Test Method",
-                "HTTP": "HTTP Endpoint",
-                "SOAP": "SOAP Endpoint",
-                "Scheduled": "Scheduled Job",
-                "Event": "Event Listener",
-                "Lifecycle": "Lifecycle Method",
-                "Servlet": "Servlet",
-                "SpringBoot": "Spring Boot Runner",
-                "Thread": "Runnable/Callable",
-                "Bean": "Bean Factory",
-            }
-            candidates.append(type_map.get(entry_type, entry_type))
+            candidates.append(_ENTRY_TYPE_NAMES.get(entry_type, entry_type))
 
-        # 2. アノテーションから判定
-        entry_type = self._check_entry_type_from_info(info)
+        # 2. アノテーションから判定（親メソッドとしての判定結果と共有する）
+        entry_type = self._get_method_annotation_entry_type(method)
         if entry_type:
             candidates.append(entry_type)
 
         # 3. 親メソッド（インターフェース/スーパークラス）のアノテーションを確認
-        parent_methods = self._find_parent_methods(method)
-        for parent_method in parent_methods:
-            parent_info = self.method_info.get(parent_method, {})
-            if parent_info:
-                entry_type = self._check_entry_type_from_info(parent_info)
-                if entry_type:
-                    candidates.append(entry_type)
+        # （同じ親メソッドを多くの実装メソッドが共有するため、判定結果を親メソッドごとに再利用する）
+        for parent_method in self._find_parent_methods(method):
+            entry_type = self._get_method_annotation_entry_type(parent_method)
+            if entry_type:
+                candidates.append(entry_type)
 
         if not candidates:
-            return ""
+            result = ""
+        else:
+            # 優先順位が最も高いもの（数値が小さい方が優先。同順位なら先に見つかったもの）
+            result = min(
+                candidates,
+                key=lambda x: _ENTRY_PRIORITY.get(x, _UNKNOWN_ENTRY_PRIORITY),
+            )
+        self._entry_type_cache[method] = result
+        return result
+
+    def _get_method_annotation_entry_type(self, method: str) -> str:
+        """メソッドのアノテーション等から判定したエントリータイプ（メソッドごとにキャッシュ）
+
+        あるメソッド自身の判定と、その実装メソッド側から親メソッドとして参照される判定の
+        どちらも同じ結果を使うため、アノテーション文字列の走査はメソッドごとに1回で済む。
+        method_infoにないメソッドは空文字を返す。
+        """
+        cached = self._annotation_entry_type_cache.get(method)
+        if cached is not None:
+            return cached
 
-        # 優先順位でソート（数値が小さい方が優先）
-        candidates.sort(key=lambda x: self._entry_priority(x))
-        return candidates[0]
+        info = self.method_info.get(method)
+        result = self._check_entry_type_from_info(info) if info else ""
+        self._annotation_entry_type_cache[method] = result
+        return result
 
     def _check_entry_type_from_info(self, info: dict) -> str:
         """メソッド情報からエントリータイプを判定（ヘルパー）"""
@@ -1919,142 +2608,59 @@ class CallTreeVisualizer:
         if info.get("is_static") and "main" in info.get("class", "").lower():
             return "Main Method"
 
-        # テストメソッド
-        if any(
-            test in annotations
-            for test in [
-                "Test",
-                "TestTemplate",
-                "ParameterizedTest",
-                "RepeatedTest",
-                "TestFactory",
-            ]
-        ):
-            return "Test Method"
-
-        # Spring Controller
-        if any(
-            ctrl in annotations
-            for ctrl in [
-                "RequestMapping",
-                "GetMapping",
-                "PostMapping",
-                "PutMapping",
-                "DeleteMapping",
-                "PatchMapping",
-            ]
-        ):
-            return "HTTP Endpoint (Spring)"
+        # アノテーションのキーワードから判定（メソッド・クラスの各アノテーションを1回ずつ走査）
+        rule = _first_entry_type_rule(
+            _METHOD_ENTRY_TYPE_SCANNER, annotations, len(_ENTRY_TYPE_RULES)
+        )
+        rule = _first_entry_type_rule(
+            _CLASS_ENTRY_TYPE_SCANNER, class_annotations, rule
+        )
+        if rule < len(_ENTRY_TYPE_RULES):
+            return _ENTRY_TYPE_RULES[rule][2]
 
-        # クラスレベルのController
-        if any(ctrl in class_annotations for ctrl in ["Controller", "RestController"]):
-            return "HTTP Endpoint (Spring)"
-
-        # JAX-RS REST API
-        if any(
-            jax in annotations
-            for jax in ["Path", "GET", "POST", "PUT", "DELETE", "PATCH"]
-        ):
-            return "HTTP Endpoint (JAX-RS)"
-
-        # SOAP Webサービス
-        if "WebMethod" in annotations:
-            return "SOAP Endpoint (JAX-WS)"
-
-        if any(ws in class_annotations for ws in ["WebService", "WebServiceProvider"]):
-            return "SOAP Endpoint (JAX-WS)"
-
-        # Scheduled Job
-        if any(sched in annotations for sched in ["Scheduled", "Schedules", "Async"]):
-            return "Scheduled Job"
-
-        # Event Listener
-        if any(
-            evt in annotations
-            for evt in [
-                "EventListener",
-                "TransactionalEventListener",
-                "JmsListener",
-                "RabbitListener",
-                "KafkaListener",
-                "StreamListener",
-                "MessageMapping",
-                "SubscribeMapping",
-            ]
-        ):
-            return "Event Listener"
-
-        # Lifecycle
-        if any(
-            lc in annotations
-            for lc in [
-                "PostConstruct",
-                "PreDestroy",
-                "BeforeAll",
-                "AfterAll",
-                "BeforeEach",
-                "AfterEach",
-                "Before",
-                "After",
-                "BeforeClass",
-                "AfterClass",
-            ]
-        ):
-            return "Lifecycle Method"
-
-        # Bean Factory Method
-        if "Bean" in annotations:
-            return "Bean Factory"
-
-        # Servlet
-        if "WebServlet" in annotations or "WebServlet" in class_annotations:
-            return "Servlet"
-
-        # その他のpublicメソッド
-        if info.get("visibility") == "public":
-            return "Public Method"
+        # その他のpublicメソッド
+        if info.get("visibility") == "public":
+            return "Public Method"
 
         return "Unknown"
 
-    def _entry_priority(self, entry_type: str) -> int:
-        """エントリータイプの優先順位（小さいほど優先度が高い）"""
-        priority_map = {
-            "Main Method": 1,
-            "HTTP Endpoint (Spring)": 2,
-            "HTTP Endpoint (JAX-RS)": 3,
-            "SOAP Endpoint (JAX-WS)": 4,
-            "Servlet": 5,
-            "Spring Boot Runner": 6,
-            "Scheduled Job": 7,
-            "Event Listener": 8,
-            "Runnable/Callable": 9,
-            "Lifecycle Method": 10,
-            "Test Method": 11,
-            "Bean Factory": 12,
-            "Public Method": 13,
-            "Unknown": 14,
-        }
-        return priority_map.get(entry_type, 14)
-
     def search_methods(self, keyword: str):
         """キーワードでメソッドを検索"""
         print(f"\n検索結果: '{keyword}'")
         print(f"{'=' * 80}\n")
 
-        matches = []
-        for method in self.method_info.keys():
-            if keyword.lower() in method.lower():
-                info = self.method_info[method]
-                matches.append((method, info.get("class", "")))
+        keyword_lower = keyword.lower()
+        mi_class = self._mi_class
+        matches = [
+            (method, mi_class.get(method, ""))
+            for method, method_lower in self._get_method_names_lower()
+            if keyword_lower in method_lower
+        ]
 
         if not matches:
             print("該当するメソッドが見つかりませんでした", file=sys.stderr)
             return
 
+        # 出力行はバッファに溜め、最後にまとめて書き出す
+        lines: List[str] = []
         for i, (method, class_name) in enumerate(matches, 1):
-            print(f"{i}. {method}")
-            print(f"   クラス: {class_name}")
-            print()
+            lines.append(f"{i}. {method}")
+            lines.append(f"   クラス: {class_name}")
+            lines.append("")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
+
+    def _get_method_names_lower(self) -> Tuple[Tuple[str, str], ...]:
+        """(メソッドシグネチャ, 小文字化したシグネチャ) のタプルを返す
+
+        検索のたびに全メソッドのシグネチャを小文字化しないよう、初回に作ってキャッシュする
+        （読み込み後はmethod_infoが変化しないため無効化は不要）
+        """
+        if self._method_names_lower is None:
+            self._method_names_lower = tuple(
+                (method, method.lower()) for method in self.method_info
+            )
+        return self._method_names_lower
 
     def extract_sql_to_files(
         self, output_dir: str = "./found_sql", raw_mode: bool = False
@@ -2066,26 +2672,19 @@ class CallTreeVisualizer:
             output_dir: SQL出力先ディレクトリ
             raw_mode: Trueの場合、整形せずにそのまま出力
         """
-        import os
-        from pathlib import Path
-
         # 出力ディレクトリを作成
         Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-        # メソッド毎にSQL文を集約
-        method_sqls: Dict[str, List[str]] = defaultdict(list)
-
-        for method, info in self.method_info.items():
-            sql = info.get("sql", "")
-            if sql and sql.strip():
-                # SQL文を分割 (複数ある場合は " ||| " で連結されている)
-                sqls = [s.strip() for s in sql.split(" ||| ") if s.strip()]
-                method_sqls[method].extend(sqls)
+        # メソッド毎のSQL文（読み込み時に分割済み）
+        method_sqls = self._mi_sql_statements
 
         if not method_sqls:
             print("SQL文が見つかりませんでした", file=sys.stderr)
             return
 
+        # 同一SQL文の整形結果を使い回すためのキャッシュ（生SQL -> 整形後SQL）
+        formatted_cache: Dict[str, str] = {}
+
         # ファイル出力
         file_count = 0
         for method, sqls in method_sqls.items():
@@ -2094,14 +2693,20 @@ class CallTreeVisualizer:
             if len(sqls) == 1:
                 filename = f"{safe_name}.sql"
                 self._write_sql_file(
-                    os.path.join(output_dir, filename), sqls[0], raw_mode
+                    os.path.join(output_dir, filename),
+                    sqls[0],
+                    raw_mode,
+                    formatted_cache,
                 )
                 file_count += 1
             else:
                 for idx, sql in enumerate(sqls, 1):
                     filename = f"{safe_name}_{idx}.sql"
                     self._write_sql_file(
-                        os.path.join(output_dir, filename), sql, raw_mode
+                        os.path.join(output_dir, filename),
+                        sql,
+                        raw_mode,
+                        formatted_cache,
                     )
                     file_count += 1
 
@@ -2120,9 +2725,9 @@ class CallTreeVisualizer:
         name = method_signature.replace(
             "#", "."
         )  # メソッドとクラスの区切りをドットに変換
-        # Windowsでファイル名として安全でない文字をアンダースコアに変換
-        name = re.sub(r'[<>:"/\\|?*]', "_", name)
-        name = re.sub(r"_+", "_", name)  # 連続するアンダースコアを1つに
+        # Windowsでファイル名として安全でない文字をアンダースコアに変換し、
+        # 連続するアンダースコアを1つにする
+        name = _UNSAFE_FILENAME_RUN_RE.sub("_", name)
         name = name.strip("_")
         return name[:200]  # ファイル名の長さを制限
 
@@ -2138,37 +2743,24 @@ class CallTreeVisualizer:
             分割された文字列のリスト
         """
         parts = []
-        current_part = []
+        start = 0  # 現在のパートの開始位置
         paren_depth = 0
 
-        i = 0
-        while i < len(text):
-            char = text[i]
-
+        # 括弧とカンマ（直後のスペースを含む）の位置だけを順に辿り、パートは切り出す
+        for m in _PAREN_OR_COMMA_RE.finditer(text):
+            char = text[m.start()]
             if char == "(":
                 paren_depth += 1
-                current_part.append(char)
             elif char == ")":
                 paren_depth -= 1
-                current_part.append(char)
-            elif char == "," and paren_depth == 0:
-                # 括弧の外側のカンマを発見
-                # カンマの後のスペースもスキップ
-                parts.append("".join(current_part))
-                current_part = []
-                # カンマの後のスペースをスキップ
-                i += 1
-                while i < len(text) and text[i] == " ":
-                    i += 1
-                continue
-            else:
-                current_part.append(char)
-
-            i += 1
+            elif paren_depth == 0:
+                # 括弧の外側のカンマを発見（カンマの後のスペースはスキップ）
+                parts.append(text[start : m.start()])
+                start = m.end()
 
         # 最後の部分を追加
-        if current_part:
-            parts.append("".join(current_part))
+        if start < len(text):
+            parts.append(text[start:])
 
         # 各パートから末尾のカンマとスペースを削除
         # (呼び出し元でカンマを追加するため、二重カンマを防ぐ)
@@ -2192,7 +2784,7 @@ class CallTreeVisualizer:
 
             # 0. コメント除去 (/* ... */)
             # sqlparseの整形前に除去しないと、整形によってコメントの位置がおかしくなる可能性があるため
-            sql_text = re.sub(r"/\*[\s\S]*?\*/", "", sql_text)
+            sql_text = _SQL_BLOCK_COMMENT_RE.sub("", sql_text)
 
             # 1. sqlparseで基本整形
             # wrap_afterを大きめに設定し、FOR UPDATEなどが途中で改行されないようにする
@@ -2206,32 +2798,11 @@ class CallTreeVisualizer:
 
             # 1.5. FOR UPDATE が途中で改行されている場合、1行に結合
             # 例: "FOR\n  UPDATE" -> "FOR UPDATE"
-            formatted = re.sub(
-                r"\bFOR\s*\n\s*UPDATE\b", "FOR UPDATE", formatted, flags=re.IGNORECASE
-            )
+            formatted = _SPLIT_FOR_UPDATE_RE.sub("FOR UPDATE", formatted)
 
             # 2. カスタムルール適用（キーワード後の改行とインデント調整）
             lines = formatted.splitlines()
             new_lines = []
-            # 注意: キーワードは長いものから先にチェックされるよう順序づける
-            keywords = [
-                "SELECT",
-                "FROM",
-                "WHERE",
-                "GROUP BY",
-                "ORDER BY",
-                "HAVING",
-                "SET",
-                "VALUES",
-                "LEFT OUTER JOIN",
-                "RIGHT OUTER JOIN",
-                "LEFT JOIN",
-                "RIGHT JOIN",
-                "INNER JOIN",
-                "OUTER JOIN",
-                "JOIN",
-                "FOR UPDATE",
-            ]
 
             current_alignment_indent: Optional[str] = None
             replacement_indent: str = ""
@@ -2241,20 +2812,9 @@ class CallTreeVisualizer:
                 if current_alignment_indent is not None:
                     if line.startswith(current_alignment_indent):
                         content = line[len(current_alignment_indent) :]
-
-                        # 元の行が末尾にカンマを持っていたか確認
-                        has_trailing_comma = content.rstrip().endswith(",")
-
-                        # 括弧の外側のカンマのみで分割して1行1つにする
-                        parts = self._split_by_comma_outside_parens(content)
-                        for i, part in enumerate(parts):
-                            if i < len(parts) - 1:
-                                new_lines.append(replacement_indent + part + ",")
-                            elif has_trailing_comma:
-                                # 元々末尾にカンマがあった場合は保持
-                                new_lines.append(replacement_indent + part + ",")
-                            else:
-                                new_lines.append(replacement_indent + part)
+                        self._append_comma_separated_lines(
+                            new_lines, content, replacement_indent
+                        )
                         continue
                     else:
                         # インデントが変わったのでブロック終了
@@ -2264,46 +2824,25 @@ class CallTreeVisualizer:
                 stripped = line.lstrip()
                 base_indent = line[: len(line) - len(stripped)]
 
-                matched_keyword = None
-                prefix = ""
-
                 # キーワード判定（(SELECT のようなケースも考慮）
-                for kw in keywords:
-                    if stripped.startswith(kw + " "):
-                        matched_keyword = kw
-                        prefix = ""
-                        break
-                    if stripped.startswith("(" + kw + " "):
-                        matched_keyword = kw
-                        prefix = "("
-                        break
-
-                if matched_keyword:
+                m = _SQL_CLAUSE_RE.match(stripped)
+
+                if m:
+                    prefix = m.group(1) or ""
+                    matched_keyword = m.group(2)
                     # コンテンツは "PREFIX KEYWORD " の後ろから
-                    start_index = len(prefix) + len(matched_keyword) + 1
+                    start_index = m.end()
                     content = stripped[start_index:]
 
                     if content.strip():
                         # キーワード行を出力
                         new_lines.append(base_indent + prefix + matched_keyword)
 
-                        # 元の行が末尾にカンマを持っていたか確認
-                        has_trailing_comma = content.rstrip().endswith(",")
-
-                        # 括弧の外側のカンマのみで分割して1行1つにする
-                        parts = self._split_by_comma_outside_parens(content)
-
                         # 新しいインデントはベース + 2スペース
                         new_indent = base_indent + "  "
-
-                        for i, part in enumerate(parts):
-                            if i < len(parts) - 1:
-                                new_lines.append(new_indent + part + ",")
-                            elif has_trailing_comma:
-                                # 元々末尾にカンマがあった場合は保持
-                                new_lines.append(new_indent + part + ",")
-                            else:
-                                new_lines.append(new_indent + part)
+                        self._append_comma_separated_lines(
+                            new_lines, content, new_indent
+                        )
 
                         # sqlparseの整形で揃えられた後続行をキャッチするためのインデント長
                         # sqlparseはコンテンツの開始位置に合わせてインデントする
@@ -2328,8 +2867,33 @@ class CallTreeVisualizer:
             print(f"警告: SQL整形中にエラーが発生しました: {e}", file=sys.stderr)
             return sql_text
 
+    def _append_comma_separated_lines(
+        self, new_lines: List[str], content: str, indent: str
+    ) -> None:
+        """
+        括弧の外側のカンマのみで分割し、1行1つ（インデント付き、カンマ区切り）にして追加する。
+        分割した各行は改行で連結した1つの文字列として追加する
+        （呼び出し元で最後に改行で結合するため、行ごとに追加した場合と同じ結果になる）。
+
+        Args:
+            new_lines: 出力行のリスト
+            content: 分割対象の文字列
+            indent: 各行のインデント
+        """
+        parts = self._split_by_comma_outside_parens(content)
+        if not parts:
+            return
+
+        # 元の行が末尾にカンマを持っていた場合は保持
+        trailing_comma = "," if content.rstrip().endswith(",") else ""
+        new_lines.append(indent + (",\n" + indent).join(parts) + trailing_comma)
+
     def _write_sql_file(
-        self, filepath: str, sql_text: str, raw_mode: bool = False
+        self,
+        filepath: str,
+        sql_text: str,
+        raw_mode: bool = False,
+        formatted_cache: Optional[Dict[str, str]] = None,
     ) -> None:
         """
         SQL文をファイルに書き込み
@@ -2338,12 +2902,19 @@ class CallTreeVisualizer:
             filepath: 出力ファイルパス
             sql_text: SQL文
             raw_mode: Trueの場合、整形せずにそのまま出力
+            formatted_cache: 整形結果のキャッシュ（生SQL -> 整形後SQL）。
+                同一SQL文の再整形を避けるために使用
         """
         try:
             if raw_mode:
                 content = sql_text
-            else:
+            elif formatted_cache is None:
                 content = self._format_sql(sql_text)
+            else:
+                content = formatted_cache.get(sql_text)
+                if content is None:
+                    content = self._format_sql(sql_text)
+                    formatted_cache[sql_text] = content
 
             with open(filepath, "w", encoding="utf-8") as f:
                 f.write(content)
@@ -2363,9 +2934,6 @@ class CallTreeVisualizer:
             sql_dir: SQLファイルが格納されているディレクトリ
             table_list_file: テーブル一覧TSVファイルのパス
         """
-        import os
-        from pathlib import Path
-
         # テーブル一覧を読み込み
         if not os.path.exists(table_list_file):
             print(
@@ -2379,6 +2947,7 @@ class CallTreeVisualizer:
         if not table_list:
             print("警告: テーブル一覧が空です", file=sys.stderr)
             return
+        table_matchers = self._build_table_matchers(table_list)
 
         # SQLファイルを走査
         sql_dir_path = Path(sql_dir)
@@ -2388,7 +2957,7 @@ class CallTreeVisualizer:
             )
             return
 
-        sql_files = sorted(sql_dir_path.glob("*.sql"))
+        sql_files = _list_sql_files(sql_dir)
 
         if not sql_files:
             print(f"警告: SQLファイルが見つかりません: {sql_dir}", file=sys.stderr)
@@ -2397,33 +2966,35 @@ class CallTreeVisualizer:
         #  clipでコピーした結果をExcelに貼り付けられるにはShift_JISで出力する
         sys.stdout.reconfigure(encoding=self.output_tsv_encoding)
 
-        # ヘッダーを出力
-        print("SQLファイル名\t物理テーブル名\t論理テーブル名\t補足情報")
+        # ヘッダーを出力（出力行はバッファに溜め、最後にまとめて書き出す）
+        lines: List[str] = ["SQLファイル名\t物理テーブル名\t論理テーブル名\t補足情報"]
 
         # 各SQLファイルを解析
         for sql_file in sql_files:
             try:
-                with open(sql_file, "r", encoding="utf-8") as f:
+                with open(sql_file.path, "r", encoding="utf-8") as f:
                     sql_content = f.read()
 
                 # テーブルを検出
-                found_tables = self._find_tables_in_sql(sql_content, table_list)
+                found_tables = self._find_tables_in_sql(sql_content, table_matchers)
 
                 # 結果を出力
                 if found_tables:
                     for physical_name, logical_name, note in found_tables:
-                        print(
+                        lines.append(
                             f"{sql_file.name}\t{physical_name}\t{logical_name}\t{note}"
                         )
                 else:
                     # テーブルが見つからない場合も1行出力
-                    print(f"{sql_file.name}\t\t\t")
+                    lines.append(f"{sql_file.name}\t\t\t")
 
             except Exception as e:
                 print(
                     f"エラー: SQLファイルの読み込みに失敗しました ({sql_file.name}): {e}",
                     file=sys.stderr,
                 )
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
 
     def _load_table_list(self, table_list_file: str) -> List[tuple[str, str, str]]:
         """
@@ -2461,39 +3032,88 @@ class CallTreeVisualizer:
         return table_list
 
     def _find_tables_in_sql(
-        self, sql_content: str, table_list: List[tuple[str, str, str]]
+        self,
+        sql_content: str,
+        table_list: List[_TableMatcher],
     ) -> List[tuple[str, str, str]]:
         """
         SQL文からテーブルを検出
 
         Args:
             sql_content: SQL文
-            table_list: テーブル一覧
+            table_list: テーブル一覧（_build_table_matchersの結果）
 
         Returns:
             検出されたテーブル情報のリスト
         """
-        # SQL文を大文字化して検索
-        sql_upper = sql_content.upper()
+        # SQL文中の単語（英数字・アンダースコアの連続）を1回の走査で集め、大文字化する
+        # 英数字・アンダースコアだけからなるテーブル名が単語境界で一致するのは、
+        # いずれかの単語と等しい場合に限られるため、集合の参照で判定できる
+        if sql_content.isascii():
+            # ASCIIのみの場合は大文字化で単語の区切りが変わらないため、SQL文全体の
+            # 大文字化したコピーは作らず、重複を除いた単語だけを大文字化する。
+            # 記号を含むテーブル名はASCIIの大文字小文字を区別しないパターンで検索する
+            sql_text = sql_content
+            words = {word.upper() for word in set(_WORD_RE.findall(sql_content))}
+            pattern_index = 3
+        else:
+            # SQL文を大文字化して検索
+            sql_text = sql_content.upper()
+            words = set(_WORD_RE.findall(sql_text))
+            pattern_index = 2
 
         found_tables = []
         seen_tables = set()  # 重複を避けるため
 
-        for physical_name, logical_name, note in table_list:
-            # テーブル名を大文字化して検索
-            table_upper = physical_name.upper()
-
-            # 単語境界を考慮してテーブル名を検索
-            # テーブル名の前後が英数字でないことを確認
-            pattern = r"\b" + re.escape(table_upper) + r"\b"
+        for matcher in table_list:
+            physical_name, logical_name, note = matcher[0]
+            pattern = matcher[pattern_index]
+            if pattern is None:
+                found = matcher[1] in words
+            else:
+                # 記号を含むテーブル名は単語境界つきのパターンで検索
+                found = pattern.search(sql_text) is not None
 
-            if re.search(pattern, sql_upper):
+            if found:
                 if physical_name not in seen_tables:
                     found_tables.append((physical_name, logical_name, note))
                     seen_tables.add(physical_name)
 
         return found_tables
 
+    def _build_table_matchers(
+        self, table_list: List[tuple[str, str, str]]
+    ) -> List[_TableMatcher]:
+        """テーブル一覧の各テーブルについて、検索用の大文字化した名前を事前に作る
+
+        英数字・アンダースコア以外を含むテーブル名には、前後の単語境界を考慮した
+        パターンをコンパイルしておく（SQLファイルごとに作り直さないため）。
+        大文字化したSQL文用と、ASCIIのみのSQL文を大文字化せずに検索する用
+        （ASCIIの大文字小文字を区別しない）の2つを作る。
+
+        Returns:
+            ((物理テーブル名, 論理テーブル名, 補足情報), 大文字化したテーブル名,
+            パターン, ASCII用パターン) のリスト（単語のみからなる名前のパターンはNone）
+        """
+        matchers = []
+        for table in table_list:
+            # テーブル名を大文字化して検索
+            table_upper = table[0].upper()
+            if _WORD_RE.fullmatch(table_upper):
+                matchers.append((table, table_upper, None, None))
+            else:
+                # テーブル名の前後が英数字でないことを確認
+                pattern = r"\b" + re.escape(table_upper) + r"\b"
+                matchers.append(
+                    (
+                        table,
+                        table_upper,
+                        re.compile(pattern),
+                        re.compile(pattern, re.IGNORECASE | re.ASCII),
+                    )
+                )
+        return matchers
+
     def _extract_method_signature_parts(self, method_signature: str) -> Dict[str, str]:
         """
         メソッドシグネチャを分解
@@ -2502,34 +3122,36 @@ class CallTreeVisualizer:
             method_signature: メソッドシグネチャ (例: "com.example.service.UserService#getUser(String)")
 
         Returns:
-            各要素を含む辞書
+            各要素を含む辞書（メソッドごとにキャッシュした辞書を返すため、変更しないこと）
         """
-        if "#" not in method_signature:
-            return {
+        # 同じメソッドがツリーの各所・各エントリーポイントに現れるため結果をキャッシュする
+        cached = self._signature_parts_cache.get(method_signature)
+        if cached is not None:
+            return cached
+
+        class_part, sep, method_part = method_signature.partition("#")
+        if not sep:
+            result = {
                 "package": "",
                 "class": "",
                 "simple_class": "",
                 "method": method_signature,
                 "full_signature": method_signature,
             }
-
-        class_part, method_part = method_signature.split("#", 1)
-
-        # パッケージ名とクラス名を分離
-        if "." in class_part:
-            package = ".".join(class_part.split(".")[:-1])
-            simple_class = class_part.split(".")[-1]
         else:
-            package = ""
-            simple_class = class_part
-
-        return {
-            "package": package,
-            "class": class_part,
-            "simple_class": simple_class,
-            "method": method_part,
-            "full_signature": method_signature,
-        }
+            # パッケージ名とクラス名を分離
+            # （"."がない場合はパッケージ名が空、クラス名がそのままになる）
+            package, _, simple_class = class_part.rpartition(".")
+            result = {
+                "package": package,
+                "class": class_part,
+                "simple_class": simple_class,
+                "method": method_part,
+                "full_signature": method_signature,
+            }
+
+        self._signature_parts_cache[method_signature] = result
+        return result
 
     def _format_tree_display(self, method_signature: str) -> str:
         """
@@ -2546,7 +3168,7 @@ class CallTreeVisualizer:
         # _shorten_method_signatureを再利用
         return self._shorten_method_signature(method_signature)
 
-    def _collect_tree_data(
+    def _iter_tree_nodes(
         self,
         root_method: str,
         max_depth: int,
@@ -2557,48 +3179,65 @@ class CallTreeVisualizer:
         accumulated_instances: Optional[Set[str]] = None,  # 累積されたインスタンス情報
         max_depth_reached: Optional[List[bool]] = None,  # 最大深度到達フラグ
         caller_method: Optional[str] = None,  # 呼び元メソッド
-    ) -> List[Dict[str, any]]:
+    ) -> Iterator[Dict[str, any]]:
         """
-        1つの呼び出しツリーを再帰的にトラバースし、全メソッド情報を収集
+        1つの呼び出しツリーを再帰的にトラバースし、各メソッドの情報を順に返す
+
+        ツリー全体をリストにまとめず、訪問したノードをその場で返す（呼び出し側で
+        1ノードずつ出力できるようにするため）。max_depth_reachedはすべてのノードを
+        取り出し終えた後に参照すること。
 
         Args:
             root_method: ルートメソッド
             max_depth: 最大深度
             follow_implementations: 実装クラス候補を追跡するか
-            visited: 訪問済みメソッド集合（循環参照チェック用）
+            visited: 現在の呼び出し経路上のメソッド集合（循環参照チェック用。
+                トラバース全体で1つのセットを共有し、展開前に追加・展開後に削除する）
             depth: 現在の深度
             parent_relation: 呼び出し種別（"親クラスメソッド" / "インターフェース" / "実装クラス候補" / ""）
             accumulated_instances: 呼び出しツリーの上位から累積された生成インスタンス情報
             caller_method: 呼び元メソッド
 
-        Returns:
-            各メソッドの情報を含む辞書のリスト
+        Yields:
+            各メソッドの情報を含む辞書（深さ優先の訪問順）
         """
         if visited is None:
             visited = set()
 
-        result = []
-
         if depth > max_depth:
             # 最大深度に到達した場合、フラグをセット
             if max_depth_reached is not None:
                 max_depth_reached[0] = True
-            return result
+            return
 
-        # 除外ルールチェック
-        if not self.exclusion_manager.should_include(root_method):
-            return result
+        should_include = self.exclusion_manager.should_include
+
+        # 除外ルールチェック（子ノードは呼び出し元のループで判定済みのため、ルートのみ）
+        if depth == 0 and not should_include(root_method):
+            return
 
         # 現在のメソッドで生成されるインスタンスを収集し、累積に追加
-        current_instances = self._collect_created_instances(root_method)
+        # （累積は実装クラス候補の絞り込みにしか使わないため、追跡しない場合は
+        # デバッグ出力が必要なときだけ収集する）
         if accumulated_instances is None:
-            accumulated_instances = current_instances
-        else:
-            accumulated_instances.update(current_instances)
+            accumulated_instances = set()
+        if follow_implementations or self.debug_mode:
+            current_instances = self._collect_created_instances(root_method)
+            if self.debug_mode and current_instances:
+                print(
+                    self._format_created_instances_debug(root_method, current_instances)
+                )
+            if follow_implementations and current_instances:
+                accumulated_instances.update(current_instances)
 
         # 循環参照チェック
         is_circular = root_method in visited
 
+        # ツリー表示用のメソッド名（循環参照の場合は印を付けておく）
+        tree_display = self._format_tree_display(root_method)
+        if is_circular and tree_display:
+            tree_display += " [循環参照]"
+
         # メソッド情報を取得
         info = self.method_info.get(root_method, {})
         parts = self._extract_method_signature_parts(root_method)
@@ -2610,82 +3249,77 @@ class CallTreeVisualizer:
             else {"package": "", "class": "", "simple_class": "", "method": ""}
         )
 
-        # 現在のメソッドを結果に追加
-        result.append(
-            {
-                "depth": depth,
-                "method": root_method,
-                "package": parts["package"],
-                "class": parts["class"],
-                "simple_method": parts["method"],
-                "javadoc": info.get("javadoc", ""),
-                "parent_relation": parent_relation,
-                "sql": info.get("sql", ""),
-                "is_circular": is_circular,
-                "tree_display": self._format_tree_display(root_method),
-                "httpCalls": info.get("httpCalls", []),  # HTTPクライアント呼び出し情報
-                "hit_words": info.get("hit_words", ""),  # 検出ワード
-                "caller_method": caller_method or "",  # 呼び元メソッド
-                "caller_package": caller_parts["package"],  # 呼び元パッケージ名
-                "caller_class": caller_parts["class"],  # 呼び元クラス名
-                "caller_simple_method": caller_parts["method"],  # 呼び元メソッド名
-            }
-        )
+        # 現在のメソッドの情報を返す
+        yield {
+            "depth": depth,
+            "method": root_method,
+            "package": parts["package"],
+            "class": parts["class"],
+            "simple_class": parts["simple_class"],  # パッケージ名を除いたクラス名
+            "simple_method": parts["method"],
+            "javadoc": info.get("javadoc", ""),
+            "parent_relation": parent_relation,
+            "sql": info.get("sql", ""),
+            "is_circular": is_circular,
+            "tree_display": tree_display,
+            "http_details": info.get("http_details", ""),  # HTTPリクエストの表示文字列
+            "hit_words": info.get("hit_words", ""),  # 検出ワード
+            "caller_method": caller_method or "",  # 呼び元メソッド
+            "caller_package": caller_parts["package"],  # 呼び元パッケージ名
+            "caller_class": caller_parts["class"],  # 呼び元クラス名
+            # 呼び元クラス名（パッケージ名除去）
+            "caller_simple_class": caller_parts["simple_class"],
+            "caller_simple_method": caller_parts["method"],  # 呼び元メソッド名
+        }
 
         # 循環参照の場合は子ノードを展開しない
         if is_circular:
-            return result
-
-        visited_copy = visited.copy()
-        visited_copy.add(root_method)
+            return
 
         # 除外ルールで配下を除外する場合
         if self.exclusion_manager.should_exclude_children(root_method):
-            return result
+            return
 
-        # 子ノードを再帰的に処理
-        callees = self.forward_calls.get(root_method, [])
-        for callee_info in callees:
-            callee = callee_info["method"]
+        # 呼び出し経路に追加（子ノードの処理後に外す。経路ごとにセットをコピーしない）
+        visited.add(root_method)
 
+        # 子ノードを再帰的に処理
+        for callee, is_parent_method, callee_impls, implementations in zip(
+            self._fwd_methods.get(root_method, ()),
+            self._fwd_is_parent.get(root_method, ()),
+            self._fwd_impls.get(root_method, ()),
+            self._fwd_impl_classes.get(root_method, ()),
+        ):
             # Iモード: 除外対象の場合、ノード自体を表示せずスキップ
-            if not self.exclusion_manager.should_include(callee):
+            if not should_include(callee):
                 continue
 
             # 呼び出し種別を判定
             # 1. 親クラスのメソッドの場合: 親クラス
             # 2. インターフェースのメソッドの場合: 実装クラス側で「インターフェース」を設定
-            if callee_info["is_parent_method"] == "Yes":
+            if is_parent_method:
                 relation = "親クラスメソッド"
-            elif callee_info["implementations"]:
+            elif callee_impls:
                 # 実装がある＝インターフェースまたは抽象クラスのメソッド
                 relation = "インターフェース"
             else:
                 relation = ""
 
             # 呼び出し先を再帰的に収集
-            result.extend(
-                self._collect_tree_data(
-                    callee,
-                    max_depth,
-                    follow_implementations,
-                    visited_copy.copy(),
-                    depth + 1,
-                    relation,
-                    accumulated_instances,  # 累積インスタンスを渡す
-                    max_depth_reached,  # 最大深度到達フラグを渡す
-                    root_method,  # 呼び元メソッドを渡す
-                )
+            yield from self._iter_tree_nodes(
+                callee,
+                max_depth,
+                follow_implementations,
+                visited,
+                depth + 1,
+                relation,
+                accumulated_instances,  # 累積インスタンスを渡す
+                max_depth_reached,  # 最大深度到達フラグを渡す
+                root_method,  # 呼び元メソッドを渡す
             )
 
             # 実装クラス候補がある場合
-            if follow_implementations and callee_info["implementations"]:
-                implementations = [
-                    impl.strip().split(" ")[0]
-                    for impl in callee_info["implementations"].split(",")
-                    if impl.strip()
-                ]
-
+            if follow_implementations and callee_impls:
                 # 累積されたインスタンス情報に基づいてフィルタリング
                 if accumulated_instances:
                     filtered_implementations = (
@@ -2700,24 +3334,117 @@ class CallTreeVisualizer:
                     impl_method = self._find_implementation_method(callee, impl_class)
                     if impl_method:
                         # Iモード: 除外対象の場合、ノード自体を表示せずスキップ
-                        if not self.exclusion_manager.should_include(impl_method):
+                        if not should_include(impl_method):
                             continue
 
-                        result.extend(
-                            self._collect_tree_data(
-                                impl_method,
+                        yield from self._iter_tree_nodes(
+                            impl_method,
+                            max_depth,
+                            follow_implementations,
+                            visited,
+                            depth + 1,
+                            "実装クラス候補",
+                            accumulated_instances,  # 累積インスタンスを渡す
+                            max_depth_reached,  # 最大深度到達フラグを渡す
+                            root_method,  # 呼び元メソッドを渡す
+                        )
+
+        # 呼び出し経路から外す（兄弟ノードの循環参照判定に影響させない）
+        visited.discard(root_method)
+
+    def _iter_tree_data(
+        self,
+        entry_points: List[str],
+        max_depth: int,
+        follow_implementations: bool,
+        jobs: int = 1,
+        show_progress: bool = False,
+    ) -> Iterator[Tuple[Iterable[Dict[str, any]], List[bool]]]:
+        """
+        エントリーポイントごとのツリーデータを順に収集する
+
+        逐次処理の場合、ツリーデータはノードを順に返すイテレータで、最大深度到達フラグは
+        ツリーデータを取り出し終えた時点で確定する（次のエントリーポイントに進む前に
+        ツリーデータを最後まで取り出すこと）。
+        jobsが2以上の場合はエントリーポイント単位でプロセス並列に収集する。
+        各ワーカープロセスは入力ファイルを1回だけ読み込み、結果はエントリーポイントの順に返す。
+        収集済みのツリーデータが溜まらないよう、同時に投入するタスクは
+        jobs * _PARALLEL_TASKS_PER_JOB 件までとし、結果を1件取り出すごとに次を投入する。
+
+        Args:
+            entry_points: エントリーポイントのリスト
+            max_depth: 最大深度
+            follow_implementations: 実装クラス候補を追跡するか
+            jobs: 並列プロセス数（1以下の場合は逐次処理）
+            show_progress: 処理中のエントリーポイントを表示するか
+                （_PROGRESS_FLUSH_INTERVAL件ごとにまとめて書き出す）
+
+        Yields:
+            (ツリーデータ, 最大深度到達フラグ（[True]なら到達）)のタプル
+        """
+        if jobs <= 1 or len(entry_points) <= 1:
+            for count, entry_point in enumerate(entry_points, 1):
+                if show_progress:
+                    print(f"  処理中: {entry_point}")
+                    if count % _PROGRESS_FLUSH_INTERVAL == 0:
+                        sys.stdout.flush()
+
+                # 最大深度到達フラグを初期化
+                max_depth_reached_flag: List[bool] = [False]
+
+                tree_nodes = self._iter_tree_nodes(
+                    entry_point,
+                    max_depth,
+                    follow_implementations,
+                    max_depth_reached=max_depth_reached_flag,
+                )
+                yield tree_nodes, max_depth_reached_flag
+            return
+
+        from concurrent.futures import Future, ProcessPoolExecutor
+
+        max_in_flight = jobs * _PARALLEL_TASKS_PER_JOB
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_tree_worker,
+            initargs=(
+                self.input_file,
+                self.exclusion_file,
+                self.output_tsv_encoding,
+                self.debug_mode,
+            ),
+        ) as executor:
+            # 投入済みで結果を取り出していないタスク（エントリーポイントの順）
+            pending: Deque[Future] = deque(
+                executor.submit(
+                    _collect_tree_data_worker,
+                    (entry_point, max_depth, follow_implementations),
+                )
+                for entry_point in entry_points[:max_in_flight]
+            )
+            for count, entry_point in enumerate(entry_points, 1):
+                tree_data, max_depth_reached, output = pending.popleft().result()
+                # 取り出した分だけ次のタスクを投入する（ワーカーを遊ばせないよう出力前に行う）
+                next_index = count - 1 + max_in_flight
+                if next_index < len(entry_points):
+                    pending.append(
+                        executor.submit(
+                            _collect_tree_data_worker,
+                            (
+                                entry_points[next_index],
                                 max_depth,
                                 follow_implementations,
-                                visited_copy.copy(),
-                                depth + 1,
-                                "実装クラス候補",
-                                accumulated_instances,  # 累積インスタンスを渡す
-                                max_depth_reached,  # 最大深度到達フラグを渡す
-                                root_method,  # 呼び元メソッドを渡す
-                            )
+                            ),
                         )
-
-        return result
+                    )
+                if show_progress:
+                    print(f"  処理中: {entry_point}")
+                    if count % _PROGRESS_FLUSH_INTERVAL == 0:
+                        sys.stdout.flush()
+                # ワーカーでバッファしたデバッグ出力をエントリーポイントの順に出力
+                if output:
+                    sys.stdout.write(output)
+                yield tree_data, [max_depth_reached]
 
     def export_tree_to_csv(
         self,
@@ -2726,6 +3453,9 @@ class CallTreeVisualizer:
         max_depth: int = 20,
         follow_implementations: bool = True,
         unique: bool = False,
+        jobs: int = 1,
+        compress: bool = False,
+        output_format: str = "csv",
     ) -> None:
         """
         CSV形式でエントリーポイントからの呼び出しメソッド一覧をエクスポート
@@ -2736,7 +3466,25 @@ class CallTreeVisualizer:
             max_depth: 最大深度
             follow_implementations: 実装クラス候補を追跡するか
             unique: 同じ呼び元・呼び先の組み合わせは一度しか出力しないか
+            jobs: ツリーデータ収集の並列プロセス数（1以下の場合は逐次処理）
+            compress: gzip形式で圧縮して出力するか（CSV形式の場合のみ）
+            output_format: 出力形式（"csv" / "feather" / "parquet"）。
+                feather / parquet の場合は出力ファイルの指定が必要
         """
+        if output_format != "csv":
+            if not output_file:
+                print(
+                    f"エラー: {output_format}形式で出力する場合は -o で出力ファイルを指定してください",
+                    file=sys.stderr,
+                )
+                return
+            if compress:
+                print(
+                    "エラー: --gzip はCSV形式で出力する場合のみ指定できます",
+                    file=sys.stderr,
+                )
+                return
+
         # エントリーポイントの決定
         entry_points: List[str] = []
 
@@ -2756,14 +3504,12 @@ class CallTreeVisualizer:
                 return
         else:
             # 厳密モードのエントリーポイントを取得
-            all_callees = set()
-            for callees in self.forward_calls.values():
-                for callee_info in callees:
-                    all_callees.add(callee_info["method"])
-
-            for method, info in self.method_info.items():
-                if method not in all_callees and info.get("is_entry_point"):
-                    entry_points.append(method)
+            all_callees = self._all_callees
+            entry_points = [
+                method
+                for method, info in self.method_info.items()
+                if method not in all_callees and info.get("is_entry_point")
+            ]
 
         if not entry_points:
             print("警告: エントリーポイントが見つかりませんでした", file=sys.stderr)
@@ -2787,6 +3533,8 @@ class CallTreeVisualizer:
             "呼び先メソッドのメソッド名",
         ]
 
+        # 同じメソッドはツリーの各所に現れるため、結果をメモ化する
+        @functools.lru_cache(maxsize=None)
         def extract_method_name_only(method_with_params: str) -> str:
             """メソッド名から引数を除去する"""
             # method(params) -> method
@@ -2795,51 +3543,35 @@ class CallTreeVisualizer:
                 return method_with_params[:paren_pos]
             return method_with_params
 
-        # 出力先を決定
-        if output_file:
-            try:
-                f = open(output_file, "w", encoding="Shift_JIS", newline="")
-            except Exception as e:
-                print(f"エラー: ファイルを開けません: {e}", file=sys.stderr)
-                return
-        else:
-            # 標準出力の場合もShift_JISにreconfigure
-            sys.stdout.reconfigure(encoding="Shift_JIS")
-            f = sys.stdout
-
-        try:
-            writer = csv.writer(f)
-            writer.writerow(headers)
-
-            # 最大深度に到達したエントリーポイントを追跡
-            max_depth_reached_entries: List[str] = []
+        # 最大深度に到達したエントリーポイントを追跡
+        max_depth_reached_entries: List[str] = []
 
+        def iter_rows() -> Iterator[list]:
+            """呼び出しメソッド1件ごとの出力行を、エントリーポイントの順に返す"""
             # 全体の通番
             row_number = 0
 
-            for entry_point in entry_points:
+            # ツリーデータを収集（並列処理の場合もエントリーポイントの順に返される）
+            tree_results = self._iter_tree_data(
+                entry_points, max_depth, follow_implementations, jobs
+            )
+
+            for entry_point, (tree_data, max_depth_reached) in zip(
+                entry_points, tree_results
+            ):
                 # 出力済みの呼び元・呼び先の組み合わせ（エントリーポイント毎に初期化）
                 seen_pairs: Set[tuple] = set()
-                # エントリーポイント自身の情報を分解
+                # エントリーポイント自身の情報を分解（各行に共通の列としてまとめておく）
                 ep_parts = self._extract_method_signature_parts(entry_point)
-                ep_method_name = extract_method_name_only(ep_parts["method"])
-
-                # 最大深度到達フラグを初期化
-                max_depth_reached_flag: List[bool] = [False]
-
-                # ツリーデータを収集
-                tree_data = self._collect_tree_data(
-                    entry_point,
-                    max_depth,
-                    follow_implementations,
-                    max_depth_reached=max_depth_reached_flag,
+                ep_columns = (
+                    entry_point,  # エントリーポイント（fully qualified name）
+                    ep_parts["package"],  # エントリーポイントのパッケージ名
+                    ep_parts["simple_class"],  # エントリーポイントのクラス名
+                    # エントリーポイントのメソッド名
+                    extract_method_name_only(ep_parts["method"]),
                 )
 
-                # 最大深度に到達した場合、エントリーポイントを記録
-                if max_depth_reached_flag[0]:
-                    max_depth_reached_entries.append(entry_point)
-
-                # 各メソッドについてCSV行を出力
+                # 各メソッドについて出力行を返す
                 for node in tree_data:
                     # ユニークオプションが指定されている場合、既に出力済みの組み合わせはスキップ
                     if unique:
@@ -2856,53 +3588,118 @@ class CallTreeVisualizer:
                         if node["caller_simple_method"]
                         else ""
                     )
-                    # 呼び元クラス名（パッケージ名除去）
-                    caller_class = (
-                        node["caller_class"].split(".")[-1]
-                        if node["caller_class"]
-                        else ""
-                    )
 
                     row_number += 1
-                    row = [
+                    yield [
                         row_number,  # No.（全体の通番）
-                        entry_point,  # エントリーポイント（fully qualified name）
-                        ep_parts["package"],  # エントリーポイントのパッケージ名
-                        ep_parts["simple_class"],  # エントリーポイントのクラス名
-                        ep_method_name,  # エントリーポイントのメソッド名
+                        *ep_columns,  # エントリーポイントの各列
                         node["depth"],  # 深度
                         node["caller_method"],  # 呼び元メソッド（fully qualified name）
                         node["caller_package"],  # 呼び元メソッドのパッケージ名
-                        caller_class,  # 呼び元メソッドのクラス名
+                        node["caller_simple_class"],  # 呼び元メソッドのクラス名
                         caller_method_name,  # 呼び元メソッドのメソッド名
                         node["method"],  # 呼び先メソッド（fully qualified name）
                         node["package"],  # 呼び先メソッドのパッケージ名
-                        (
-                            node["class"].split(".")[-1] if node["class"] else ""
-                        ),  # 呼び先メソッドのクラス名
+                        node["simple_class"],  # 呼び先メソッドのクラス名
                         callee_method_name,  # 呼び先メソッドのメソッド名
                     ]
-                    writer.writerow(row)
+
+                # 最大深度に到達した場合、エントリーポイントを記録
+                # （フラグはツリーデータを取り出し終えた時点で確定する）
+                if max_depth_reached[0]:
+                    max_depth_reached_entries.append(entry_point)
+
+        if output_format != "csv":
+            # feather / parquet 形式で出力（No.と深度の列は整数）
+            if not _write_arrow_file(
+                output_file, output_format, headers, {"No.", "深度"}, iter_rows()
+            ):
+                return
+            print(
+                f"{output_format}形式で {output_file} にエクスポートしました",
+                file=sys.stderr,
+            )
+        else:
+            # 出力先を決定
+            if compress:
+                import gzip
+
+                # gzip形式で圧縮して出力（標準出力の場合は圧縮したバイト列を書き出す）
+                try:
+                    if output_file:
+                        f = gzip.open(
+                            output_file, "wt", encoding="Shift_JIS", newline=""
+                        )
+                    else:
+                        sys.stdout.flush()
+                        f = io.TextIOWrapper(
+                            gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb"),
+                            encoding="Shift_JIS",
+                            newline="",
+                        )
+                except Exception as e:
+                    print(f"エラー: ファイルを開けません: {e}", file=sys.stderr)
+                    return
+            elif output_file:
+                try:
+                    f = open(
+                        output_file,
+                        "w",
+                        encoding="Shift_JIS",
+                        newline="",
+                        buffering=_CSV_WRITE_BUFFER_SIZE,
+                    )
+                except Exception as e:
+                    print(f"エラー: ファイルを開けません: {e}", file=sys.stderr)
+                    return
+            else:
+                # 標準出力の場合もShift_JISにreconfigure
+                sys.stdout.reconfigure(encoding="Shift_JIS")
+                f = sys.stdout
+
+            # 標準出力の場合は、端末でも1行ごとにフラッシュせず、バッファが一杯になったときに
+            # 書き出す（行バッファリングの設定は書き込み後に元に戻す）
+            with (
+                _stdout_without_line_buffering()
+                if f is sys.stdout
+                else contextlib.nullcontext()
+            ):
+                try:
+                    writer = csv.writer(f)
+                    writer.writerow(headers)
+
+                    # 書き込み待ちの行（一定行数ごとにwriterowsでまとめて書き込む）
+                    batch: List[list] = []
+                    for row in iter_rows():
+                        batch.append(row)
+                        if len(batch) >= _CSV_WRITE_BATCH_ROWS:
+                            writer.writerows(batch)
+                            batch.clear()
+
+                    # 残りの行を書き込み
+                    if batch:
+                        writer.writerows(batch)
+                finally:
+                    # 標準出力へのgzip出力も閉じる（圧縮データの末尾を書き出す。標準出力は閉じない）
+                    if f is not sys.stdout:
+                        f.close()
 
             if output_file:
                 print(f"CSVを {output_file} にエクスポートしました", file=sys.stderr)
 
-            # 最大深度に到達したエントリーポイントの警告を出力
-            if max_depth_reached_entries:
-                print(
-                    f"\n警告: 以下のエントリーポイントは最大深度({max_depth})に到達しました。"
-                    "ツリーが切り捨てられている可能性があります:",
-                    file=sys.stderr,
-                )
-                for ep in max_depth_reached_entries:
-                    print(f"  - {ep}", file=sys.stderr)
-                print(
-                    "ヒント: --depth オプションで深度を増やすことを検討してください。",
-                    file=sys.stderr,
-                )
-        finally:
-            if output_file and f != sys.stdout:
-                f.close()
+        # 最大深度に到達したエントリーポイントの警告を出力
+        if max_depth_reached_entries:
+            print(
+                f"\n警告: 以下のエントリーポイントは最大深度({max_depth})に到達しました。"
+                "ツリーが切り捨てられている可能性があります:",
+                file=sys.stderr,
+            )
+            for ep in max_depth_reached_entries:
+                print(f"  - {ep}", file=sys.stderr)
+            print(
+                "ヒント: --depth オプションで深度を増やすことを検討してください。",
+                file=sys.stderr,
+            )
 
     def export_tree_to_excel(
         self,
@@ -2913,6 +3710,8 @@ class CallTreeVisualizer:
         include_tree: bool = True,
         include_sql: bool = True,
         split_by_class: bool = True,
+        jobs: int = 1,
+        segment_size: int = 250000,
     ) -> None:
         """
         Excel形式でツリーをエクスポート
@@ -2925,7 +3724,19 @@ class CallTreeVisualizer:
             include_tree: L列以降の呼び出しツリーを出力するか
             include_sql: AZ列のSQL文を出力するか
             split_by_class: クラス単位でファイルを分割するか（デフォルト: True）
+            jobs: ツリーデータ収集の並列プロセス数（1以下の場合は逐次処理）
+            segment_size: 1ファイルあたりのデータ行数の上限（0以下の場合は分割しない）
+                超えた場合は「出力ファイル名.partN.xlsx」に分けて保存する
         """
+        # 利用可否の確認のみ（実際のインポートはワークブック作成時に行う）
+        if importlib.util.find_spec("xlsxwriter") is None:
+            print(
+                "エラー: xlsxwriterがインストールされていません。Excel形式で出力できません。",
+                file=sys.stderr,
+            )
+            print("  インストール: pip install xlsxwriter", file=sys.stderr)
+            return
+
         # エントリーポイントの決定
         entry_points: List[str] = []
 
@@ -2945,14 +3756,12 @@ class CallTreeVisualizer:
                 return
         else:
             # 厳密モードのエントリーポイントを取得
-            all_callees = set()
-            for callees in self.forward_calls.values():
-                for callee_info in callees:
-                    all_callees.add(callee_info["method"])
-
-            for method, info in self.method_info.items():
-                if method not in all_callees and info.get("is_entry_point"):
-                    entry_points.append(method)
+            all_callees = self._all_callees
+            entry_points = [
+                method
+                for method, info in self.method_info.items()
+                if method not in all_callees and info.get("is_entry_point")
+            ]
 
         if not entry_points:
             print("警告: エントリーポイントが見つかりませんでした", file=sys.stderr)
@@ -2960,128 +3769,136 @@ class CallTreeVisualizer:
 
         print(f"エントリーポイント数: {len(entry_points)}")
 
-        # クラス単位でエントリーポイントをグループ化
-        from collections import defaultdict
-
-        class_to_entries: Dict[str, List[str]] = defaultdict(list)
-        for ep in entry_points:
-            if "#" in ep:
-                class_name = ep.split("#")[0]
-            else:
-                class_name = "unknown"
-            class_to_entries[class_name].append(ep)
-
-        print(f"クラス数: {len(class_to_entries)}")
-
-        # 出力ファイル名のベースと拡張子を分離
-        import os
-
-        base_name, ext = os.path.splitext(output_file)
-        if not ext:
-            ext = ".xlsx"
-
-        # 最大深度に到達したエントリーポイントを追跡（全体）
-        all_max_depth_reached_entries: List[str] = []
-
-        # サマリー情報
-        summary_info: List[tuple[str, str, int]] = []  # (クラス名, ファイル名, 行数)
-
-        if split_by_class:
-            # === 分割モード: クラスごとに別ファイルに保存 ===
-            for class_name, class_entries in class_to_entries.items():
-                # ファイル名を生成（クラスの完全修飾名を使用）
-                safe_class_name = class_name.replace("$", "_")  # 内部クラスの$を_に変換
-                class_output_file = f"{base_name}_{safe_class_name}{ext}"
-
-                print(f"\n処理中: {class_name} ({len(class_entries)}メソッド)")
-
-                # ワークブックを作成
-                wb, ws = self._create_excel_workbook_with_styles(
-                    max_depth, include_tree, include_sql
+        # 処理中の表示はエントリーポイントごとに端末へ書き出さず、まとめて書き出す
+        # （_iter_tree_dataで一定件数ごと、分割モードではファイル保存ごとにフラッシュする。
+        # 標準出力の設定はエクスポートの終了時に元に戻す）
+        with _stdout_without_line_buffering():
+            # クラス単位でエントリーポイントをグループ化
+            class_to_entries: Dict[str, List[str]] = defaultdict(list)
+            for ep in entry_points:
+                class_name, sep, _ = ep.partition("#")
+                if not sep:
+                    class_name = "unknown"
+                class_to_entries[class_name].append(ep)
+
+            print(f"クラス数: {len(class_to_entries)}")
+
+            # 出力ファイル名のベースと拡張子を分離
+            base_name, ext = os.path.splitext(output_file)
+            if not ext:
+                ext = ".xlsx"
+
+            # 最大深度に到達したエントリーポイントを追跡（全体）
+            all_max_depth_reached_entries: List[str] = []
+
+            # サマリー情報（クラス名, ファイル名, データ行数）
+            summary_info: List[tuple[str, str, int]] = []
+
+            if split_by_class:
+                # === 分割モード: クラスごとに別ファイルに保存 ===
+                # ツリーデータはクラス順に並べた全エントリーポイント分をまとめて収集する
+                # （並列処理の場合にワーカープロセスをクラスごとに作り直さないため）
+                tree_results = self._iter_tree_data(
+                    [ep for eps in class_to_entries.values() for ep in eps],
+                    max_depth,
+                    follow_implementations,
+                    jobs,
+                    show_progress=True,
                 )
+                for class_name, class_entries in class_to_entries.items():
+                    # ファイル名を生成（クラスの完全修飾名を使用）
+                    # 内部クラスの$を_に変換
+                    safe_class_name = class_name.replace("$", "_")
+                    class_output_file = f"{base_name}_{safe_class_name}{ext}"
+
+                    print(f"\n処理中: {class_name} ({len(class_entries)}メソッド)")
+
+                    # エントリーポイントをExcelに書き込み、保存
+                    output_files, max_depth_reached_entries = self._write_excel_files(
+                        class_output_file,
+                        class_entries,
+                        tree_results,
+                        max_depth,
+                        follow_implementations,
+                        include_tree,
+                        include_sql,
+                        segment_size,
+                    )
+                    all_max_depth_reached_entries.extend(max_depth_reached_entries)
+
+                    # サマリー情報を記録
+                    for file_name, row_count in output_files:
+                        summary_info.append((class_name, file_name, row_count))
+
+                # サマリーを標準出力に表示
+                print("\n" + "=" * 60)
+                print("出力サマリー")
+                print("=" * 60)
+                total_rows = 0
+                for class_name, file_name, row_count in summary_info:
+                    print(f"  {class_name}")
+                    print(f"    -> {file_name} ({row_count}行)")
+                    total_rows += row_count
+                print("-" * 60)
+                print(f"総ファイル数: {len(summary_info)}")
+                print(f"総行数: {total_rows}")
+                print("=" * 60)
 
-                # エントリーポイントをExcelに書き込み
-                current_row, max_depth_reached_entries = self._write_entries_to_excel(
-                    ws,
-                    class_entries,
+            else:
+                # === 単一ファイルモード: 従来の動作 ===
+                # すべてのエントリーポイントをExcelに書き込み、保存
+                output_files, max_depth_reached_entries = self._write_excel_files(
+                    output_file,
+                    entry_points,
+                    self._iter_tree_data(
+                        entry_points,
+                        max_depth,
+                        follow_implementations,
+                        jobs,
+                        show_progress=True,
+                    ),
                     max_depth,
                     follow_implementations,
                     include_tree,
                     include_sql,
+                    segment_size,
                 )
                 all_max_depth_reached_entries.extend(max_depth_reached_entries)
 
-                # ワークブックを仕上げて保存
-                self._finalize_excel_workbook(
-                    wb, ws, current_row, max_depth, class_output_file
+                for file_name, _ in output_files:
+                    print(f"ツリーを {file_name} にエクスポートしました")
+                print(f"総行数: {sum(row_count for _, row_count in output_files)}")
+
+            # 最大深度に到達したエントリーポイントの警告を出力
+            if all_max_depth_reached_entries:
+                print(
+                    f"\n警告: 以下のエントリーポイントは最大深度({max_depth})に到達しました。"
+                    "ツリーが切り捨てられている可能性があります:",
+                    file=sys.stderr,
+                )
+                for ep in all_max_depth_reached_entries:
+                    print(f"  - {ep}", file=sys.stderr)
+                print(
+                    "ヒント: --depth オプションで深度を増やすことを検討してください。",
+                    file=sys.stderr,
                 )
 
-                # サマリー情報を記録
-                summary_info.append((class_name, class_output_file, current_row - 1))
-
-                # メモリを解放
-                del wb
-                del ws
-
-            # サマリーを標準出力に表示
-            print("\n" + "=" * 60)
-            print("出力サマリー")
-            print("=" * 60)
-            total_rows = 0
-            for class_name, file_name, row_count in summary_info:
-                print(f"  {class_name}")
-                print(f"    -> {file_name} ({row_count}行)")
-                total_rows += row_count
-            print("-" * 60)
-            print(f"総ファイル数: {len(summary_info)}")
-            print(f"総行数: {total_rows}")
-            print("=" * 60)
+    def _create_excel_workbook_with_styles(
+        self,
+        max_depth: int,
+        include_tree: bool,
+        include_sql: bool,
+    ) -> tuple[
+        "xlsxwriter.Workbook",
+        "xlsxwriter.worksheet.Worksheet",
+        Dict[str, "xlsxwriter.format.Format"],
+    ]:
+        """
+        スタイル設定済みのExcelワークブックを作成（1～2行目のヘッダまで書き込み済み）
 
-        else:
-            # === 単一ファイルモード: 従来の動作 ===
-            wb, ws = self._create_excel_workbook_with_styles(
-                max_depth, include_tree, include_sql
-            )
-
-            # すべてのエントリーポイントをExcelに書き込み
-            current_row, max_depth_reached_entries = self._write_entries_to_excel(
-                ws,
-                entry_points,
-                max_depth,
-                follow_implementations,
-                include_tree,
-                include_sql,
-            )
-            all_max_depth_reached_entries.extend(max_depth_reached_entries)
-
-            # ワークブックを仕上げて保存
-            self._finalize_excel_workbook(wb, ws, current_row, max_depth, output_file)
-
-            print(f"ツリーを {output_file} にエクスポートしました")
-            print(f"総行数: {current_row - 1}")
-
-        # 最大深度に到達したエントリーポイントの警告を出力
-        if all_max_depth_reached_entries:
-            print(
-                f"\n警告: 以下のエントリーポイントは最大深度({max_depth})に到達しました。"
-                "ツリーが切り捨てられている可能性があります:",
-                file=sys.stderr,
-            )
-            for ep in all_max_depth_reached_entries:
-                print(f"  - {ep}", file=sys.stderr)
-            print(
-                "ヒント: --depth オプションで深度を増やすことを検討してください。",
-                file=sys.stderr,
-            )
-
-    def _create_excel_workbook_with_styles(
-        self,
-        max_depth: int,
-        include_tree: bool,
-        include_sql: bool,
-    ) -> tuple[openpyxl.Workbook, openpyxl.worksheet.worksheet.Worksheet]:
-        """
-        スタイル設定済みのExcelワークブックを作成
+        行を順に書き出すだけのため、constant_memoryモードのワークブックを使用する
+        （書き込みが終わった行はその都度一時ファイルへ書き出し、全セルをメモリに保持しない）。
+        出力ファイル名は保存時に決まるため、ワークブックはメモリ上に作成する
 
         Args:
             max_depth: 最大深度
@@ -3089,87 +3906,63 @@ class CallTreeVisualizer:
             include_sql: SQL文を出力するか
 
         Returns:
-            (ワークブック, ワークシート)のタプル
+            (ワークブック, ワークシート, スタイル名 -> セルの書式)のタプル。
+            データ行のスタイルには背景色をライトグレーにした "<スタイル名>_gray" も含む
         """
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        if not isinstance(ws, openpyxl.worksheet.worksheet.Worksheet):
-            raise TypeError("Active sheet is not a Worksheet")
-
-        # 背景色（薄めのオリーブ）と罫線（破線）を定義
-        olive_fill = PatternFill(
-            start_color="C4D79B", end_color="C4D79B", fill_type="solid"
-        )
-        dashed_border = Border(
-            left=Side(style="dashed", color="000000"),
-            right=Side(style="dashed", color="000000"),
-            top=Side(style="dashed", color="000000"),
-            bottom=Side(style="dashed", color="000000"),
+        import xlsxwriter
+
+        # 分割しない場合などに4GiBを超えても保存できるよう、ZIP64拡張を許可する
+        wb = xlsxwriter.Workbook(
+            io.BytesIO(), {"constant_memory": True, "use_zip64": True}
         )
+        ws = wb.add_worksheet()
+
+        # 各スタイルで共通の書式（フォント、アライメント、罫線（破線））
+        base_properties: Dict[str, Union[str, int, bool]] = {
+            "font_name": "Meiryo UI",
+            "align": "left",
+            "valign": "vcenter",
+            "border": 3,
+            "border_color": "#000000",
+        }
 
-        # NamedStyleを作成（フォントとアライメントを定義）
-        default_style = NamedStyle(name="default_style")
-        default_style.font = Font(name="Meiryo UI")
-        default_style.alignment = Alignment(vertical="center", horizontal="left")
-        default_style.border = dashed_border
+        # スタイル名 -> 共通の書式に追加する設定
+        style_properties: Dict[str, Dict[str, Union[str, int, bool]]] = {
+            "default_style": {},
+            "green_style": {"font_color": "#008000"},
+            # L列用スタイル（太字）
+            "tree_style": {"bold": True},
+            # インターフェース用スタイル（斜体、グレー）
+            "interface_style": {"italic": True, "font_color": "#808080"},
+            # 実装クラス候補用スタイル（下線）
+            "impl_style": {"underline": 1},
+            # F列（呼び出し種別）用スタイル（縮小して全体を表示）
+            "shrink_style": {"shrink": True},
+        }
 
-        green_style = NamedStyle(name="green_style")
-        green_style.font = Font(name="Meiryo UI", color="008000")
-        green_style.alignment = Alignment(vertical="center", horizontal="left")
-        green_style.border = dashed_border
+        # スタイルをワークブックに登録し、登録後の書式をスタイル名で引けるようにする
+        # L列に値がある行（呼び出しツリーの最上位の行）用に、データ行のスタイルの
+        # 背景色をライトグレーにしたスタイルも登録（名前は元のスタイル名 + "_gray"）
+        cell_styles: Dict[str, "xlsxwriter.format.Format"] = {}
+        for name, properties in style_properties.items():
+            cell_styles[name] = wb.add_format({**base_properties, **properties})
+            cell_styles[f"{name}_gray"] = wb.add_format(
+                {**base_properties, **properties, "pattern": 1, "bg_color": "#D9D9D9"}
+            )
 
         # ヘッダ用スタイル（オリーブ背景色）
-        header_style = NamedStyle(name="header_style")
-        header_style.font = Font(name="Meiryo UI")
-        header_style.alignment = Alignment(vertical="center", horizontal="left")
-        header_style.fill = olive_fill
-        header_style.border = dashed_border
-
-        # L列用スタイル（太字）
-        tree_style = NamedStyle(name="tree_style")
-        tree_style.font = Font(name="Meiryo UI", bold=True)
-        tree_style.alignment = Alignment(vertical="center", horizontal="left")
-        tree_style.border = dashed_border
-
-        # インターフェース用スタイル（斜体、グレー）
-        interface_style = NamedStyle(name="interface_style")
-        interface_style.font = Font(name="Meiryo UI", italic=True, color="808080")
-        interface_style.alignment = Alignment(vertical="center", horizontal="left")
-        interface_style.border = dashed_border
-
-        # 実装クラス候補用スタイル（下線）
-        impl_style = NamedStyle(name="impl_style")
-        impl_style.font = Font(name="Meiryo UI", underline="single")
-        impl_style.alignment = Alignment(vertical="center", horizontal="left")
-        impl_style.border = dashed_border
-
-        # F列（呼び出し種別）用スタイル（縮小して全体を表示）
-        shrink_style = NamedStyle(name="shrink_style")
-        shrink_style.font = Font(name="Meiryo UI")
-        shrink_style.alignment = Alignment(
-            vertical="center", horizontal="left", shrink_to_fit=True
+        cell_styles["header_style"] = wb.add_format(
+            {**base_properties, "pattern": 1, "bg_color": "#C4D79B"}
         )
-        shrink_style.border = dashed_border
 
-        # スタイルをワークブックに登録
-        wb.add_named_style(default_style)
-        wb.add_named_style(green_style)
-        wb.add_named_style(header_style)
-        wb.add_named_style(tree_style)
-        wb.add_named_style(interface_style)
-        wb.add_named_style(impl_style)
-        wb.add_named_style(shrink_style)
-
-        # C～E列の幅を30に設定
-        for col_letter in ["C", "D", "E"]:
-            ws.column_dimensions[col_letter].width = 30
+        # C～E列の幅を30に設定（列番号は0始まり）
+        ws.set_column(2, 4, 30)
 
         # L列以降の列幅を5に設定
-        tree_start_col = column_index_from_string("L")
+        tree_start_col = 11  # L列
         tree_end_col = tree_start_col + max_depth - 1  # 呼び出しツリーの最終列
-        for col_idx in range(tree_start_col, tree_start_col + max_depth):
-            letter = get_column_letter(col_idx)
-            ws.column_dimensions[letter].width = 5
+        if max_depth > 0:
+            ws.set_column(tree_start_col, tree_end_col, 5)
 
         # --depthオプションに基づく動的列計算（呼び出しツリーの後に配置）
         javadoc_col = tree_start_col + max_depth  # Javadoc列（呼び出しツリーの直後）
@@ -3180,87 +3973,96 @@ class CallTreeVisualizer:
         hitwords_col = http_request_col + 1
 
         # Javadoc列の幅を30に設定
-        ws.column_dimensions[get_column_letter(javadoc_col)].width = 30
+        ws.set_column(javadoc_col, javadoc_col, 30)
+
+        # ウィンドウ枠の固定（A3セルで固定）
+        ws.freeze_panes(2, 0)
+
+        # 1～2行目はA～AO列の全セルにヘッダースタイルを適用する
+        ao_col = 40  # AO列
+        header_style = cell_styles["header_style"]
+
+        def write_header_row(row: int, values: Dict[int, Union[str, int]]) -> None:
+            """列番号→値の辞書からヘッダ行を書き込み"""
+            for col in range(ao_col + 1):
+                ws.write_blank(row, col, None, header_style)
+            for col, value in values.items():
+                ws.write(row, col, value, header_style)
 
         # 1行目: L1に「呼び出しツリー」を出力
+        title_values: Dict[int, Union[str, int]] = {}
         if include_tree:
-            ws.cell(row=1, column=tree_start_col, value="呼び出しツリー").style = (
-                "header_style"
-            )
+            title_values[tree_start_col] = "呼び出しツリー"
+        write_header_row(0, title_values)
 
         # 2行目: ヘッダ行
-        header_row = 2
-        ws.cell(row=header_row, column=1, value="エントリーポイント").style = (
-            "header_style"
-        )
-        ws.cell(row=header_row, column=2, value="呼び出しメソッド").style = (
-            "header_style"
-        )
-        ws.cell(row=header_row, column=3, value="パッケージ名").style = "header_style"
-        ws.cell(row=header_row, column=4, value="クラス名").style = "header_style"
-        ws.cell(row=header_row, column=5, value="メソッド名").style = "header_style"
-        ws.cell(row=header_row, column=6, value="呼び出し種別").style = "header_style"
+        header_values: Dict[int, Union[str, int]] = {
+            0: "エントリーポイント",
+            1: "呼び出しメソッド",
+            2: "パッケージ名",
+            3: "クラス名",
+            4: "メソッド名",
+            5: "呼び出し種別",
+        }
 
         # L2～呼び出しツリー最終列に連番（1,2,3...）
         if include_tree:
-            for i, col_idx in enumerate(
-                range(tree_start_col, tree_end_col + 1), start=1
-            ):
-                ws.cell(row=header_row, column=col_idx, value=i).style = "header_style"
+            for i, col in enumerate(range(tree_start_col, tree_end_col + 1), start=1):
+                header_values[col] = i
 
         # 動的列: Javadoc（呼び出しツリーの直後）
-        ws.cell(row=header_row, column=javadoc_col, value="Javadoc").style = (
-            "header_style"
-        )
+        header_values[javadoc_col] = "Javadoc"
 
         # 動的列: SQL有無、SQL文
         if include_sql:
-            ws.cell(row=header_row, column=sql_exists_col, value="SQL有無").style = (
-                "header_style"
-            )
-            ws.cell(row=header_row, column=sql_content_col, value="SQL文").style = (
-                "header_style"
-            )
+            header_values[sql_exists_col] = "SQL有無"
+            header_values[sql_content_col] = "SQL文"
 
         # 動的列: HTTP有無、HTTPリクエスト
-        ws.cell(row=header_row, column=http_exists_col, value="HTTP有無").style = (
-            "header_style"
-        )
-        ws.cell(
-            row=header_row, column=http_request_col, value="HTTPリクエスト"
-        ).style = "header_style"
+        header_values[http_exists_col] = "HTTP有無"
+        header_values[http_request_col] = "HTTPリクエスト"
 
         # 動的列: hitWords列
-        ws.cell(row=header_row, column=hitwords_col, value="検出ワード").style = (
-            "header_style"
-        )
+        header_values[hitwords_col] = "検出ワード"
+        write_header_row(1, header_values)
 
-        return wb, ws
+        return wb, ws, cell_styles
 
     def _write_entries_to_excel(
         self,
-        ws: openpyxl.worksheet.worksheet.Worksheet,
+        ws: "xlsxwriter.worksheet.Worksheet",
+        cell_styles: Dict[str, "xlsxwriter.format.Format"],
         entry_points: List[str],
         max_depth: int,
         follow_implementations: bool,
         include_tree: bool,
         include_sql: bool,
-    ) -> tuple[int, List[str]]:
+        tree_results: Optional[
+            Iterator[Tuple[Iterable[Dict[str, any]], List[bool]]]
+        ] = None,
+        row_limit: int = 0,
+    ) -> tuple[int, List[str], int]:
         """
         エントリーポイントをExcelワークシートに書き込み
 
         Args:
             ws: ワークシート
+            cell_styles: スタイル名 -> セルの書式（_create_excel_workbook_with_stylesの戻り値）
             entry_points: エントリーポイントのリスト
             max_depth: 最大深度
             follow_implementations: 実装クラス候補を追跡するか
             include_tree: 呼び出しツリーを出力するか
             include_sql: SQL文を出力するか
+            tree_results: _iter_tree_dataの結果（Noneの場合はここで逐次収集する）
+                書き込んだエントリーポイントの件数分だけ先頭から消費する
+            row_limit: データ行数の上限（0以下の場合は無制限）
+                上限に達したエントリーポイントまで書き込み、残りは書き込まずに戻る
 
         Returns:
-            (最終行番号, 最大深度に到達したエントリーポイントのリスト)のタプル
+            (最終行番号, 最大深度に到達したエントリーポイントのリスト,
+            書き込んだエントリーポイント数)のタプル
         """
-        tree_start_col = column_index_from_string("L")
+        tree_start_col = 11  # L列（列番号は0始まり）
         javadoc_col = tree_start_col + max_depth  # Javadoc列（呼び出しツリーの直後）
         sql_exists_col = javadoc_col + 1
         sql_content_col = sql_exists_col + 1
@@ -3268,141 +4070,230 @@ class CallTreeVisualizer:
         http_request_col = http_exists_col + 1
         hitwords_col = http_request_col + 1
 
+        # L列に値がある行は、A～AO列の背景色をライトグレーにする
+        ao_col = 40  # AO列
+
+        # 行で使う書式（スタイル名 -> セルの書式）。L列に値がある行は背景色付きの書式を使う
+        gray_cell_styles = {
+            name: cell_styles.get(f"{name}_gray", cell_format)
+            for name, cell_format in cell_styles.items()
+        }
+
+        # 値のないセルは書き込まず、行の既定書式（default_style）で表示する
+        row_default_style = cell_styles["default_style"]
+
+        # 値はすべて文字列として書き込む（"="で始まる値を数式、URLをハイパーリンクにしない）
+        write_string = ws.write_string
+        write_blank = ws.write_blank
+
         current_row = 3  # データは3行目から
         max_depth_reached_entries: List[str] = []
+        written_entries = 0
 
-        for entry_point in entry_points:
-            print(f"  処理中: {entry_point}")
+        if tree_results is None:
+            tree_results = self._iter_tree_data(
+                entry_points, max_depth, follow_implementations, show_progress=True
+            )
 
-            # 最大深度到達フラグを初期化
-            max_depth_reached_flag: List[bool] = [False]
+        # ツリーデータを収集（zipはentry_points側が尽きた時点でtree_resultsを消費しない）
+        for entry_point, (tree_data, max_depth_reached) in zip(
+            entry_points, tree_results
+        ):
+            # Excelに書き込み（1ノード＝1行）
+            for node in tree_data:
+                row = current_row - 1  # 0始まりの行番号
 
-            # ツリーデータを収集
-            tree_data = self._collect_tree_data(
-                entry_point,
-                max_depth,
-                follow_implementations,
-                max_depth_reached=max_depth_reached_flag,
-            )
+                # L列以降の呼び出しツリーの表示（行の背景色を決めるため先に求める）
+                tree_text = node["tree_display"] if include_tree else ""
 
-            # 最大深度に到達した場合、エントリーポイントを記録
-            if max_depth_reached_flag[0]:
-                max_depth_reached_entries.append(entry_point)
+                # L列に値がある行（呼び出しツリーの最上位）は背景色付きの書式を使う
+                is_gray_row = node["depth"] == 0 and bool(tree_text)
+                styles = gray_cell_styles if is_gray_row else cell_styles
+                default_style = styles["default_style"]
+
+                # 行の既定書式（値のないセルに適用される）
+                # constant_memoryモードでは、行のセルを書き込む前に設定する
+                ws.set_row(row, None, row_default_style)
+
+                # 背景色付きの行は、A～AO列の値のないセルにも背景色を付ける
+                # （この行はエントリーポイントごとに1行程度のため、セルを書き込む）
+                if is_gray_row:
+                    for col in range(ao_col + 1):
+                        write_blank(row, col, None, default_style)
 
-            # Excelに書き込み
-            for node in tree_data:
                 # A列: エントリーポイント
-                ws.cell(row=current_row, column=1, value=entry_point).style = (
-                    "default_style"
-                )
+                write_string(row, 0, entry_point, default_style)
 
                 # B列: 呼び出しメソッド（fully qualified name）
-                ws.cell(row=current_row, column=2, value=node["method"]).style = (
-                    "default_style"
-                )
+                write_string(row, 1, node["method"], default_style)
 
-                # C列: パッケージ名
-                ws.cell(row=current_row, column=3, value=node["package"]).style = (
-                    "default_style"
-                )
+                # C～E列は値が空の場合があるため、空文字列ではなく書式付きの空白セルにする
+                # C列: パッケージ名（デフォルトパッケージの場合は空）
+                if node["package"]:
+                    write_string(row, 2, node["package"], default_style)
+                else:
+                    write_blank(row, 2, None, default_style)
 
                 # D列: クラス名（パッケージ名を除いたシンプルなクラス名）
-                simple_class = node["class"].split(".")[-1] if node["class"] else ""
-                ws.cell(row=current_row, column=4, value=simple_class).style = (
-                    "default_style"
-                )
+                if node["simple_class"]:
+                    write_string(row, 3, node["simple_class"], default_style)
+                else:
+                    write_blank(row, 3, None, default_style)
 
                 # E列: メソッド名（simple name）
-                ws.cell(
-                    row=current_row, column=5, value=node["simple_method"]
-                ).style = "default_style"
+                if node["simple_method"]:
+                    write_string(row, 4, node["simple_method"], default_style)
+                else:
+                    write_blank(row, 4, None, default_style)
 
                 # F列: 呼び出し種別（親クラス / インターフェース / 実装クラス）、空の場合は半角スペース
                 parent_relation_value = (
                     node["parent_relation"] if node["parent_relation"] else " "
                 )
-                ws.cell(
-                    row=current_row, column=6, value=parent_relation_value
-                ).style = "shrink_style"
+                write_string(row, 5, parent_relation_value, styles["shrink_style"])
 
                 # L列以降: 呼び出しツリー
                 if include_tree:
                     tree_col = tree_start_col + node["depth"]
-                    tree_text = str(node["tree_display"] or "")
-                    if node["is_circular"] and tree_text:
-                        tree_text = tree_text + " [循環参照]"
                     if tree_col == tree_start_col:
-                        ws.cell(
-                            row=current_row, column=tree_col, value=tree_text
-                        ).style = "tree_style"
+                        tree_cell_style = styles["tree_style"]
                     elif node["parent_relation"] == "インターフェース":
-                        ws.cell(
-                            row=current_row, column=tree_col, value=tree_text
-                        ).style = "interface_style"
+                        tree_cell_style = styles["interface_style"]
                     elif node["parent_relation"] == "実装クラス候補":
-                        ws.cell(
-                            row=current_row, column=tree_col, value=tree_text
-                        ).style = "impl_style"
+                        tree_cell_style = styles["impl_style"]
                     else:
-                        ws.cell(
-                            row=current_row, column=tree_col, value=tree_text
-                        ).style = "default_style"
+                        tree_cell_style = default_style
+                    write_string(row, tree_col, tree_text, tree_cell_style)
 
                 # 動的列: Javadoc（緑フォント）、空の場合は半角スペース
                 javadoc_value = node["javadoc"] if node["javadoc"] else " "
-                ws.cell(
-                    row=current_row, column=javadoc_col, value=javadoc_value
-                ).style = "green_style"
+                write_string(row, javadoc_col, javadoc_value, styles["green_style"])
 
                 # 動的列: SQL有無、SQL文
                 if include_sql:
-                    sql_marker = "●" if node["sql"] else ""
-                    ws.cell(
-                        row=current_row, column=sql_exists_col, value=sql_marker
-                    ).style = "default_style"
                     if node["sql"]:
-                        ws.cell(
-                            row=current_row, column=sql_content_col, value=node["sql"]
-                        ).style = "default_style"
+                        write_string(row, sql_exists_col, "●", default_style)
+                        write_string(row, sql_content_col, node["sql"], default_style)
+                    else:
+                        write_blank(row, sql_exists_col, None, default_style)
 
                 # 動的列: HTTP有無、HTTPリクエスト
-                http_calls = node.get("httpCalls", [])
-                http_marker = "●" if http_calls else ""
-                ws.cell(
-                    row=current_row, column=http_exists_col, value=http_marker
-                ).style = "default_style"
-
-                if http_calls:
-                    http_details = ", ".join(
-                        f"{call.get('httpMethod', 'UNKNOWN')} - "
-                        f"{call.get('uri', '${UNRESOLVED}')}"
-                        for call in http_calls
-                    )
-                    ws.cell(
-                        row=current_row, column=http_request_col, value=http_details
-                    ).style = "default_style"
+                http_details = node["http_details"]
+                if http_details:
+                    write_string(row, http_exists_col, "●", default_style)
+                    write_string(row, http_request_col, http_details, default_style)
+                else:
+                    write_blank(row, http_exists_col, None, default_style)
 
                 # 動的列: hitWords
                 hit_words = node.get("hit_words", "")
                 if hit_words:
-                    ws.cell(
-                        row=current_row, column=hitwords_col, value=hit_words
-                    ).style = "default_style"
+                    write_string(row, hitwords_col, hit_words, default_style)
 
                 current_row += 1
 
-        return current_row, max_depth_reached_entries
+            # 最大深度に到達した場合、エントリーポイントを記録
+            # （フラグはツリーデータを取り出し終えた時点で確定する）
+            if max_depth_reached[0]:
+                max_depth_reached_entries.append(entry_point)
+
+            # 行数の上限に達した場合は、次のエントリーポイントのツリーデータを取り出す前に戻る
+            written_entries += 1
+            if row_limit > 0 and current_row - 3 >= row_limit:
+                break
+
+        return current_row, max_depth_reached_entries, written_entries
+
+    def _write_excel_files(
+        self,
+        output_file: str,
+        entry_points: List[str],
+        tree_results: Iterator[Tuple[Iterable[Dict[str, any]], List[bool]]],
+        max_depth: int,
+        follow_implementations: bool,
+        include_tree: bool,
+        include_sql: bool,
+        segment_size: int,
+    ) -> tuple[List[tuple[str, int]], List[str]]:
+        """
+        エントリーポイントをExcelファイルに書き込んで保存
+
+        データ行数がsegment_sizeに達した場合は、そのエントリーポイントまでを保存し、
+        残りを新しいワークブックに書き込む（1つのエントリーポイントはファイルをまたがない）。
+        複数ファイルに分かれる場合のファイル名は「出力ファイル名.partN.xlsx」とする。
+
+        Args:
+            output_file: 出力ファイル名
+            entry_points: エントリーポイントのリスト
+            tree_results: _iter_tree_dataの結果（entry_pointsの件数分だけ先頭から消費する）
+            max_depth: 最大深度
+            follow_implementations: 実装クラス候補を追跡するか
+            include_tree: 呼び出しツリーを出力するか
+            include_sql: SQL文を出力するか
+            segment_size: 1ファイルあたりのデータ行数の上限（0以下の場合は分割しない）
+
+        Returns:
+            ([(ファイル名, データ行数), ...], 最大深度に到達したエントリーポイントのリスト)のタプル
+        """
+        base_name, ext = os.path.splitext(output_file)
+
+        output_files: List[tuple[str, int]] = []
+        all_max_depth_reached_entries: List[str] = []
+
+        remaining = entry_points
+        while remaining:
+            # ワークブックを作成
+            wb, ws, cell_styles = self._create_excel_workbook_with_styles(
+                max_depth, include_tree, include_sql
+            )
+
+            # 行数の上限までエントリーポイントをExcelに書き込み
+            current_row, max_depth_reached_entries, written_entries = (
+                self._write_entries_to_excel(
+                    ws,
+                    cell_styles,
+                    remaining,
+                    max_depth,
+                    follow_implementations,
+                    include_tree,
+                    include_sql,
+                    tree_results,
+                    segment_size,
+                )
+            )
+            all_max_depth_reached_entries.extend(max_depth_reached_entries)
+            remaining = remaining[written_entries:]
+
+            # 1ファイルに収まった場合は、出力ファイル名をそのまま使う
+            if not output_files and not remaining:
+                part_file = output_file
+            else:
+                part_file = f"{base_name}.part{len(output_files) + 1}{ext}"
+
+            # ワークブックを仕上げて保存
+            self._finalize_excel_workbook(wb, ws, current_row, max_depth, part_file)
+            # 行数は1～2行目のヘッダを除いたデータ行数（分割したファイルごとに数える）
+            output_files.append((part_file, current_row - 3))
+            sys.stdout.flush()
+
+            # メモリを解放
+            del wb
+            del ws
+
+        return output_files, all_max_depth_reached_entries
 
     def _finalize_excel_workbook(
         self,
-        wb: openpyxl.Workbook,
-        ws: openpyxl.worksheet.worksheet.Worksheet,
+        wb: "xlsxwriter.Workbook",
+        ws: "xlsxwriter.worksheet.Worksheet",
         current_row: int,
         max_depth: int,
         output_file: str,
     ) -> None:
         """
-        Excelワークブックの仕上げ処理（書式設定、フィルター、保存）
+        Excelワークブックの仕上げ処理（フィルター、保存）
+
+        保存に失敗した場合はエクスポート結果が失われるため、エラーを表示して終了する。
 
         Args:
             wb: ワークブック
@@ -3412,53 +4303,75 @@ class CallTreeVisualizer:
             output_file: 出力ファイル名
         """
         last_row = current_row - 1
-        ao_col = column_index_from_string("AO")
-        filter_range = f"A2:{get_column_letter(ao_col)}{last_row}"
-
-        # データがない場合は最小限の範囲を設定
-        if last_row < 3:
-            filter_range = f"A2:{get_column_letter(ao_col)}3"
-
-        ws.auto_filter.ref = filter_range
-
-        # 1行目の全セルにヘッダースタイルを適用
-        for col_idx in range(1, ao_col + 1):
-            cell = ws.cell(row=1, column=col_idx)
-            if cell.style != "header_style":
-                cell.style = "header_style"
-
-        # 2行目～最終行の全セルに書式を適用（未設定のセルのみ）
-        for row_idx in range(2, max(last_row + 1, 3)):
-            for col_idx in range(1, ao_col + 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                if cell.style == "Normal" or cell.style is None:
-                    if row_idx == 2:
-                        cell.style = "header_style"
-                    else:
-                        cell.style = "default_style"
 
-        # 条件付き書式: L列に値がある場合は行全体の背景色をライトグレーに
-        if last_row >= 3:
-            light_gray_fill = PatternFill(
-                start_color="D9D9D9", end_color="D9D9D9", fill_type="solid"
-            )
-            data_range = f"A3:{get_column_letter(ao_col)}{last_row}"
-            ws.conditional_formatting.add(
-                data_range,
-                FormulaRule(
-                    formula=['$L3<>""'],
-                    fill=light_gray_fill,
-                ),
-            )
+        # フィルター範囲はA2～AO列の最終行（データがない場合は最小限の範囲を設定）
+        ws.autofilter(f"A2:AO{max(last_row, 3)}")
 
-        # ウィンドウ枚の固定（A3セルで固定）
-        ws.freeze_panes = "A3"
+        from xlsxwriter.exceptions import XlsxWriterException
 
-        # Excelファイルの保存
+        # Excelファイルの保存（ZIPはメモリ上に作成し、ファイルへは1回で書き込む）
         try:
-            wb.save(output_file)
-        except Exception as e:
-            print(f"エラー: Excelファイルの保存に失敗しました: {e}", file=sys.stderr)
+            # wb.filenameは作成時に出力先として渡したメモリ上のバッファ
+            wb.close()
+            Path(output_file).write_bytes(wb.filename.getbuffer())
+        except (XlsxWriterException, OSError) as e:
+            print(
+                f"エラー: Excelファイルの保存に失敗しました ({output_file}): {e}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+
+# 並列処理（--jobs）用のワーカープロセス関数
+
+# ワーカープロセスごとのVisualizer（_init_tree_workerで1回だけ構築）
+_worker_visualizer: Optional[CallTreeVisualizer] = None
+
+
+def _init_tree_worker(
+    input_file: str,
+    exclusion_file: Optional[str],
+    output_tsv_encoding: str,
+    debug_mode: bool,
+) -> None:
+    """ワーカープロセスの初期化（入力ファイルを読み込んでVisualizerを構築）"""
+    global _worker_visualizer
+    # 読み込み時のメッセージはメインプロセスで出力済みのため捨てる
+    with (
+        contextlib.redirect_stdout(io.StringIO()),
+        contextlib.redirect_stderr(io.StringIO()),
+    ):
+        _worker_visualizer = CallTreeVisualizer(
+            input_file, exclusion_file, output_tsv_encoding, debug_mode
+        )
+
+
+def _collect_tree_data_worker(
+    task: Tuple[str, int, bool],
+) -> Tuple[List[Dict[str, any]], bool, str]:
+    """
+    ワーカープロセスで1つのエントリーポイントのツリーデータを収集する
+
+    Args:
+        task: (エントリーポイント, 最大深度, 実装クラス候補を追跡するか)のタプル
+
+    Returns:
+        (ツリーデータ, 最大深度に到達したか, 標準出力へのデバッグ出力)のタプル
+    """
+    entry_point, max_depth, follow_implementations = task
+    max_depth_reached_flag: List[bool] = [False]
+    # 出力順を保つため、デバッグ出力はバッファしてメインプロセスで出力する
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        tree_data = list(
+            _worker_visualizer._iter_tree_nodes(
+                entry_point,
+                max_depth,
+                follow_implementations,
+                max_depth_reached=max_depth_reached_flag,
+            )
+        )
+    return tree_data, max_depth_reached_flag[0], buffer.getvalue()
 
 
 # サブコマンドハンドラー関数
@@ -3525,6 +4438,8 @@ def handle_export_excel(args, visualizer: CallTreeVisualizer) -> None:
         args.include_tree,
         args.include_sql,
         split_by_class=not args.single_file,  # --single-file指定時はFalse
+        jobs=args.jobs,
+        segment_size=args.segment_size,
     )
 
 
@@ -3536,6 +4451,9 @@ def handle_export_csv(args, visualizer: CallTreeVisualizer) -> None:
         args.depth,
         args.follow_impl,
         unique=args.unique,
+        jobs=args.jobs,
+        compress=args.gzip,
+        output_format=args.format,
     )
 
 
@@ -3556,9 +4474,6 @@ def handle_analyze_sql(args) -> None:
     SQLディレクトリ内のSQLファイルを指定された複数キーワード（正規表現）で検索し、
     ヒット結果をCSV形式で出力する。
     """
-    import os
-    from pathlib import Path
-
     sql_dir = args.sql_dir
     keyword_list_file = args.keyword_list
     output_file = args.output_file
@@ -3615,7 +4530,7 @@ def handle_analyze_sql(args) -> None:
         print(f"エラー: SQLディレクトリが見つかりません: {sql_dir}", file=sys.stderr)
         sys.exit(1)
 
-    sql_files = sorted(sql_dir_path.glob("*.sql"))
+    sql_files = _list_sql_files(sql_dir)
 
     if not sql_files:
         print(f"警告: SQLファイルが見つかりません: {sql_dir}", file=sys.stderr)
@@ -3626,7 +4541,7 @@ def handle_analyze_sql(args) -> None:
 
     for sql_file in sql_files:
         try:
-            with open(sql_file, "r", encoding="utf-8") as f:
+            with open(sql_file.path, "r", encoding="utf-8") as f:
                 sql_content = f.read()
 
             # 各キーワードで検索
@@ -3671,8 +4586,7 @@ class StructureVisualizer:
     def __init__(self, json_file: str):
         self.json_file = json_file
         try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                self.data = json.load(f)
+            self.data = _read_json_file(json_file)
         except Exception as e:
             print(f"JSONファイルの読み込みに失敗しました: {e}", file=sys.stderr)
             sys.exit(1)
@@ -3708,6 +4622,10 @@ class StructureVisualizer:
                 # 親クラスがない場合はルート
                 roots.add(class_name)
 
+        # 子クラスは名前順に表示するため、ここで1回だけ並べ替えておく
+        for children in children_map.values():
+            children.sort()
+
         # フィルタリング適用
         if root_filter:
             target_roots = [r for r in roots if root_filter in r]
@@ -3730,31 +4648,63 @@ class StructureVisualizer:
         print(f"{'=' * 80}\n")
 
         for root in target_roots:
-            self._print_class_node_recursive(
-                root, 0, max_depth, verbose, class_map, children_map, set()
-            )
+            self._print_class_subtree(root, max_depth, verbose, class_map, children_map)
             print()  # ツリー間の改行
 
-    def _print_class_node_recursive(
+    def _print_class_subtree(
         self,
-        class_name: str,
-        depth: int,
+        root: str,
         max_depth: int,
         verbose: bool,
         class_map: Dict[str, Dict],
         children_map: Dict[str, List[str]],
-        visited: Set[str],
     ):
-        if depth > max_depth:
-            return
-
-        if class_name in visited:
-            indent = "    " * depth
-            print(f"{indent}|-- {class_name} [循環参照]")
-            return
+        """
+        rootを頂点とするクラス継承ツリーを深さ優先で表示（children_mapの子クラスは並べ替え済み）
 
-        visited.add(class_name)
+        再帰呼び出しの代わりに明示的なスタックで辿る（深い継承階層でも再帰の上限に
+        かからない）。循環参照の判定には現在の経路上のクラス集合を1つだけ使い、
+        スタックに積むときに追加・取り除くときに削除する。
+        """
+        visited: Set[str] = set()  # 現在の経路上のクラス
+        # スタックの各要素: (クラス名, 未表示の子クラスのイテレータ)。要素数が次の深度になる
+        stack: List[Tuple[str, Iterator[str]]] = []
+
+        class_name = root
+        depth = 0
+        while True:
+            if depth <= max_depth:
+                if class_name in visited:
+                    indent = "    " * depth
+                    print(f"{indent}|-- {class_name} [循環参照]")
+                else:
+                    print(
+                        self._format_class_node(class_name, depth, verbose, class_map)
+                    )
+                    # 子クラスを表示するため、スタックに積む
+                    visited.add(class_name)
+                    stack.append((class_name, iter(children_map.get(class_name, ()))))
+
+            # 次に表示する子クラスを探す（子クラスを表示し終えたクラスは経路から外す）
+            while stack:
+                parent, children = stack[-1]
+                class_name = next(children, None)
+                if class_name is not None:
+                    depth = len(stack)
+                    break
+                stack.pop()
+                visited.discard(parent)
+            else:
+                return
 
+    def _format_class_node(
+        self,
+        class_name: str,
+        depth: int,
+        verbose: bool,
+        class_map: Dict[str, Dict],
+    ) -> str:
+        """クラス継承ツリーの1行分の表示文字列を作成"""
         indent = "    " * depth
         prefix = "|-- " if depth > 0 else ""
 
@@ -3772,7 +4722,7 @@ class StructureVisualizer:
 
             annotations = info.get("annotations", [])
             if annotations:
-                anns_str = ", ".join([f"@{a.split('.')[-1]}" for a in annotations])
+                anns_str = ", ".join([f"@{a.rpartition('.')[2]}" for a in annotations])
                 extras.append(f"Annotations: [{anns_str}]")
             else:
                 extras.append("Annotations: (なし)")
@@ -3786,20 +4736,7 @@ class StructureVisualizer:
         if not info and depth == 0:
             display += " [外部親クラス]"
 
-        print(display)
-
-        # 子クラスの表示
-        children = sorted(children_map.get(class_name, []))
-        for child in children:
-            self._print_class_node_recursive(
-                child,
-                depth + 1,
-                max_depth,
-                verbose,
-                class_map,
-                children_map,
-                visited.copy(),
-            )
+        return display
 
     def print_interface_impls(
         self, filter_str: Optional[str] = None, verbose: bool = False
@@ -3833,7 +4770,9 @@ class StructureVisualizer:
                     extras.append("Javadoc: (なし)")
                 annotations = iface.get("annotations", [])
                 if annotations:
-                    anns_str = ", ".join([f"@{a.split('.')[-1]}" for a in annotations])
+                    anns_str = ", ".join(
+                        [f"@{a.rpartition('.')[2]}" for a in annotations]
+                    )
                     extras.append(f"Annotations: [{anns_str}]")
                 else:
                     extras.append("Annotations: (なし)")
@@ -3871,7 +4810,7 @@ class StructureVisualizer:
                     annotations = impl.get("annotations", [])
                     if annotations:
                         anns_str = ", ".join(
-                            [f"@{a.split('.')[-1]}" for a in annotations]
+                            [f"@{a.rpartition('.')[2]}" for a in annotations]
                         )
                         extras.append(f"Annotations: [{anns_str}]")
                     else:
@@ -3901,68 +4840,107 @@ def handle_interface_impls(args) -> None:
     visualizer.print_interface_impls(filter_str=args.filter_str, verbose=args.verbose)
 
 
-def main():
-    """メイン関数"""
-    import argparse
-
-    # メインパーサーの作成
-    parser = argparse.ArgumentParser(
-        description="呼び出しツリー可視化スクリプト - JSONファイルから可視化を行います",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-除外ルールファイルのフォーマット:
-  <クラス名 or メソッド名><TAB><I|E>
-  I: 対象自体を除外
-  E: 対象は表示するが、配下の呼び出しを除外
+# サブコマンド名 -> 処理関数
+_COMMAND_HANDLERS: Dict[str, Callable[..., None]] = {
+    "entries": handle_entries,
+    "search": handle_search,
+    "forward": handle_forward,
+    "reverse": handle_reverse,
+    "export": handle_export,
+    "export-excel": handle_export_excel,
+    "export-csv": handle_export_csv,
+    "extract-sql": handle_extract_sql,
+    "analyze-tables": handle_analyze_tables,
+    "analyze-sql": handle_analyze_sql,
+    "class-tree": handle_class_tree,
+    "interface-impls": handle_interface_impls,
+}
+# CallTreeVisualizerを渡して処理するサブコマンド（それ以外は引数のみで処理する）
+_NEEDS_VISUALIZER: FrozenSet[str] = frozenset(
+    {
+        "entries",
+        "search",
+        "forward",
+        "reverse",
+        "export",
+        "export-excel",
+        "export-csv",
+        "extract-sql",
+        "analyze-tables",
+    }
+)
+
+
+def _add_depth_argument(parser: "argparse.ArgumentParser", default: int) -> None:
+    """--depth（ツリーの最大深度）を定義"""
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=default,
+        help=f"ツリーの最大深度 (デフォルト: {default})",
+    )
 
-テーブルリストファイル (table_list.tsv) のフォーマット:
-  <物理テーブル名><TAB><論理テーブル名><TAB><補足情報>
 
-使用例:
-  %(prog)s entries
-  %(prog)s entries --no-strict --min-calls 5
-  %(prog)s forward 'com.example.Main#main(String[])'
-  %(prog)s reverse 'com.example.Service#process()'
-  %(prog)s export 'com.example.Main#main(String[])' tree.html --format html
-  %(prog)s export-excel call_trees.xlsx --entry-points entry_points.txt
-  %(prog)s extract-sql --output-dir ./output/sqls
-  %(prog)s analyze-tables --sql-dir ./output/sqls
-  %(prog)s class-tree --filter 'com.example'
-  %(prog)s interface-impls --interface 'MyService'
-        """,
+def _add_no_follow_impl_argument(parser: "argparse.ArgumentParser") -> None:
+    """--no-follow-impl（実装クラス候補を追跡しない）を定義"""
+    parser.add_argument(
+        "--no-follow-impl",
+        action="store_false",
+        dest="follow_impl",
+        help="実装クラス候補を追跡しない",
     )
 
+
+def _add_show_class_argument(parser: "argparse.ArgumentParser") -> None:
+    """--show-class（クラス情報を表示）を定義"""
     parser.add_argument(
-        "-i",
-        "--input",
-        dest="input_file",
-        default="analyzed_result.json",
-        help="入力ファイル（JSONまたはTSV）のパス (デフォルト: analyzed_result.json)",
+        "--show-class",
+        action="store_true",
+        dest="show_class",
+        help="クラス情報を表示",
     )
+
+
+def _add_tree_format_arguments(parser: "argparse.ArgumentParser") -> None:
+    """ツリー表示の書式（--verbose、--tab、--short）を定義"""
     parser.add_argument(
-        "--exclusion-file",
-        help="除外ルールファイルのパス (デフォルト: exclusion_rules.txt)",
+        "--verbose",
+        action="store_true",
+        help="詳細表示（Javadocをタブ区切りで表示）",
     )
     parser.add_argument(
-        "--output-tsv-encoding",
-        default="Shift_JIS",
-        help="出力するTSVのエンコーディング (デフォルト: Shift_JIS (Excelへの貼付けを考慮))",
+        "--tab",
+        action="store_true",
+        help="ハードタブでインデントし、プレフィックス|-- を省略",
     )
     parser.add_argument(
-        "-d",
-        "--debug",
+        "--short",
         action="store_true",
-        dest="debug_mode",
-        help="デバッグモード（インスタンス収集情報を出力）",
+        help="クラス名からパッケージ名を省いて表示",
     )
 
-    # サブコマンドの作成
-    subparsers = parser.add_subparsers(dest="command", help="サブコマンド")
 
-    # entries サブコマンド
-    parser_entries = subparsers.add_parser(
-        "entries", help="エントリーポイント候補を表示"
+def _add_entry_points_argument(parser: "argparse.ArgumentParser") -> None:
+    """--entry-points（エントリーポイントファイル）を定義"""
+    parser.add_argument(
+        "--entry-points",
+        help="エントリーポイントファイル（指定しない場合は厳密モードのエントリーポイントを使用）",
+    )
+
+
+def _add_jobs_argument(parser: "argparse.ArgumentParser") -> None:
+    """-j/--jobs（ツリーデータ収集の並列プロセス数）を定義"""
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="ツリーデータ収集の並列プロセス数 (デフォルト: 1)",
     )
+
+
+def _add_entries_arguments(parser_entries: "argparse.ArgumentParser") -> None:
+    """entriesサブコマンドの引数を定義"""
     parser_entries.add_argument(
         "--no-strict",
         action="store_false",
@@ -3981,89 +4959,40 @@ def main():
         help="TSV形式で出力",
     )
 
-    # search サブコマンド
-    parser_search = subparsers.add_parser("search", help="キーワードでメソッドを検索")
+
+def _add_search_arguments(parser_search: "argparse.ArgumentParser") -> None:
+    """searchサブコマンドの引数を定義"""
     parser_search.add_argument("keyword", help="検索キーワード")
 
-    # forward サブコマンド
-    parser_forward = subparsers.add_parser(
-        "forward", help="指定メソッドからの呼び出しツリーを表示"
-    )
+
+def _add_forward_arguments(parser_forward: "argparse.ArgumentParser") -> None:
+    """forwardサブコマンドの引数を定義"""
     parser_forward.add_argument("method", help="起点メソッド")
-    parser_forward.add_argument(
-        "--depth", type=int, default=50, help="ツリーの最大深度 (デフォルト: 50)"
-    )
-    parser_forward.add_argument(
-        "--show-class",
-        action="store_true",
-        dest="show_class",
-        help="クラス情報を表示",
-    )
+    _add_depth_argument(parser_forward, 50)
+    _add_show_class_argument(parser_forward)
     parser_forward.add_argument(
         "--show-sql", action="store_true", dest="show_sql", help="SQL情報を表示"
     )
-    parser_forward.add_argument(
-        "--no-follow-impl",
-        action="store_false",
-        dest="follow_impl",
-        help="実装クラス候補を追跡しない",
-    )
-    parser_forward.add_argument(
-        "--verbose",
-        action="store_true",
-        help="詳細表示（Javadocをタブ区切りで表示）",
-    )
-    parser_forward.add_argument(
-        "--tab",
-        action="store_true",
-        help="ハードタブでインデントし、プレフィックス|-- を省略",
-    )
-    parser_forward.add_argument(
-        "--short",
-        action="store_true",
-        help="クラス名からパッケージ名を省いて表示",
-    )
+    _add_no_follow_impl_argument(parser_forward)
+    _add_tree_format_arguments(parser_forward)
 
-    # reverse サブコマンド
-    parser_reverse = subparsers.add_parser(
-        "reverse", help="指定メソッドへの呼び出し元ツリーを表示"
-    )
+
+def _add_reverse_arguments(parser_reverse: "argparse.ArgumentParser") -> None:
+    """reverseサブコマンドの引数を定義"""
     parser_reverse.add_argument("method", help="対象メソッド")
-    parser_reverse.add_argument(
-        "--depth", type=int, default=50, help="ツリーの最大深度 (デフォルト: 50)"
-    )
-    parser_reverse.add_argument(
-        "--show-class",
-        action="store_true",
-        dest="show_class",
-        help="クラス情報を表示",
-    )
+    _add_depth_argument(parser_reverse, 50)
+    _add_show_class_argument(parser_reverse)
     parser_reverse.add_argument(
         "--no-follow-override",
         action="store_false",
         dest="follow_override",
         help="オーバーライド元を追跡しない",
     )
-    parser_reverse.add_argument(
-        "--verbose",
-        action="store_true",
-        help="詳細表示（Javadocをタブ区切りで表示）",
-    )
-    parser_reverse.add_argument(
-        "--tab",
-        action="store_true",
-        help="ハードタブでインデントし、プレフィックス|-- を省略",
-    )
-    parser_reverse.add_argument(
-        "--short",
-        action="store_true",
-        help="クラス名からパッケージ名を省いて表示",
-    )
+    _add_tree_format_arguments(parser_reverse)
 
-    # export サブコマンド
-    parser_export = subparsers.add_parser(
-        "export", help="ツリーをファイルにエクスポート"
-    )
+
+def _add_export_arguments(parser_export: "argparse.ArgumentParser") -> None:
+    """exportサブコマンドの引数を定義"""
     parser_export.add_argument("method", help="起点メソッド")
     parser_export.add_argument("output_file", help="出力ファイル名")
     parser_export.add_argument(
@@ -4072,34 +5001,16 @@ def main():
         default="text",
         help="出力形式 (デフォルト: text)",
     )
-    parser_export.add_argument(
-        "--depth", type=int, default=50, help="ツリーの最大深度 (デフォルト: 50)"
-    )
-    parser_export.add_argument(
-        "--no-follow-impl",
-        action="store_false",
-        dest="follow_impl",
-        help="実装クラス候補を追跡しない",
-    )
+    _add_depth_argument(parser_export, 50)
+    _add_no_follow_impl_argument(parser_export)
 
-    # export-excel サブコマンド
-    parser_export_excel = subparsers.add_parser(
-        "export-excel", help="ツリーをExcelにエクスポート"
-    )
+
+def _add_export_excel_arguments(parser_export_excel: "argparse.ArgumentParser") -> None:
+    """export-excelサブコマンドの引数を定義"""
     parser_export_excel.add_argument("output_file", help="出力Excelファイル名")
-    parser_export_excel.add_argument(
-        "--entry-points",
-        help="エントリーポイントファイル（指定しない場合は厳密モードのエントリーポイントを使用）",
-    )
-    parser_export_excel.add_argument(
-        "--depth", type=int, default=20, help="ツリーの最大深度 (デフォルト: 20)"
-    )
-    parser_export_excel.add_argument(
-        "--no-follow-impl",
-        action="store_false",
-        dest="follow_impl",
-        help="実装クラス候補を追跡しない",
-    )
+    _add_entry_points_argument(parser_export_excel)
+    _add_depth_argument(parser_export_excel, 20)
+    _add_no_follow_impl_argument(parser_export_excel)
     parser_export_excel.add_argument(
         "--no-tree",
         action="store_false",
@@ -4117,41 +5028,50 @@ def main():
         action="store_true",
         help="単一ファイルに出力（デフォルトはクラス単位で分割）",
     )
-
-    # export-csv サブコマンド
-    parser_export_csv = subparsers.add_parser(
-        "export-csv", help="呼び出しメソッド一覧をCSVにエクスポート"
+    _add_jobs_argument(parser_export_excel)
+    parser_export_excel.add_argument(
+        "--segment-size",
+        type=int,
+        default=250000,
+        metavar="N",
+        help="1ファイルあたりの行数の上限。超えた場合は .partN を付けたファイルに分けて出力 "
+        "(デフォルト: 250000、0で分割しない)",
     )
+
+
+def _add_export_csv_arguments(parser_export_csv: "argparse.ArgumentParser") -> None:
+    """export-csvサブコマンドの引数を定義"""
     parser_export_csv.add_argument(
         "-o",
         "--output",
         dest="output_file",
         help="出力CSVファイル名（省略時は標準出力）",
     )
-    parser_export_csv.add_argument(
-        "--entry-points",
-        help="エントリーポイントファイル（指定しない場合は厳密モードのエントリーポイントを使用）",
-    )
-    parser_export_csv.add_argument(
-        "--depth", type=int, default=20, help="ツリーの最大深度 (デフォルト: 20)"
-    )
-    parser_export_csv.add_argument(
-        "--no-follow-impl",
-        action="store_false",
-        dest="follow_impl",
-        help="実装クラス候補を追跡しない",
-    )
+    _add_entry_points_argument(parser_export_csv)
+    _add_depth_argument(parser_export_csv, 20)
+    _add_no_follow_impl_argument(parser_export_csv)
     parser_export_csv.add_argument(
         "-u",
         "--unique",
         action="store_true",
         help="同じ呼び元・呼び先の組み合わせは一度しか出力しない",
     )
-
-    # extract-sql サブコマンド
-    parser_extract_sql = subparsers.add_parser(
-        "extract-sql", help="SQL文を抽出してファイル出力"
+    _add_jobs_argument(parser_export_csv)
+    parser_export_csv.add_argument(
+        "--gzip",
+        action="store_true",
+        help="gzip形式で圧縮して出力（出力ファイル名に.gzは付加しない）",
+    )
+    parser_export_csv.add_argument(
+        "--format",
+        choices=["csv", "feather", "parquet"],
+        default="csv",
+        help="出力形式 (デフォルト: csv)。feather / parquet はpyarrowが必要で、-o の指定が必要",
     )
+
+
+def _add_extract_sql_arguments(parser_extract_sql: "argparse.ArgumentParser") -> None:
+    """extract-sqlサブコマンドの引数を定義"""
     parser_extract_sql.add_argument(
         "--output-dir",
         default="./found_sql",
@@ -4164,10 +5084,11 @@ def main():
         help="整形せずにそのままのSQL文で出力",
     )
 
-    # analyze-tables サブコマンド
-    parser_analyze_tables = subparsers.add_parser(
-        "analyze-tables", help="SQLファイルから使用テーブルを検出"
-    )
+
+def _add_analyze_tables_arguments(
+    parser_analyze_tables: "argparse.ArgumentParser",
+) -> None:
+    """analyze-tablesサブコマンドの引数を定義"""
     parser_analyze_tables.add_argument(
         "--sql-dir",
         default="./found_sql",
@@ -4179,11 +5100,9 @@ def main():
         help="テーブルリストファイル (デフォルト: ./table_list.tsv)",
     )
 
-    # analyze-sql サブコマンド
-    parser_analyze_sql = subparsers.add_parser(
-        "analyze-sql",
-        help="SQLファイルを複数キーワード（正規表現）で検索",
-    )
+
+def _add_analyze_sql_arguments(parser_analyze_sql: "argparse.ArgumentParser") -> None:
+    """analyze-sqlサブコマンドの引数を定義"""
     parser_analyze_sql.add_argument(
         "-s",
         "--sql-dir",
@@ -4209,10 +5128,9 @@ def main():
         help="大文字・小文字を区別する（デフォルト: 区別しない）",
     )
 
-    # class-tree サブコマンド
-    parser_class_tree = subparsers.add_parser(
-        "class-tree", help="クラス階層ツリーを表示"
-    )
+
+def _add_class_tree_arguments(parser_class_tree: "argparse.ArgumentParser") -> None:
+    """class-treeサブコマンドの引数を定義"""
     parser_class_tree.add_argument(
         "--filter",
         help="フィルタリングパターン（パッケージ名やクラス名の一部）",
@@ -4228,10 +5146,11 @@ def main():
         help="詳細表示（Javadocやアノテーションを表示）",
     )
 
-    # interface-impls サブコマンド
-    parser_interface_impls = subparsers.add_parser(
-        "interface-impls", help="インターフェース実装一覧を表示"
-    )
+
+def _add_interface_impls_arguments(
+    parser_interface_impls: "argparse.ArgumentParser",
+) -> None:
+    """interface-implsサブコマンドの引数を定義"""
     parser_interface_impls.add_argument(
         "--interface",
         dest="filter_str",
@@ -4243,7 +5162,200 @@ def main():
         help="詳細表示（Javadocやアノテーションを表示）",
     )
 
-    # 引数を解析
+
+# サブコマンド名 -> (ヘルプ, サブコマンドの引数を定義する関数)
+# （定義順がヘルプの表示順になる）
+_SUBCOMMANDS: Dict[str, Tuple[str, Callable[..., None]]] = {
+    "entries": ("エントリーポイント候補を表示", _add_entries_arguments),
+    "search": ("キーワードでメソッドを検索", _add_search_arguments),
+    "forward": ("指定メソッドからの呼び出しツリーを表示", _add_forward_arguments),
+    "reverse": ("指定メソッドへの呼び出し元ツリーを表示", _add_reverse_arguments),
+    "export": ("ツリーをファイルにエクスポート", _add_export_arguments),
+    "export-excel": ("ツリーをExcelにエクスポート", _add_export_excel_arguments),
+    "export-csv": (
+        "呼び出しメソッド一覧をCSVにエクスポート",
+        _add_export_csv_arguments,
+    ),
+    "extract-sql": ("SQL文を抽出してファイル出力", _add_extract_sql_arguments),
+    "analyze-tables": (
+        "SQLファイルから使用テーブルを検出",
+        _add_analyze_tables_arguments,
+    ),
+    "analyze-sql": (
+        "SQLファイルを複数キーワード（正規表現）で検索",
+        _add_analyze_sql_arguments,
+    ),
+    "class-tree": ("クラス階層ツリーを表示", _add_class_tree_arguments),
+    "interface-impls": (
+        "インターフェース実装一覧を表示",
+        _add_interface_impls_arguments,
+    ),
+}
+
+
+# 値を取るグローバルオプション（サブコマンド名を探すときに値を読み飛ばす）
+_GLOBAL_VALUE_OPTIONS: FrozenSet[str] = frozenset(
+    {"-i", "--input", "--exclusion-file", "--output-tsv-encoding"}
+)
+
+
+def _find_subcommand(argv: List[str], value_options: FrozenSet[str]) -> Optional[str]:
+    """
+    コマンドライン引数からサブコマンド名（最初の位置引数）を取り出す
+
+    グローバルオプションの値は読み飛ばす（省略形の長いオプションや、"-di 値" のように
+    まとめて指定した短いオプションにも対応）。
+    サブコマンドより前にヘルプオプションがある場合は、全体のヘルプを表示するだけで
+    サブコマンドの引数は不要なため、Noneを返す。
+
+    Args:
+        argv: コマンドライン引数（プログラム名を除く）
+        value_options: 値を取るグローバルオプションの文字列
+
+    Returns:
+        サブコマンド名（見つからない場合はNone）
+
+    Examples:
+        >>> _find_subcommand(["-di", "in.json", "entries"], _GLOBAL_VALUE_OPTIONS)
+        'entries'
+        >>> _find_subcommand(["-din.json", "forward", "X"], _GLOBAL_VALUE_OPTIONS)
+        'forward'
+        >>> _find_subcommand(["--inp", "in.json", "reverse"], _GLOBAL_VALUE_OPTIONS)
+        'reverse'
+        >>> _find_subcommand(["-dh", "entries"], _GLOBAL_VALUE_OPTIONS) is None
+        True
+    """
+    skip_value = False
+    for arg in argv:
+        if skip_value:
+            skip_value = False
+            continue
+        if arg in ("-h", "--help"):
+            return None
+        if arg.startswith("-") and not arg.startswith("--") and len(arg) > 2:
+            # まとめて指定した短いオプション（"-di"など）は先頭から1文字ずつ解釈する。
+            # 値を取るオプションが末尾にあれば次の引数が値、途中にあれば残りの文字が値
+            for pos, char in enumerate(arg[1:], start=1):
+                if char == "h":
+                    return None
+                if f"-{char}" in value_options:
+                    skip_value = pos == len(arg) - 1
+                    break
+            continue
+        if arg.startswith("-"):
+            # "--option=値" の形式は値を含むため、次の引数は読み飛ばさない
+            skip_value = "=" not in arg and (
+                arg in value_options
+                or (
+                    arg.startswith("--")
+                    and any(
+                        opt.startswith(arg)
+                        for opt in value_options
+                        if opt.startswith("--")
+                    )
+                )
+            )
+            continue
+        return arg
+    return None
+
+
+def _untranslated(message: str) -> str:
+    """メッセージを翻訳せずにそのまま返す（argparseのgettextの代わりに使用）"""
+    return message
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: Optional[str]) -> "argparse.ArgumentParser":
+    """
+    コマンドライン引数のパーサーを作成
+
+    同じプロセス内で繰り返し呼び出された場合は、作成済みのパーサーを返す。
+
+    Args:
+        command: 引数を定義するサブコマンド名（Noneの場合はどのサブコマンドの引数も
+            定義しない。未知の名前の場合は推定を誤った可能性があるため全サブコマンドの
+            引数を定義する）
+
+    Returns:
+        引数パーサー
+    """
+    import argparse
+
+    # argparse自身のメッセージ（usage: など）は翻訳しないため、パーサー作成のたびに
+    # gettextで翻訳カタログを検索しないようにする（ヘルプ文字列は日本語で直接記述している）
+    argparse._ = _untranslated
+
+    # メインパーサーの作成
+    parser = argparse.ArgumentParser(
+        description="呼び出しツリー可視化スクリプト - JSONファイルから可視化を行います",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+除外ルールファイルのフォーマット:
+  <クラス名 or メソッド名><TAB><I|E>
+  I: 対象自体を除外
+  E: 対象は表示するが、配下の呼び出しを除外
+
+テーブルリストファイル (table_list.tsv) のフォーマット:
+  <物理テーブル名><TAB><論理テーブル名><TAB><補足情報>
+
+使用例:
+  %(prog)s entries
+  %(prog)s entries --no-strict --min-calls 5
+  %(prog)s forward 'com.example.Main#main(String[])'
+  %(prog)s reverse 'com.example.Service#process()'
+  %(prog)s export 'com.example.Main#main(String[])' tree.html --format html
+  %(prog)s export-excel call_trees.xlsx --entry-points entry_points.txt
+  %(prog)s extract-sql --output-dir ./output/sqls
+  %(prog)s analyze-tables --sql-dir ./output/sqls
+  %(prog)s class-tree --filter 'com.example'
+  %(prog)s interface-impls --interface 'MyService'
+        """,
+    )
+
+    parser.add_argument(
+        "-i",
+        "--input",
+        dest="input_file",
+        default="analyzed_result.json",
+        help="入力ファイル（JSONまたはTSV）のパス (デフォルト: analyzed_result.json)",
+    )
+    parser.add_argument(
+        "--exclusion-file",
+        help="除外ルールファイルのパス (デフォルト: exclusion_rules.txt)",
+    )
+    parser.add_argument(
+        "--output-tsv-encoding",
+        default="Shift_JIS",
+        help="出力するTSVのエンコーディング (デフォルト: Shift_JIS (Excelへの貼付けを考慮))",
+    )
+    parser.add_argument(
+        "-d",
+        "--debug",
+        action="store_true",
+        dest="debug_mode",
+        help="デバッグモード（インスタンス収集情報を出力）",
+    )
+
+    # サブコマンドの作成
+    # （ヘルプに一覧を表示するため全サブコマンドを登録するが、引数を定義するのは
+    # 指定されたサブコマンドだけ。ヘルプ表示時などはどのサブコマンドの引数も定義しない。
+    # 推定したサブコマンド名が未知の場合は、実際のサブコマンドを解析できるよう全て定義する）
+    define_all = command is not None and command not in _SUBCOMMANDS
+    subparsers = parser.add_subparsers(dest="command", help="サブコマンド")
+    for name, (help_text, add_arguments) in _SUBCOMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if define_all or name == command:
+            add_arguments(subparser)
+
+    return parser
+
+
+def main():
+    """メイン関数"""
+    # 引数を解析（指定されたサブコマンドの引数だけを定義したパーサーを使う）
+    command = _find_subcommand(sys.argv[1:], _GLOBAL_VALUE_OPTIONS)
+    parser = _build_parser(command)
     args = parser.parse_args()
 
     # サブコマンドが指定されていない場合
@@ -4251,12 +5363,11 @@ def main():
         parser.print_help()
         sys.exit(1)
 
-    # class-tree と interface-impls サブコマンドは CallTreeVisualizer を使わない
-    if args.command == "class-tree":
-        handle_class_tree(args)
-        return
-    elif args.command == "interface-impls":
-        handle_interface_impls(args)
+    handler = _COMMAND_HANDLERS[args.command]
+
+    # class-tree、interface-impls、analyze-sql サブコマンドは CallTreeVisualizer を使わない
+    if args.command not in _NEEDS_VISUALIZER:
+        handler(args)
         return
 
     # Visualizerの初期化
@@ -4265,27 +5376,14 @@ def main():
     )
 
     # サブコマンドに応じた処理を実行
-    if args.command == "entries":
-        handle_entries(args, visualizer)
-    elif args.command == "search":
-        handle_search(args, visualizer)
-    elif args.command == "forward":
-        handle_forward(args, visualizer)
-    elif args.command == "reverse":
-        handle_reverse(args, visualizer)
-    elif args.command == "export":
-        handle_export(args, visualizer)
-    elif args.command == "export-excel":
-        handle_export_excel(args, visualizer)
-    elif args.command == "export-csv":
-        handle_export_csv(args, visualizer)
-    elif args.command == "extract-sql":
-        handle_extract_sql(args, visualizer)
-    elif args.command == "analyze-tables":
-        handle_analyze_tables(args, visualizer)
-    elif args.command == "analyze-sql":
-        handle_analyze_sql(args)
+    handler(args, visualizer)
 
 
 if __name__ == "__main__":
+    # PyInstaller等で1つの実行ファイルにした場合、--jobsのワーカープロセスが
+    # main()を再実行しないようにする（通常のスクリプト実行では不要なためインポートしない）
+    if getattr(sys, "frozen", False):
+        import multiprocessing
+
+        multiprocessing.freeze_support()
     main()